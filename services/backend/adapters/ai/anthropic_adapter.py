@@ -3,12 +3,29 @@ Anthropic Claude AI Adapter
 
 Production implementation using the Anthropic API.
 Reusable across all projects that need AI text generation.
+
+One pooled, long-lived client per adapter (sync and async): connections
+are kept alive and shared by concurrent calls, so a completion does not
+pay TCP + TLS setup. HTTP/2 is used when the optional `h2` package is
+installed. Close the clients on shutdown (aclose(), FastAPI lifespan).
 """
+import asyncio
 import os
+import threading
+import time
 from typing import List, Optional
 
 import httpx
 
+try:
+    import h2
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None
+
+from infrastructure.deadline import DeadlineExceededError, check_deadline, remaining, timeout_within_deadline
+from infrastructure.metrics import observe_ai_request
+from infrastructure.query_stats import current_query_stats
+from infrastructure.tracing import CLIENT, current_span, inject_traceparent, traced
 from .base import AIAdapter, Message, AIResponse
 
 
@@ -16,23 +33,53 @@ class AnthropicAdapter(AIAdapter):
     """
     Anthropic Claude API implementation.
 
-    Uses httpx for async-capable HTTP calls.
+    Uses pooled httpx clients (keep-alive, HTTP/2 if available).
     Default model: claude-sonnet-4-20250514
+    Calls respect the request deadline (infrastructure.deadline).
+    Latency and token usage go to /metrics (ai_* metrics) and to an
+    "ai.complete" span when the request is traced.
     """
 
     API_URL = "https://api.anthropic.com/v1/messages"
     API_VERSION = "2023-06-01"
     DEFAULT_MODEL = "claude-sonnet-4-20250514"
+    TIMEOUT_SECONDS = 60.0
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         model: Optional[str] = None,
         max_tokens: int = 1024,
+        timeout: float = TIMEOUT_SECONDS,
+        connect_timeout: float = 5.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
     ):
+        """
+        Args:
+            api_key: Anthropic API key (default: ANTHROPIC_API_KEY)
+            model: Default model
+            max_tokens: Default max_tokens
+            timeout: Seconds per call (capped by the request deadline)
+            connect_timeout: Seconds to establish a connection
+            max_connections: Open connections per client
+            max_keepalive_connections: Idle connections kept in the pool
+            keepalive_expiry: Seconds an idle connection is kept
+            http2: Use HTTP/2 if the `h2` package is installed
+        """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY", "")
         self.model = model or self.DEFAULT_MODEL
         self.max_tokens = max_tokens
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and h2 is not None
 
         if not self.api_key:
             raise ValueError(
@@ -40,12 +87,60 @@ class AnthropicAdapter(AIAdapter):
                 "or pass api_key parameter."
             )
 
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        """Pooled sync client (created on first use, shared by all threads)."""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(http2=self.http2, limits=self.limits, timeout=self.timeout)
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        Pooled async client of the running event loop.
+
+        Connections belong to the loop they were opened on: another loop
+        (e.g. a second asyncio.run) gets a new client.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = httpx.AsyncClient(http2=self.http2, limits=self.limits, timeout=self.timeout)
+            self._async_loop = loop
+        return self._async_client
+
+    async def start(self) -> None:
+        """Create the async client on the serving loop (lifespan startup)."""
+        # Property access creates the client bound to this loop
+        self.async_client
+
+    def close(self) -> None:
+        """Close the sync client's connections."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close both clients (lifespan shutdown)."""
+        self.close()
+        client, self._async_client = self._async_client, None
+        if client is not None and self._async_loop is asyncio.get_running_loop():
+            await client.aclose()
+        self._async_loop = None
+
     def _build_headers(self) -> dict:
-        return {
+        return inject_traceparent({
             "x-api-key": self.api_key,
             "anthropic-version": self.API_VERSION,
             "content-type": "application/json",
-        }
+        })
 
     def _build_payload(
         self, messages: List[Message], **kwargs
@@ -71,54 +166,103 @@ class AnthropicAdapter(AIAdapter):
 
         return payload
 
+    def _check_deadline(self) -> httpx.Timeout:
+        """Fail fast past the request deadline; return the HTTP timeout to use."""
+        check_deadline("ai")
+        timeout = timeout_within_deadline(self.timeout)
+        return httpx.Timeout(timeout, connect=min(self.connect_timeout, timeout))
+
+    @staticmethod
+    def _raise_if_deadline_passed(exc: httpx.TimeoutException) -> None:
+        left = remaining()
+        if left is not None and left <= 0:
+            raise DeadlineExceededError(context={"operation": "ai"}) from exc
+
+    @traced("ai.complete", CLIENT)
     def complete(self, messages: List[Message], **kwargs) -> AIResponse:
         payload = self._build_payload(messages, **kwargs)
+        timeout = self._check_deadline()
 
-        with httpx.Client(timeout=60.0) as client:
-            response = client.post(
+        start = time.perf_counter()
+        try:
+            response = self.client.post(
                 self.API_URL,
                 headers=self._build_headers(),
                 json=payload,
+                timeout=timeout,
             )
             response.raise_for_status()
+        except httpx.TimeoutException as exc:
+            self._observe(payload, start, "timeout")
+            self._raise_if_deadline_passed(exc)
+            raise
+        except httpx.HTTPError:
+            self._observe(payload, start, "error")
+            raise
 
-        data = response.json()
-        content = data["content"][0]["text"]
-        usage = data.get("usage", {})
-
-        return AIResponse(
-            content=content,
-            model=data.get("model", self.model),
-            usage={
-                "prompt_tokens": usage.get("input_tokens", 0),
-                "completion_tokens": usage.get("output_tokens", 0),
-            },
-        )
+        return self._to_response(response.json(), payload, start)
 
+    @traced("ai.complete", CLIENT)
     async def complete_async(self, messages: List[Message], **kwargs) -> AIResponse:
         """Async version of complete for use in FastAPI endpoints."""
         payload = self._build_payload(messages, **kwargs)
+        timeout = self._check_deadline()
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
+        start = time.perf_counter()
+        try:
+            response = await self.async_client.post(
                 self.API_URL,
                 headers=self._build_headers(),
                 json=payload,
+                timeout=timeout,
             )
             response.raise_for_status()
+        except httpx.TimeoutException as exc:
+            self._observe(payload, start, "timeout")
+            self._raise_if_deadline_passed(exc)
+            raise
+        except httpx.HTTPError:
+            self._observe(payload, start, "error")
+            raise
 
-        data = response.json()
-        content = data["content"][0]["text"]
-        usage = data.get("usage", {})
+        return self._to_response(response.json(), payload, start)
 
-        return AIResponse(
-            content=content,
+    def _to_response(self, data: dict, payload: dict, start: float) -> AIResponse:
+        usage = data.get("usage", {})
+        response = AIResponse(
+            content=data["content"][0]["text"],
             model=data.get("model", self.model),
             usage={
                 "prompt_tokens": usage.get("input_tokens", 0),
                 "completion_tokens": usage.get("output_tokens", 0),
             },
         )
+        self._observe(payload, start, "ok", **response.usage)
+        return response
+
+    @staticmethod
+    def _observe(payload: dict, start: float, outcome: str, prompt_tokens: int = 0, completion_tokens: int = 0) -> None:
+        duration = time.perf_counter() - start
+        stats = current_query_stats()
+        if stats is not None:
+            stats.record_ai_call(duration)
+        span = current_span()
+        if span is not None and span.recording:
+            span.attributes.update({
+                "gen_ai.system": "anthropic",
+                "gen_ai.request.model": payload["model"],
+                "gen_ai.usage.input_tokens": prompt_tokens,
+                "gen_ai.usage.output_tokens": completion_tokens,
+                "ai.outcome": outcome,
+            })
+        observe_ai_request(
+            "anthropic",
+            payload["model"],
+            duration,
+            outcome,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+        )
 
     def embed(self, text: str) -> List[float]:
         raise NotImplementedError(
@@ -44,6 +44,12 @@ class AIAdapter(ABC):
         """
         pass
 
+    async def start(self) -> None:
+        """Open connection pools (application startup). Default: nothing to open."""
+
+    async def aclose(self) -> None:
+        """Release pooled connections (application shutdown). Default: nothing to release."""
+
     @abstractmethod
     def embed(self, text: str) -> List[float]:
         """
@@ -4,7 +4,8 @@ Database Adapter Interface
 Basis-Interface für alle Database-Provider.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List, Any, TypeVar, Generic
+from datetime import datetime
+from typing import Optional, List, Any, Dict, Tuple, TypeVar, Generic
 
 T = TypeVar("T")
 
@@ -42,6 +43,49 @@ class DatabaseAdapter(ABC, Generic[T]):
         """
         pass
 
+    @abstractmethod
+    def find_many_by_ids(
+        self,
+        entity_ids: List[str],
+        owner_id: Optional[str] = None,
+        include_deleted: bool = False
+    ) -> List[T]:
+        """
+        Find several entities by ID in one query.
+
+        Args:
+            entity_ids: Entity identifiers
+            owner_id: Only return entities owned by this user
+            include_deleted: Include soft-deleted entities
+
+        Returns:
+            Found entities (unordered, missing IDs are skipped)
+        """
+        pass
+
+    @abstractmethod
+    def find_changed_since(
+        self,
+        owner_id: str,
+        since: Optional[Tuple[datetime, str]] = None,
+        limit: int = 100
+    ) -> List[T]:
+        """
+        Find entities of one owner changed after a sync position.
+
+        Ordered by (coalesce(updated_at, created_at), id) ascending.
+        Includes soft-deleted entities (tombstones).
+
+        Args:
+            owner_id: Owner whose entities to scan
+            since: Exclusive (changed_at, id) position, None for all
+            limit: Max results
+
+        Returns:
+            Changed entities, oldest change first
+        """
+        pass
+
     @abstractmethod
     def find_all(self, limit: int = 100, offset: int = 0) -> List[T]:
         """
@@ -69,6 +113,29 @@ class DatabaseAdapter(ABC, Generic[T]):
         """
         pass
 
+    @abstractmethod
+    def merge_patch(
+        self,
+        entity_id: str,
+        changes: Dict[str, Any],
+        owner_id: Optional[str] = None
+    ) -> Optional[T]:
+        """
+        Apply a partial update (RFC 7386 merge patch) to an entity.
+
+        Only the fields present in `changes` are written. Soft-deleted
+        entities and entities of other owners are not touched.
+
+        Args:
+            entity_id: Entity identifier
+            changes: Patch document
+            owner_id: Only patch if owned by this user
+
+        Returns:
+            Patched entity, or None if not found
+        """
+        pass
+
     @abstractmethod
     def delete(self, entity_id: str) -> bool:
         """
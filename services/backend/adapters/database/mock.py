@@ -3,10 +3,12 @@ Mock Database Adapter
 
 Für Tests und Entwicklung. In-Memory Storage.
 """
-from typing import Optional, List, Any
+from datetime import datetime
+from typing import Optional, List, Any, Dict, Tuple
 import uuid
 
 from .base import DatabaseAdapter
+from modules.item_manager.patch import apply_item_patch
 
 
 class MockDatabaseAdapter(DatabaseAdapter):
@@ -31,6 +33,44 @@ class MockDatabaseAdapter(DatabaseAdapter):
         """Find in storage"""
         return self._storage.get(entity_id)
 
+    def find_many_by_ids(
+        self,
+        entity_ids: List[str],
+        owner_id: Optional[str] = None,
+        include_deleted: bool = False
+    ) -> List[Any]:
+        """Find several in storage"""
+        results = []
+        for entity_id in set(entity_ids):
+            entity = self._storage.get(entity_id)
+            if entity is None:
+                continue
+            if owner_id is not None and entity.owner_id != owner_id:
+                continue
+            if not include_deleted and entity.deleted_at is not None:
+                continue
+            results.append(entity)
+        return results
+
+    def find_changed_since(
+        self,
+        owner_id: str,
+        since: Optional[Tuple[datetime, str]] = None,
+        limit: int = 100
+    ) -> List[Any]:
+        """Scan storage in sync order"""
+        changed = sorted(
+            (
+                (entity.changed_at(), entity.id, entity)
+                for entity in self._storage.values()
+                if entity.owner_id == owner_id
+            ),
+            key=lambda row: row[:2]
+        )
+        if since is not None:
+            changed = [row for row in changed if row[:2] > since]
+        return [entity for _, _, entity in changed[:limit]]
+
     def find_all(self, limit: int = 100, offset: int = 0) -> List[Any]:
         """Get all from storage"""
         items = list(self._storage.values())
@@ -42,6 +82,20 @@ class MockDatabaseAdapter(DatabaseAdapter):
             self._storage[entity.id] = entity
         return entity
 
+    def merge_patch(
+        self,
+        entity_id: str,
+        changes: Dict[str, Any],
+        owner_id: Optional[str] = None
+    ) -> Optional[Any]:
+        """Apply merge patch in storage"""
+        entity = self._storage.get(entity_id)
+        if entity is None or entity.deleted_at is not None:
+            return None
+        if owner_id is not None and entity.owner_id != owner_id:
+            return None
+        return apply_item_patch(entity, changes)
+
     def delete(self, entity_id: str) -> bool:
         """Delete from storage"""
         if entity_id in self._storage:
@@ -4,7 +4,7 @@ SQLAlchemy Database Models
 ORM Models für PostgreSQL/SQLite.
 Getrennt von Domain Models (modules/*/models.py).
 """
-from sqlalchemy import Column, String, DateTime, JSON, Text
+from sqlalchemy import Column, String, DateTime, Integer, JSON, LargeBinary, Text, Index, func
 from sqlalchemy.dialects.postgresql import ARRAY
 from datetime import datetime
 
@@ -40,3 +40,37 @@ class ItemModel(Base):
 
     def __repr__(self):
         return f"<ItemModel(id={self.id}, label={self.label}, owner={self.owner_id})>"
+
+
+# Sync position: last change (soft delete bumps updated_at)
+item_changed_at = func.coalesce(ItemModel.updated_at, ItemModel.created_at)
+
+# Delta sync (GET /items/changes): keyset scan per owner
+Index("ix_items_owner_changed_at", ItemModel.owner_id, item_changed_at, ItemModel.id)
+
+
+class IdempotencyKeyModel(Base):
+    """
+    SQLAlchemy Model für Idempotency-Key Records.
+
+    Used by adapters.idempotency.sql.SQLIdempotencyStore. One short row per
+    (user, key); status_code NULL while the first request is in progress.
+    """
+    __tablename__ = "idempotency_keys"
+
+    # sha256 of "<user_id>:<Idempotency-Key>"
+    key = Column(String(64), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
+    # Token of the request holding the key (complete/release match it)
+    claim = Column(String(32), nullable=True)
+
+    # Stored response (NULL while in progress)
+    status_code = Column(Integer, nullable=True)
+    headers = Column(JSON, nullable=True)
+    body = Column(LargeBinary, nullable=True)
+
+    # Claim timeout while in progress, TTL once completed
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<IdempotencyKeyModel(key={self.key}, status={self.status_code})>"
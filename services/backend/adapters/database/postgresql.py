@@ -3,14 +3,17 @@ PostgreSQL Database Adapter
 
 Implementiert DatabaseAdapter Interface mit SQLAlchemy.
 """
-from typing import Optional, List
+from typing import Optional, List, Any, Dict, Tuple
+from sqlalchemy import JSON, cast, func, literal, tuple_, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
 from datetime import datetime
 import uuid
 
 from .base import DatabaseAdapter
-from .models import ItemModel
+from .models import ItemModel, item_changed_at
 from modules.item_manager.models import Item
+from modules.item_manager.patch import apply_item_patch
 
 
 class PostgreSQLAdapter(DatabaseAdapter[Item]):
@@ -80,6 +83,66 @@ class PostgreSQLAdapter(DatabaseAdapter[Item]):
 
         return self._to_domain(db_item)
 
+    def find_many_by_ids(
+        self,
+        entity_ids: List[str],
+        owner_id: Optional[str] = None,
+        include_deleted: bool = False
+    ) -> List[Item]:
+        """
+        Find several Items by ID in one query.
+
+        WHERE id IN (...) [AND owner_id = :owner_id] [AND deleted_at IS NULL]
+
+        Args:
+            entity_ids: Item UUIDs
+            owner_id: Only return items owned by this user
+            include_deleted: Include soft-deleted items
+
+        Returns:
+            Found Items (unordered)
+        """
+        if not entity_ids:
+            return []
+
+        query = self.session.query(ItemModel).filter(
+            ItemModel.id.in_(set(entity_ids))
+        )
+        if owner_id is not None:
+            query = query.filter(ItemModel.owner_id == owner_id)
+        if not include_deleted:
+            query = query.filter(ItemModel.deleted_at.is_(None))
+
+        return [self._to_domain(item) for item in query.all()]
+
+    def find_changed_since(
+        self,
+        owner_id: str,
+        since: Optional[Tuple[datetime, str]] = None,
+        limit: int = 100
+    ) -> List[Item]:
+        """
+        Find an owner's Items changed after a sync position.
+
+        Keyset scan on ix_items_owner_changed_at
+        (owner_id, coalesce(updated_at, created_at), id); with no changes
+        this is a single index probe.
+
+        Args:
+            owner_id: Owner whose Items to scan
+            since: Exclusive (changed_at, id) position, None for all
+            limit: Max results
+
+        Returns:
+            Changed Items incl. soft-deleted, oldest change first
+        """
+        query = self.session.query(ItemModel).filter(ItemModel.owner_id == owner_id)
+        if since is not None:
+            query = query.filter(tuple_(item_changed_at, ItemModel.id) > tuple_(*since))
+
+        db_items = query.order_by(item_changed_at, ItemModel.id).limit(limit).all()
+        return [self._to_domain(item) for item in db_items]
+
     def find_all(self, limit: int = 100, offset: int = 0) -> List[Item]:
         """
         Find all Items with pagination.
@@ -124,6 +187,104 @@ class PostgreSQLAdapter(DatabaseAdapter[Item]):
 
         return entity
 
+    def merge_patch(
+        self,
+        entity_id: str,
+        changes: Dict[str, Any],
+        owner_id: Optional[str] = None
+    ) -> Optional[Item]:
+        """
+        Apply a partial update to an Item.
+
+        On PostgreSQL this is a single UPDATE ... RETURNING: payload and tags
+        are patched in-database as jsonb (jsonb_merge_patch /
+        jsonb_array_patch from migration 002), so only the patch document
+        is sent. Other dialects (SQLite) load, patch in Python and flush.
+
+        Args:
+            entity_id: Item UUID
+            changes: Patch document (see modules.item_manager.patch)
+            owner_id: Only patch if owned by this user
+
+        Returns:
+            Patched Item, or None if not found
+        """
+        if self.session.get_bind().dialect.name != "postgresql":
+            return self._merge_patch_in_python(entity_id, changes, owner_id)
+
+        values: Dict[str, Any] = {"updated_at": datetime.utcnow()}
+        if "label" in changes:
+            values["label"] = changes["label"]
+        if "content_type" in changes:
+            values["content_type"] = changes["content_type"]
+        if "payload" in changes:
+            if changes["payload"] is None:
+                values["payload"] = {}
+            else:
+                values["payload"] = cast(
+                    func.jsonb_merge_patch(
+                        cast(ItemModel.payload, JSONB),
+                        literal(changes["payload"], JSONB)
+                    ),
+                    JSON
+                )
+
+        tags_add = changes.get("tags_add") or []
+        tags_remove = changes.get("tags_remove") or []
+        if "tags" in changes or tags_add or tags_remove:
+            if "tags" in changes:
+                tags = literal(changes["tags"] or [], JSONB)
+            else:
+                tags = cast(ItemModel.tags, JSONB)
+            if tags_add or tags_remove:
+                tags = func.jsonb_array_patch(tags, literal(tags_add, JSONB), literal(tags_remove, JSONB))
+            values["tags"] = cast(tags, JSON)
+
+        stmt = (
+            update(ItemModel)
+            .where(ItemModel.id == entity_id, ItemModel.deleted_at.is_(None))
+            .values(**values)
+            .returning(ItemModel)
+            .execution_options(synchronize_session=False)
+        )
+        if owner_id is not None:
+            stmt = stmt.where(ItemModel.owner_id == owner_id)
+
+        db_item = self.session.scalars(stmt).first()
+        if not db_item:
+            return None
+
+        return self._to_domain(db_item)
+
+    def _merge_patch_in_python(
+        self,
+        entity_id: str,
+        changes: Dict[str, Any],
+        owner_id: Optional[str]
+    ) -> Optional[Item]:
+        """Fallback for dialects without jsonb: load, patch, flush."""
+        query = self.session.query(ItemModel).filter(
+            ItemModel.id == entity_id,
+            ItemModel.deleted_at.is_(None)
+        )
+        if owner_id is not None:
+            query = query.filter(ItemModel.owner_id == owner_id)
+
+        db_item = query.first()
+        if not db_item:
+            return None
+
+        item = apply_item_patch(self._to_domain(db_item), changes)
+        db_item.label = item.label
+        db_item.content_type = item.content_type
+        db_item.payload = item.payload
+        db_item.tags = item.tags
+        db_item.updated_at = item.updated_at
+
+        self.session.flush()
+
+        return item
+
     def delete(self, entity_id: str) -> bool:
         """
         Hard delete Item from database.
@@ -0,0 +1,11 @@
+# Event Adapters
+from .base import EventPublisher, EventBroker, Subscription
+from .memory import InProcessEventBroker, SessionEventPublisher
+
+__all__ = [
+    "EventPublisher",
+    "EventBroker",
+    "Subscription",
+    "InProcessEventBroker",
+    "SessionEventPublisher",
+]
@@ -0,0 +1,81 @@
+"""
+Event Adapter Interface
+
+Publish/subscribe for change events (SSE change feed).
+"""
+import asyncio
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+
+class EventPublisher(ABC):
+    """
+    Abstract base class for event publishers.
+
+    Implementierungen: InProcessEventBroker, SessionEventPublisher,
+    PostgresNotifyPublisher
+    """
+
+    @abstractmethod
+    def publish(self, event: Any) -> None:
+        """
+        Publish an event.
+
+        Args:
+            event: Event with `id` and `owner_id` attributes
+        """
+        pass
+
+
+@dataclass(eq=False)
+class Subscription:
+    """
+    Live subscription to one owner's events.
+
+    Attributes:
+        owner_id: Subscribed owner
+        queue: Live events (filled from any thread)
+        replay: Buffered events published after the client's Last-Event-ID
+        reset: Client missed events that are no longer buffered and must
+            resync (e.g. full list fetch)
+        overflowed: Client fell too far behind; the stream should end
+    """
+    owner_id: str
+    queue: asyncio.Queue
+    loop: asyncio.AbstractEventLoop
+    replay: List[Any] = field(default_factory=list)
+    reset: bool = False
+    overflowed: bool = False
+
+
+class EventBroker(EventPublisher):
+    """
+    Abstract base class for event brokers (publish + subscribe).
+    """
+
+    @abstractmethod
+    def subscribe(self, owner_id: str, last_event_id: Optional[int] = None) -> Subscription:
+        """
+        Subscribe to an owner's events.
+
+        Must be called from the event loop that will consume the queue.
+
+        Args:
+            owner_id: Owner to receive events for
+            last_event_id: Resume after this event (Last-Event-ID)
+
+        Returns:
+            Subscription
+        """
+        pass
+
+    @abstractmethod
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Remove a subscription.
+
+        Args:
+            subscription: Subscription returned by subscribe()
+        """
+        pass
@@ -0,0 +1,161 @@
+"""
+In-Process Event Broker
+
+Fan-out to subscribers in this process. Used directly in tests / SQLite
+setups, and as the local fan-out stage behind the Postgres LISTEN thread.
+"""
+import asyncio
+import threading
+from collections import OrderedDict, deque
+from typing import Any, Deque, List, Optional, Set
+
+from sqlalchemy import event as sa_event
+from sqlalchemy.orm import Session
+
+from .base import EventBroker, EventPublisher, Subscription
+
+
+class _OwnerChannel:
+    """Buffered events and live subscribers of one owner."""
+
+    def __init__(self, buffer_size: int):
+        self.buffer: Deque[Any] = deque(maxlen=buffer_size)
+        self.subscribers: Set[Subscription] = set()
+
+
+class InProcessEventBroker(EventBroker):
+    """
+    Thread-safe in-memory broker.
+
+    Keeps the last `buffer_size` events per owner for Last-Event-ID resume.
+    The buffer is in publish (commit) order, which is not ID order: IDs are
+    assigned before commit, so resume replays by position in the buffer.
+    publish() may be called from any thread; events are handed to each
+    subscriber's event loop via call_soon_threadsafe.
+    """
+
+    def __init__(self, buffer_size: int = 1000, max_owners: int = 10000, queue_size: int = 1000):
+        self.buffer_size = buffer_size
+        self.max_owners = max_owners
+        self.queue_size = queue_size
+        self._channels: "OrderedDict[str, _OwnerChannel]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def publish(self, event: Any) -> None:
+        """Buffer event and deliver to the owner's subscribers."""
+        with self._lock:
+            channel = self._channel(event.owner_id)
+            channel.buffer.append(event)
+            subscribers = list(channel.subscribers)
+
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(self._deliver, subscription, event)
+            except RuntimeError:
+                # Subscriber's loop is closed
+                self.unsubscribe(subscription)
+
+    def subscribe(self, owner_id: str, last_event_id: Optional[int] = None) -> Subscription:
+        """
+        Register a subscriber; replay buffered events published after
+        last_event_id. Unknown ID (evicted, other worker, restart): reset.
+        """
+        subscription = Subscription(
+            owner_id=owner_id,
+            queue=asyncio.Queue(maxsize=self.queue_size),
+            loop=asyncio.get_running_loop(),
+        )
+
+        with self._lock:
+            channel = self._channel(owner_id)
+            if last_event_id is not None:
+                position = _position(channel.buffer, last_event_id)
+                if position is None:
+                    subscription.reset = True
+                else:
+                    subscription.replay = list(channel.buffer)[position + 1:]
+            channel.subscribers.add(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove subscriber (buffer is kept)."""
+        with self._lock:
+            channel = self._channels.get(subscription.owner_id)
+            if channel is not None:
+                channel.subscribers.discard(subscription)
+
+    def subscriber_count(self, owner_id: Optional[str] = None) -> int:
+        """Number of live subscribers (for one owner or total)."""
+        with self._lock:
+            if owner_id is not None:
+                channel = self._channels.get(owner_id)
+                return len(channel.subscribers) if channel else 0
+            return sum(len(c.subscribers) for c in self._channels.values())
+
+    def _channel(self, owner_id: str) -> _OwnerChannel:
+        """Get or create channel (caller holds the lock)."""
+        channel = self._channels.get(owner_id)
+        if channel is None:
+            channel = _OwnerChannel(self.buffer_size)
+            self._channels[owner_id] = channel
+            self._evict_idle_owners()
+        else:
+            self._channels.move_to_end(owner_id)
+        return channel
+
+    def _evict_idle_owners(self) -> None:
+        """Drop least recently used owners without subscribers."""
+        if len(self._channels) <= self.max_owners:
+            return
+        for owner_id in list(self._channels):
+            if len(self._channels) <= self.max_owners:
+                break
+            if not self._channels[owner_id].subscribers:
+                del self._channels[owner_id]
+
+    @staticmethod
+    def _deliver(subscription: Subscription, event: Any) -> None:
+        """Runs on the subscriber's loop."""
+        try:
+            subscription.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            subscription.overflowed = True
+
+
+def _position(buffer: Deque[Any], event_id: int) -> Optional[int]:
+    """Index of the event with this ID (searched from the newest end)."""
+    for offset, event in enumerate(reversed(buffer)):
+        if event.id == event_id:
+            return len(buffer) - 1 - offset
+    return None
+
+
+class SessionEventPublisher(EventPublisher):
+    """
+    Publishes to a broker only after the SQLAlchemy session commits.
+
+    Same delivery semantics as Postgres NOTIFY (sent on commit, dropped on
+    rollback) for databases without LISTEN/NOTIFY.
+    """
+
+    _PENDING_KEY = "pending_events"
+
+    def __init__(self, session: Session, broker: EventPublisher):
+        self.session = session
+        self.broker = broker
+
+        sa_event.listen(session, "after_commit", self._after_commit)
+        sa_event.listen(session, "after_rollback", self._after_rollback)
+
+    def publish(self, event: Any) -> None:
+        """Queue event until commit."""
+        self.session.info.setdefault(self._PENDING_KEY, []).append(event)
+
+    def _after_commit(self, session: Session) -> None:
+        pending: List[Any] = session.info.pop(self._PENDING_KEY, [])
+        for event in pending:
+            self.broker.publish(event)
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(self._PENDING_KEY, None)
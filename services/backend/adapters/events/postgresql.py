@@ -0,0 +1,129 @@
+"""
+PostgreSQL Event Adapter
+
+Cross-worker fan-out via LISTEN/NOTIFY:
+- PostgresNotifyPublisher sends pg_notify() inside the write transaction
+  (delivered on commit, dropped on rollback)
+- PostgresEventListener LISTENs in a background thread and feeds every
+  notification into the worker's InProcessEventBroker
+"""
+import json
+import select
+import threading
+from typing import Any, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from infrastructure.logging import get_logger
+from modules.item_manager.events import ItemEvent
+from .base import EventBroker, EventPublisher
+
+logger = get_logger("adapters.events.postgresql")
+
+ITEM_EVENTS_CHANNEL = "item_events"
+
+
+class PostgresNotifyPublisher(EventPublisher):
+    """
+    Publishes events with pg_notify() on the request's session.
+    """
+
+    def __init__(self, session: Session, channel: str = ITEM_EVENTS_CHANNEL):
+        self.session = session
+        self.channel = channel
+
+    def publish(self, event: Any) -> None:
+        """NOTIFY as part of the current transaction."""
+        self.session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": self.channel, "payload": json.dumps(event.to_dict())}
+        )
+
+
+class PostgresEventListener:
+    """
+    Background LISTEN thread (one per worker process).
+
+    Reconnects with backoff if the connection drops. Events published
+    while disconnected are lost; subscribers resuming across the gap get
+    a reset (see InProcessEventBroker.subscribe).
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        broker: EventBroker,
+        channel: str = ITEM_EVENTS_CHANNEL,
+        poll_interval: float = 1.0,
+    ):
+        """
+        Args:
+            dsn: libpq connection string / URI (no SQLAlchemy driver suffix)
+            broker: Local broker to feed
+            channel: NOTIFY channel
+            poll_interval: Max seconds between stop checks
+        """
+        self.dsn = dsn
+        self.broker = broker
+        self.channel = channel
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start listener thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="pg-event-listener", daemon=True)
+        self._thread.start()
+        logger.info("event_listener_started", channel=self.channel)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop listener thread."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout)
+        self._thread = None
+        logger.info("event_listener_stopped", channel=self.channel)
+
+    def _run(self) -> None:
+        backoff = 1.0
+        while not self._stop.is_set():
+            try:
+                self._listen()
+                backoff = 1.0
+            except Exception as exc:
+                logger.error("event_listener_error", error=str(exc), retry_in=backoff)
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    def _listen(self) -> None:
+        import psycopg2
+        import psycopg2.extensions
+
+        conn = psycopg2.connect(self.dsn)
+        try:
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cursor:
+                cursor.execute(f'LISTEN "{self.channel}"')
+
+            while not self._stop.is_set():
+                if select.select([conn], [], [], self.poll_interval) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    notify = conn.notifies.pop(0)
+                    self._dispatch(notify.payload)
+        finally:
+            conn.close()
+
+    def _dispatch(self, payload: str) -> None:
+        try:
+            event = ItemEvent.from_dict(json.loads(payload))
+        except (ValueError, KeyError, TypeError):
+            logger.warning("event_listener_bad_payload", payload=payload[:200])
+            return
+        self.broker.publish(event)
@@ -0,0 +1,10 @@
+# Idempotency Adapters
+from .base import IdempotencyStore, IdempotencyRecord, StoredResponse
+from .memory import MemoryIdempotencyStore
+
+__all__ = [
+    "IdempotencyStore",
+    "IdempotencyRecord",
+    "StoredResponse",
+    "MemoryIdempotencyStore",
+]
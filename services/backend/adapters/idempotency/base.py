@@ -0,0 +1,100 @@
+"""
+Idempotency Store Interface
+
+Remembers the first response per (user, Idempotency-Key) so retried
+writes are answered from the store instead of executing again.
+
+Lifecycle of a key:
+    begin()    -> claimed (in progress) or the existing record
+    complete() -> response stored until the TTL expires
+    release()  -> forgotten (request failed, a retry may execute)
+
+An in-progress claim older than `lock_timeout` is treated as abandoned
+(worker crashed mid-request) and may be claimed again. Each claim carries
+a caller-chosen token: complete() and release() only act while that
+claim still holds the key, so a slow request whose claim was taken over
+cannot overwrite or drop the new owner's claim.
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    """Response replayed for retries."""
+    status_code: int
+    headers: List[Tuple[str, str]] = field(default_factory=list)
+    body: bytes = b""
+
+
+@dataclass(frozen=True)
+class IdempotencyRecord:
+    """
+    State of one key.
+
+    Attributes:
+        fingerprint: Hash of method, path and body of the first request
+        response: Stored response, None while the first request runs
+    """
+    fingerprint: str
+    response: Optional[StoredResponse] = None
+
+    @property
+    def in_progress(self) -> bool:
+        return self.response is None
+
+
+class IdempotencyStore(ABC):
+    """
+    Abstract base class for idempotency stores.
+
+    Implementierungen: MemoryIdempotencyStore, SQLIdempotencyStore
+    """
+
+    # True if calls do database/network I/O (run them off the event loop)
+    blocking: bool = False
+
+    def __init__(self, ttl: float = 86400.0, lock_timeout: float = 60.0):
+        """
+        Args:
+            ttl: Seconds a completed response is kept
+            lock_timeout: Seconds after which an in-progress claim is abandoned
+        """
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+
+    @abstractmethod
+    def begin(self, key: str, fingerprint: str, claim: str) -> Optional[IdempotencyRecord]:
+        """
+        Atomically claim a key.
+
+        Args:
+            key: Scoped key ("<user_id>:<Idempotency-Key>")
+            fingerprint: Request fingerprint
+            claim: Token unique to this request (max 32 characters)
+
+        Returns:
+            None if the caller now owns the key, else the existing record
+        """
+        pass
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[IdempotencyRecord]:
+        """Current record (None if unknown, released or expired)."""
+        pass
+
+    @abstractmethod
+    def complete(self, key: str, claim: str, response: StoredResponse) -> None:
+        """Store the response, if `claim` still holds the key."""
+        pass
+
+    @abstractmethod
+    def release(self, key: str, claim: str) -> None:
+        """Drop the claim without storing a response (no-op if taken over)."""
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Forget all keys (tests, admin)."""
+        pass
@@ -0,0 +1,81 @@
+"""
+In-Memory Idempotency Store
+
+Per-process records. Correct for a single worker (tests, development);
+with several workers a retry landing on another worker executes again.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from .base import IdempotencyRecord, IdempotencyStore, StoredResponse
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """
+    Thread-safe dict of key -> (record, expires_at, claim).
+
+    Bounded to `max_keys`; the oldest keys are dropped first.
+    """
+
+    def __init__(self, ttl: float = 86400.0, lock_timeout: float = 60.0, max_keys: int = 100_000):
+        super().__init__(ttl, lock_timeout)
+        self.max_keys = max_keys
+        self._records: "OrderedDict[str, Tuple[IdempotencyRecord, float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _current(self, key: str, now: float) -> Optional[IdempotencyRecord]:
+        entry = self._records.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= now:
+            del self._records[key]
+            return None
+        return entry[0]
+
+    def _held_by(self, key: str, claim: str) -> Optional[IdempotencyRecord]:
+        entry = self._records.get(key)
+        if entry is None or entry[2] != claim:
+            return None
+        return entry[0]
+
+    def begin(self, key: str, fingerprint: str, claim: str) -> Optional[IdempotencyRecord]:
+        """Claim a key or return the existing record."""
+        with self._lock:
+            now = time.monotonic()
+            record = self._current(key, now)
+            if record is not None:
+                return record
+            self._records[key] = (IdempotencyRecord(fingerprint), now + self.lock_timeout, claim)
+            self._records.move_to_end(key)
+            if len(self._records) > self.max_keys:
+                self._records.popitem(last=False)
+            return None
+
+    def get(self, key: str) -> Optional[IdempotencyRecord]:
+        """Current record of a key."""
+        with self._lock:
+            return self._current(key, time.monotonic())
+
+    def complete(self, key: str, claim: str, response: StoredResponse) -> None:
+        """Store the response until the TTL expires."""
+        with self._lock:
+            record = self._held_by(key, claim)
+            if record is not None:
+                self._records[key] = (
+                    IdempotencyRecord(record.fingerprint, response),
+                    time.monotonic() + self.ttl,
+                    claim
+                )
+
+    def release(self, key: str, claim: str) -> None:
+        """Drop the claim."""
+        with self._lock:
+            if self._held_by(key, claim) is not None:
+                del self._records[key]
+
+    def reset(self) -> None:
+        """Forget all keys."""
+        with self._lock:
+            self._records.clear()
@@ -0,0 +1,161 @@
+"""
+SQL Idempotency Store
+
+Records in the idempotency_keys table (migration 004), shared by all
+workers and hosts. Each call runs in its own short transaction, so a
+claim is visible to other workers before the request executes.
+
+Claims are atomic: INSERT the key, or, if a row exists but has expired,
+take it over with a conditional UPDATE. complete()/release() match the
+claim token too, so they never touch a row another request took over. Expired rows are purged every
+`purge_every` claims.
+"""
+import hashlib
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from adapters.database.models import IdempotencyKeyModel
+from infrastructure.logging import get_logger
+
+from .base import IdempotencyRecord, IdempotencyStore, StoredResponse
+
+logger = get_logger("adapters.idempotency.sql")
+
+
+def _digest(key: str) -> str:
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _record(row: IdempotencyKeyModel) -> IdempotencyRecord:
+    if row.status_code is None:
+        return IdempotencyRecord(row.fingerprint)
+    response = StoredResponse(
+        status_code=row.status_code,
+        headers=[tuple(header) for header in row.headers or []],
+        body=row.body or b""
+    )
+    return IdempotencyRecord(row.fingerprint, response)
+
+
+class SQLIdempotencyStore(IdempotencyStore):
+    """Idempotency records in PostgreSQL/SQLite."""
+
+    blocking = True
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        ttl: float = 86400.0,
+        lock_timeout: float = 60.0,
+        purge_every: int = 1000,
+    ):
+        """
+        Args:
+            session_factory: Creates sessions (e.g. SessionLocal)
+            ttl: Seconds a completed response is kept
+            lock_timeout: Seconds after which an in-progress claim is abandoned
+            purge_every: Delete expired rows every N claims (0 = never)
+        """
+        super().__init__(ttl, lock_timeout)
+        self.session_factory = session_factory
+        self.purge_every = purge_every
+        self._claims = 0
+
+    def begin(self, key: str, fingerprint: str, claim: str) -> Optional[IdempotencyRecord]:
+        """Claim a key or return the existing record."""
+        digest = _digest(key)
+        now = datetime.utcnow()
+        values = {
+            "claim": claim,
+            "fingerprint": fingerprint,
+            "status_code": None,
+            "headers": None,
+            "body": None,
+            "expires_at": now + timedelta(seconds=self.lock_timeout),
+        }
+
+        with self.session_factory() as session:
+            try:
+                session.add(IdempotencyKeyModel(key=digest, **values))
+                session.commit()
+                self._claimed()
+                return None
+            except IntegrityError:
+                session.rollback()
+
+            # Row exists: take it over only if it has expired
+            taken = session.execute(
+                update(IdempotencyKeyModel)
+                .where(IdempotencyKeyModel.key == digest, IdempotencyKeyModel.expires_at <= now)
+                .values(**values)
+            ).rowcount
+            session.commit()
+            if taken:
+                self._claimed()
+                return None
+
+            row = session.get(IdempotencyKeyModel, digest)
+            if row is None:
+                # Released in between: report in progress, the caller retries
+                return IdempotencyRecord(fingerprint)
+            return _record(row)
+
+    def get(self, key: str) -> Optional[IdempotencyRecord]:
+        """Current record of a key."""
+        with self.session_factory() as session:
+            row = session.execute(
+                select(IdempotencyKeyModel).where(
+                    IdempotencyKeyModel.key == _digest(key),
+                    IdempotencyKeyModel.expires_at > datetime.utcnow()
+                )
+            ).scalar_one_or_none()
+            return _record(row) if row is not None else None
+
+    def complete(self, key: str, claim: str, response: StoredResponse) -> None:
+        """Store the response until the TTL expires."""
+        with self.session_factory() as session:
+            session.execute(
+                update(IdempotencyKeyModel)
+                .where(IdempotencyKeyModel.key == _digest(key), IdempotencyKeyModel.claim == claim)
+                .values(
+                    status_code=response.status_code,
+                    headers=[list(header) for header in response.headers],
+                    body=response.body,
+                    expires_at=datetime.utcnow() + timedelta(seconds=self.ttl)
+                )
+            )
+            session.commit()
+
+    def release(self, key: str, claim: str) -> None:
+        """Drop the claim."""
+        with self.session_factory() as session:
+            session.execute(
+                delete(IdempotencyKeyModel)
+                .where(IdempotencyKeyModel.key == _digest(key), IdempotencyKeyModel.claim == claim)
+            )
+            session.commit()
+
+    def purge_expired(self) -> int:
+        """Delete expired rows; returns the number deleted."""
+        with self.session_factory() as session:
+            deleted = session.execute(
+                delete(IdempotencyKeyModel).where(IdempotencyKeyModel.expires_at <= datetime.utcnow())
+            ).rowcount
+            session.commit()
+        logger.debug("idempotency_keys_purged", deleted=deleted)
+        return deleted
+
+    def reset(self) -> None:
+        """Forget all keys."""
+        with self.session_factory() as session:
+            session.execute(delete(IdempotencyKeyModel))
+            session.commit()
+
+    def _claimed(self) -> None:
+        self._claims += 1
+        if self.purge_every and self._claims % self.purge_every == 0:
+            self.purge_expired()
@@ -0,0 +1,10 @@
+# Rate Limit Adapters
+from .base import RateLimitStore, RateLimitResult, gcra
+from .memory import MemoryRateLimitStore
+
+__all__ = [
+    "RateLimitStore",
+    "RateLimitResult",
+    "gcra",
+    "MemoryRateLimitStore",
+]
@@ -0,0 +1,117 @@
+"""
+Rate Limit Store Interface
+
+GCRA (Generic Cell Rate Algorithm) token bucket.
+
+Per key only one number is stored: the theoretical arrival time (TAT) of
+the next request. A request is allowed if it doesn't push the TAT more
+than one period into the future. That makes every check O(1) in time and
+space and lets the whole read-modify-write run atomically in any store
+(lock, flock'd shared memory, Redis Lua script).
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    """
+    Outcome of one rate limit check.
+
+    Attributes:
+        allowed: Request may proceed
+        limit: Requests per period (bucket size)
+        remaining: Requests left right now
+        reset_after: Seconds until the bucket is full again
+        retry_after: Seconds until the next request is allowed (0 if allowed)
+        period: Window length in seconds
+    """
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float
+    retry_after: float
+    period: float
+
+    @classmethod
+    def from_tat(
+        cls,
+        allowed: bool,
+        limit: int,
+        period: float,
+        tat_offset: float,
+        retry_after: float = 0.0
+    ) -> "RateLimitResult":
+        """
+        Build result from the stored TAT.
+
+        Args:
+            tat_offset: TAT minus now after this request (seconds)
+        """
+        emission_interval = period / limit
+        remaining = int((period - tat_offset) / emission_interval + 1e-9)
+        return cls(
+            allowed=allowed,
+            limit=limit,
+            remaining=max(0, min(limit, remaining)),
+            reset_after=max(0.0, tat_offset),
+            retry_after=max(0.0, retry_after),
+            period=period,
+        )
+
+
+def gcra(tat: float, now: float, limit: int, period: float, cost: int = 1) -> Tuple[bool, float, float]:
+    """
+    One GCRA step.
+
+    Args:
+        tat: Stored theoretical arrival time (<= now if unknown/expired)
+        now: Current time
+        limit: Requests per period
+        period: Window length in seconds
+        cost: Tokens this request consumes
+
+    Returns:
+        (allowed, new_tat, retry_after) - store new_tat only if allowed
+    """
+    emission_interval = period / limit
+    tat = max(tat, now)
+    new_tat = tat + emission_interval * cost
+    allow_at = new_tat - period
+    if now < allow_at:
+        return False, tat, allow_at - now
+    return True, new_tat, 0.0
+
+
+class RateLimitStore(ABC):
+    """
+    Abstract base class for rate limit stores.
+
+    Implementierungen: MemoryRateLimitStore, SharedMemoryRateLimitStore,
+    RedisRateLimitStore
+    """
+
+    # True if acquire() does network I/O (run it off the event loop)
+    blocking: bool = False
+
+    @abstractmethod
+    def acquire(self, key: str, limit: int, period: float, cost: int = 1) -> RateLimitResult:
+        """
+        Atomically check and consume `cost` tokens from a bucket.
+
+        Args:
+            key: Bucket key (scope + user/IP)
+            limit: Requests per period
+            period: Window length in seconds
+            cost: Tokens to consume
+
+        Returns:
+            RateLimitResult
+        """
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Forget all buckets (tests, admin)."""
+        pass
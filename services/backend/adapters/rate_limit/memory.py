@@ -0,0 +1,43 @@
+"""
+In-Memory Rate Limit Store
+
+Per-process buckets. Correct for a single worker (tests, development);
+with several workers each one enforces its own limit.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from .base import RateLimitResult, RateLimitStore, gcra
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """
+    Thread-safe dict of key -> TAT.
+
+    Bounded to `max_keys`; least recently used keys are dropped first
+    (a dropped key just starts with a full bucket).
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._tats: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, limit: int, period: float, cost: int = 1) -> RateLimitResult:
+        """Check and consume tokens."""
+        with self._lock:
+            now = time.monotonic()
+            allowed, tat, retry_after = gcra(self._tats.get(key, now), now, limit, period, cost)
+            if allowed:
+                self._tats[key] = tat
+                self._tats.move_to_end(key)
+                if len(self._tats) > self.max_keys:
+                    self._tats.popitem(last=False)
+
+        return RateLimitResult.from_tat(allowed, limit, period, tat - now, retry_after)
+
+    def reset(self) -> None:
+        """Forget all buckets."""
+        with self._lock:
+            self._tats.clear()
@@ -0,0 +1,88 @@
+"""
+Redis Rate Limit Store
+
+Buckets shared across hosts. Works with any Redis-protocol server
+(Redis >= 5, Valkey, KeyDB, Dragonfly).
+
+The GCRA step runs server-side as a Lua script, so check-and-consume is
+one atomic round trip and uses the server clock (no host clock skew).
+Requires the optional `redis` package.
+"""
+from typing import Any, Optional
+
+from infrastructure.logging import get_logger
+from .base import RateLimitResult, RateLimitStore
+
+logger = get_logger("adapters.rate_limit.redis")
+
+# KEYS[1] = bucket key; ARGV = limit, period, cost
+# Returns {allowed, tat_offset, retry_after} (floats as strings:
+# Lua numbers are truncated to integers in replies)
+GCRA_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local emission_interval = period / limit
+
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then
+    tat = now
+end
+
+local new_tat = tat + emission_interval * cost
+local allow_at = new_tat - period
+if now < allow_at then
+    return {0, tostring(tat - now), tostring(allow_at - now)}
+end
+
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000))
+return {1, tostring(new_tat - now), '0'}
+"""
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """
+    GCRA buckets in Redis (one key per bucket, expires when full again).
+
+    If Redis is unreachable, requests are allowed (fail open) and an
+    error is logged - rate limiting must not take the API down.
+    """
+
+    blocking = True
+
+    def __init__(self, url: str, key_prefix: str = "ratelimit:", client: Optional[Any] = None):
+        """
+        Args:
+            url: redis://host:port/db
+            key_prefix: Namespace for bucket keys
+            client: Existing redis.Redis client (optional)
+        """
+        if client is None:
+            import redis
+            client = redis.Redis.from_url(url, socket_timeout=0.25, socket_connect_timeout=0.25)
+        self.client = client
+        self.key_prefix = key_prefix
+        self._script = client.register_script(GCRA_SCRIPT)
+
+    def acquire(self, key: str, limit: int, period: float, cost: int = 1) -> RateLimitResult:
+        """Check and consume tokens (one round trip)."""
+        try:
+            allowed, tat_offset, retry_after = self._script(
+                keys=[self.key_prefix + key], args=[limit, period, cost]
+            )
+        except Exception as exc:
+            logger.error("rate_limit_store_unavailable", store="redis", error=str(exc))
+            return RateLimitResult.from_tat(True, limit, period, 0.0)
+
+        return RateLimitResult.from_tat(
+            bool(int(allowed)), limit, period, float(tat_offset), float(retry_after)
+        )
+
+    def reset(self) -> None:
+        """Delete all bucket keys under the prefix."""
+        keys = list(self.client.scan_iter(match=self.key_prefix + "*", count=1000))
+        if keys:
+            self.client.delete(*keys)
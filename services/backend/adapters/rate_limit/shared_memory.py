@@ -0,0 +1,125 @@
+"""
+Shared-Memory Rate Limit Store
+
+Buckets shared by all worker processes on one host, without a server.
+
+The table is a fixed-size, memory-mapped file (default under /dev/shm):
+`slots` entries of (key fingerprint: u64, TAT: f64). A key hashes to a
+window of PROBES consecutive slots; each check byte-range locks only that
+window (fcntl), so workers rarely contend and every check is O(1).
+Linux/macOS only (fcntl).
+"""
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Optional
+
+from .base import RateLimitResult, RateLimitStore, gcra
+
+_SLOT = struct.Struct("<Qd")
+PROBES = 8
+
+
+class SharedMemoryRateLimitStore(RateLimitStore):
+    """
+    Open-addressing hash table in a shared mmap.
+
+    If a key's window is full, the slot with the oldest TAT is reused
+    (that key restarts with a full bucket). Size `slots` to a few times
+    the number of concurrently active users.
+    """
+
+    def __init__(self, path: str, slots: int = 65536):
+        """
+        Args:
+            path: Backing file, e.g. /dev/shm/<app>-ratelimit
+            slots: Table size (fixed once the file exists)
+        """
+        if slots < PROBES:
+            raise ValueError(f"slots must be >= {PROBES}")
+        self.path = path
+        self.slots = slots
+        self._size = slots * _SLOT.size
+        self._pid: Optional[int] = None
+        self._fd = -1
+        self._map: Optional[mmap.mmap] = None
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, limit: int, period: float, cost: int = 1) -> RateLimitResult:
+        """Check and consume tokens."""
+        fingerprint = self._fingerprint(key)
+        first = fingerprint % (self.slots - PROBES + 1)
+        offset, length = first * _SLOT.size, PROBES * _SLOT.size
+
+        with self._lock:
+            table = self._open()
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, length, offset)
+            try:
+                now = time.time()
+                slot, stored_tat = self._find_slot(table, first, fingerprint, now)
+                allowed, tat, retry_after = gcra(stored_tat, now, limit, period, cost)
+                if allowed:
+                    _SLOT.pack_into(table, slot * _SLOT.size, fingerprint, tat)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, length, offset)
+
+        return RateLimitResult.from_tat(allowed, limit, period, tat - now, retry_after)
+
+    def reset(self) -> None:
+        """Forget all buckets (all processes)."""
+        with self._lock:
+            table = self._open()
+            fcntl.lockf(self._fd, fcntl.LOCK_EX)
+            try:
+                table[:] = bytes(self._size)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN)
+
+    def _find_slot(self, table: mmap.mmap, first: int, fingerprint: int, now: float):
+        """
+        Locate the key's slot within its probe window.
+
+        Returns:
+            (slot index, stored TAT or 0.0 for a new key)
+        """
+        victim, victim_tat = first, float("inf")
+        for slot in range(first, first + PROBES):
+            stored_fp, tat = _SLOT.unpack_from(table, slot * _SLOT.size)
+            if stored_fp == fingerprint:
+                return slot, tat
+            # Empty or expired slots are free; otherwise evict the oldest
+            free_tat = -1.0 if stored_fp == 0 or tat <= now else tat
+            if free_tat < victim_tat:
+                victim, victim_tat = slot, free_tat
+        return victim, 0.0
+
+    def _open(self) -> mmap.mmap:
+        """Map the table (again after fork: fcntl locks are per process)."""
+        if self._map is not None:
+            if self._pid == os.getpid():
+                return self._map
+            self._map.close()
+            os.close(self._fd)
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.lockf(fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(fd).st_size != self._size:
+                os.ftruncate(fd, self._size)
+        finally:
+            fcntl.lockf(fd, fcntl.LOCK_UN)
+
+        self._fd = fd
+        self._map = mmap.mmap(fd, self._size)
+        self._pid = os.getpid()
+        return self._map
+
+    @staticmethod
+    def _fingerprint(key: str) -> int:
+        """Non-zero 64-bit key hash (stable across processes)."""
+        digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "little") or 1
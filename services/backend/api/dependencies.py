@@ -4,16 +4,22 @@ Dependency Injection - Adapter Wiring
 Hier werden Module mit ihren Adaptern verbunden.
 Compliant with REQ-000 Infrastructure Standards.
 """
-from typing import Optional
+from typing import Optional, Union
 from sqlalchemy.orm import Session
-from fastapi import Depends, Header
+from fastapi import Depends, Header, Request
 
 from infrastructure.config import config
-from infrastructure.database_sqlalchemy import get_db
+from infrastructure.errors import BaseError
+from infrastructure.database_sqlalchemy import get_db, engine, SessionLocal
 from infrastructure.logging import get_logger
+from infrastructure.tracing import start_span
 from modules.item_manager.repository import ItemRepository
 from adapters.database.base import DatabaseAdapter
+from adapters.events import EventBroker, EventPublisher, InProcessEventBroker, SessionEventPublisher
+from adapters.rate_limit import RateLimitStore, MemoryRateLimitStore
+from adapters.idempotency import IdempotencyStore, MemoryIdempotencyStore
 from adapters.auth import AuthProvider, UserInfo, MockAuthAdapter, AuthenticationError
+from adapters.ai import AIAdapter, MockAIAdapter
 from modules.item_manager.models import Item
 
 logger = get_logger()
@@ -38,19 +44,154 @@ def get_database_adapter(db: Session = Depends(get_db)) -> DatabaseAdapter[Item]
     return PostgreSQLAdapter(db)
 
 
+# Global event broker instance (lazy loaded, one per worker process)
+_event_broker: Optional[InProcessEventBroker] = None
+_event_listener = None
+
+
+def get_event_broker() -> EventBroker:
+    """Get or create the in-process event broker singleton."""
+    global _event_broker
+    if _event_broker is None:
+        _event_broker = InProcessEventBroker()
+    return _event_broker
+
+
+def get_event_publisher(db: Session = Depends(get_db)) -> EventPublisher:
+    """
+    Returns the item change event publisher for this request.
+
+    ENV=test → in-process broker (immediate)
+    PostgreSQL → pg_notify() in the request transaction
+    Other databases → in-process broker after commit
+    """
+    if config.ENV == "test":
+        return get_event_broker()
+
+    if engine.dialect.name == "postgresql":
+        from adapters.events.postgresql import PostgresNotifyPublisher
+        return PostgresNotifyPublisher(db)
+
+    return SessionEventPublisher(db, get_event_broker())
+
+
+def start_event_listener() -> None:
+    """
+    Start the Postgres LISTEN thread feeding the local broker.
+
+    No-op unless the database is PostgreSQL (in-process fan-out only).
+    Call from the application lifespan.
+    """
+    global _event_listener
+    if config.ENV == "test" or engine.dialect.name != "postgresql" or _event_listener is not None:
+        return
+
+    from adapters.events.postgresql import PostgresEventListener
+    dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+    _event_listener = PostgresEventListener(dsn, get_event_broker())
+    _event_listener.start()
+
+
+def stop_event_listener() -> None:
+    """Stop the Postgres LISTEN thread (application shutdown)."""
+    global _event_listener
+    if _event_listener is not None:
+        _event_listener.stop()
+        _event_listener = None
+
+
+_ai_adapter: Optional[AIAdapter] = None
+
+
+def get_ai_adapter() -> AIAdapter:
+    """
+    Returns the AI adapter singleton (one connection pool per worker).
+
+    ENV=test or no ANTHROPIC_API_KEY → MockAIAdapter
+    Otherwise → AnthropicAdapter with pooled HTTP clients
+    """
+    global _ai_adapter
+    if _ai_adapter is None:
+        if config.ENV == "test" or not config.ANTHROPIC_API_KEY:
+            _ai_adapter = MockAIAdapter()
+        else:
+            from adapters.ai.anthropic_adapter import AnthropicAdapter
+            _ai_adapter = AnthropicAdapter(
+                api_key=config.ANTHROPIC_API_KEY,
+                timeout=config.AI_HTTP_TIMEOUT_SECONDS,
+                connect_timeout=config.AI_HTTP_CONNECT_TIMEOUT_SECONDS,
+                max_connections=config.AI_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=config.AI_HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=config.AI_HTTP_KEEPALIVE_SECONDS,
+                http2=config.AI_HTTP2
+            )
+    return _ai_adapter
+
+
+async def start_ai_adapter() -> None:
+    """Open the AI adapter's client on the serving loop (application startup)."""
+    await get_ai_adapter().start()
+
+
+async def close_ai_adapter() -> None:
+    """Close pooled AI connections (application shutdown)."""
+    global _ai_adapter
+    if _ai_adapter is not None:
+        await _ai_adapter.aclose()
+        _ai_adapter = None
+
+
 def get_item_repository(
-    db_adapter: DatabaseAdapter[Item] = Depends(get_database_adapter)
+    db_adapter: DatabaseAdapter[Item] = Depends(get_database_adapter),
+    events: EventPublisher = Depends(get_event_publisher)
 ) -> ItemRepository:
     """
     Returns ItemRepository with injected database adapter.
 
     Args:
         db_adapter: Database adapter implementation (injected)
+        events: Item change event publisher (injected)
 
     Returns:
         ItemRepository instance
     """
-    return ItemRepository(db_adapter)
+    return ItemRepository(db_adapter, events=events, sync_settle_seconds=config.SYNC_SETTLE_SECONDS)
+
+
+def get_rate_limit_store() -> RateLimitStore:
+    """
+    Returns rate limit store based on RATE_LIMIT_STORAGE.
+
+    memory → per worker process (tests, single worker)
+    shm → shared memory, all workers on this host
+    redis → Redis-protocol server, all hosts
+    """
+    if config.RATE_LIMIT_STORAGE == "redis":
+        from adapters.rate_limit.redis import RedisRateLimitStore
+        return RedisRateLimitStore(config.RATE_LIMIT_REDIS_URL)
+
+    if config.RATE_LIMIT_STORAGE == "shm":
+        from adapters.rate_limit.shared_memory import SharedMemoryRateLimitStore
+        return SharedMemoryRateLimitStore(config.RATE_LIMIT_SHM_PATH, slots=config.RATE_LIMIT_SHM_SLOTS)
+
+    return MemoryRateLimitStore()
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    """
+    Returns idempotency store based on IDEMPOTENCY_STORAGE.
+
+    ENV=test or memory → per worker process
+    sql → idempotency_keys table, all workers and hosts
+    """
+    ttl = config.IDEMPOTENCY_TTL_SECONDS
+    lock_timeout = config.IDEMPOTENCY_LOCK_TIMEOUT_SECONDS
+
+    if config.ENV != "test" and config.IDEMPOTENCY_STORAGE == "sql":
+        from adapters.idempotency.sql import SQLIdempotencyStore
+        return SQLIdempotencyStore(SessionLocal, ttl=ttl, lock_timeout=lock_timeout)
+
+    return MemoryIdempotencyStore(ttl=ttl, lock_timeout=lock_timeout)
 
 
 def get_auth_provider() -> AuthProvider:
@@ -90,16 +231,54 @@ def _get_auth_provider() -> AuthProvider:
 
 
 def get_current_user(
+    request: Request,
     authorization: Optional[str] = Header(None, alias="Authorization")
 ) -> UserInfo:
     """
     FastAPI dependency to extract and verify current user from token.
 
+    Reuses the result when the token was already verified for this request
+    (request.state.auth, set by IdempotencyMiddleware).
+
     Usage:
         @router.get("/items")
         def list_items(current_user: UserInfo = Depends(get_current_user)):
             ...
 
+    Args:
+        request: Current request
+        authorization: Authorization header (Bearer token)
+
+    Returns:
+        UserInfo for authenticated user
+
+    Raises:
+        AuthenticationError: If token is missing or invalid
+    """
+    state = request.scope.setdefault("state", {})
+    if "auth" not in state:
+        state["auth"] = resolve_user(authorization)
+    if isinstance(state["auth"], BaseError):
+        raise state["auth"]
+    return state["auth"]
+
+
+def resolve_user(authorization: Optional[str]) -> Union[UserInfo, BaseError]:
+    """
+    Verify the Authorization header once; failures are returned, not raised.
+
+    Blocking (auth provider): call from a threadpool in async code.
+    """
+    try:
+        return verify_authorization(authorization)
+    except BaseError as error:
+        return error
+
+
+def verify_authorization(authorization: Optional[str]) -> UserInfo:
+    """
+    Extract and verify the user from an Authorization header.
+
     Args:
         authorization: Authorization header (Bearer token)
 
@@ -132,7 +311,10 @@ def get_current_user(
 
     # Verify token with auth provider
     auth_provider = _get_auth_provider()
-    user_info = auth_provider.verify_token(token)
+    with start_span("auth.verify") as span:
+        user_info = auth_provider.verify_token(token)
+        if span is not None:
+            span.attributes["enduser.id"] = user_info.user_id
 
     logger.info("auth_success", user_id=user_info.user_id)
     return user_info
@@ -2,44 +2,174 @@
 FastAPI Entry Point
 """
 import os
+import secrets
 from contextlib import asynccontextmanager
+from typing import Optional
 
-from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from slowapi import _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
+from fastapi import FastAPI, Header, Response
 
+from infrastructure.config import config
 from infrastructure.logging import setup_logging, get_logger, get_environment
+from infrastructure.logging.handlers import stop_async_handlers
 from infrastructure.logging.middleware import LoggingMiddleware
-from infrastructure.errors import register_exception_handlers
-from api.rate_limit import limiter
+from infrastructure.logging.sampling import parse_sample_rates
+from infrastructure.errors import AuthError, ErrorCodes, register_exception_handlers
+from infrastructure.database_sqlalchemy import engine
+from infrastructure.loop_monitor import LoopLagMonitor
+from infrastructure.metrics import MetricsMiddleware, RuntimeMetrics, render_metrics
+from infrastructure.profiling import ContinuousProfiler, ProfilingMiddleware
+from infrastructure.tracing import (
+    FileSpanExporter,
+    InMemorySpanExporter,
+    Tracer,
+    TracingMiddleware,
+    configure_tracing,
+    shutdown_tracing,
+)
+from api.middleware.compression import CompressionMiddleware
+from api.middleware.deadline import DeadlineMiddleware
+from api.middleware.idempotency import IdempotencyMiddleware
+from api.middleware.load_shedding import AdaptiveConcurrencyLimiter, GradientLimit, LoadSheddingMiddleware
+from api.middleware.rate_limit import RateLimitHeadersMiddleware
+from api.dependencies import (
+    close_ai_adapter,
+    get_idempotency_store,
+    start_ai_adapter,
+    start_event_listener,
+    stop_event_listener,
+)
+from api.static import StaticAssets
 from api.routes import items
 
 # Setup logging on startup
 environment = get_environment()
-setup_logging(environment=environment, log_level=os.getenv("LOG_LEVEL", "INFO"))
+log_sampler = setup_logging(
+    environment=environment,
+    log_level=os.getenv("LOG_LEVEL", "INFO"),
+    sample_rates=parse_sample_rates(config.LOG_SAMPLE_RATES),
+    slow_request_ms=config.LOG_SLOW_REQUEST_MS,
+    warning_burst=config.LOG_WARNING_BURST,
+    warning_per_second=config.LOG_WARNING_PER_SECOND,
+    queue_size=config.LOG_QUEUE_SIZE,
+    overflow_policy=config.LOG_QUEUE_OVERFLOW,
+    buffer_bytes=config.LOG_BUFFER_BYTES,
+    flush_interval=config.LOG_FLUSH_INTERVAL_MS / 1000,
+)
 
 logger = get_logger()
 
+# Tracing (off by default; instrumented code is a no-op without a tracer)
+if config.TRACING_ENABLED:
+    configure_tracing(Tracer(
+        InMemorySpanExporter() if config.TRACING_EXPORTER == "memory" else FileSpanExporter(config.TRACING_FILE),
+        sample_ratio=config.TRACING_SAMPLE_RATIO,
+    ))
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
     logger.info("application_startup", environment=environment, version="0.1.0")
+    start_event_listener()
+    await start_ai_adapter()
+    if config.LOOP_MONITOR_ENABLED:
+        loop_monitor.start()
+    if config.METRICS_ENABLED:
+        runtime_metrics.start()
+    if continuous_profiler is not None:
+        continuous_profiler.start()
     yield
+    if continuous_profiler is not None:
+        continuous_profiler.stop()
+    runtime_metrics.stop()
+    loop_monitor.stop()
+    await close_ai_adapter()
+    stop_event_listener()
+    shutdown_tracing()
     logger.info("application_shutdown")
+    # Flush queued log records before the process exits
+    stop_async_handlers()
+
 
+# Per-worker admission control (stats: GET /health/load)
+concurrency_limiter = AdaptiveConcurrencyLimiter(
+    GradientLimit(
+        initial_limit=config.CONCURRENCY_LIMIT_INITIAL,
+        min_limit=config.CONCURRENCY_LIMIT_MIN,
+        max_limit=config.CONCURRENCY_LIMIT_MAX
+    ),
+    write_share=config.CONCURRENCY_WRITE_SHARE,
+    queue_timeout=config.CONCURRENCY_QUEUE_TIMEOUT_MS / 1000
+)
+
+# Component stats -> /metrics (refreshed per worker in the background)
+runtime_metrics = RuntimeMetrics(
+    engine=engine,
+    limiter=concurrency_limiter,
+    log_sampler=log_sampler,
+    interval=config.METRICS_REFRESH_SECONDS
+)
+
+# Blocking calls in async code: lag metric + stack of the blocking call
+loop_monitor = LoopLagMonitor(
+    interval=config.LOOP_MONITOR_INTERVAL_MS / 1000,
+    threshold=config.LOOP_BLOCKED_THRESHOLD_MS / 1000
+)
+
+# Low-rate background profiling (per worker, started in lifespan)
+continuous_profiler = ContinuousProfiler(
+    config.PROFILING_DIR,
+    interval=config.PROFILING_CONTINUOUS_INTERVAL_MS / 1000,
+    period=config.PROFILING_CONTINUOUS_PERIOD_SECONDS,
+    keep=config.PROFILING_KEEP_FILES
+) if config.PROFILING_CONTINUOUS else None
 
 app = FastAPI(
     title="ChrisBuilds64 API",
     version="0.1.0",
     lifespan=lifespan
 )
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 # Add middleware (order matters - last added = first executed)
-app.add_middleware(LoggingMiddleware)
+# Idempotency innermost: stores uncompressed bodies without RateLimit-* headers
+app.add_middleware(
+    IdempotencyMiddleware,
+    store_factory=get_idempotency_store,
+    wait_timeout=config.IDEMPOTENCY_WAIT_SECONDS
+)
+app.add_middleware(RateLimitHeadersMiddleware)
+app.add_middleware(
+    DeadlineMiddleware,
+    default_timeout=config.REQUEST_TIMEOUT_SECONDS,
+    route_timeouts=config.REQUEST_TIMEOUTS
+)
+app.add_middleware(CompressionMiddleware, minimum_size=config.COMPRESSION_MIN_SIZE)
+if config.LOAD_SHEDDING_ENABLED:
+    app.add_middleware(
+        LoadSheddingMiddleware,
+        limiter=concurrency_limiter,
+        bypass_paths=("/health", "/metrics", "/api/v1/items/stream", "/app/")
+    )
+# Inside logging: profiles are named after the request_id
+app.add_middleware(
+    ProfilingMiddleware,
+    output_dir=config.PROFILING_DIR,
+    token=config.PROFILING_TOKEN,
+    allow_without_token=config.ENV != "production" and environment != "production",
+    interval=config.PROFILING_INTERVAL_MS / 1000,
+    keep=config.PROFILING_KEEP_FILES
+)
+# Outside load shedding: shed requests (503) are counted too
+if config.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, excluded_paths=("/metrics",))
+app.add_middleware(
+    LoggingMiddleware,
+    repeated_query_threshold=config.DB_REPEATED_QUERY_THRESHOLD,
+    slow_request_ms=config.LOG_SLOW_REQUEST_MS
+)
+# Outermost: the request span covers logging and all other middleware
+if config.TRACING_ENABLED:
+    app.add_middleware(TracingMiddleware, excluded_paths=("/metrics",))
 
 # Register exception handlers (RFC 7807 error responses)
 register_exception_handlers(app)
@@ -48,7 +178,7 @@ register_exception_handlers(app)
 app.include_router(items.router, prefix="/api/v1")
 
 
-# Serve frontend apps (static files)
+# Serve frontend apps (static files, manifest built at startup)
 # Docker: /apps (mounted volume), Local: ../../apps (relative to services/backend/)
 _backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 _repo_root = os.path.dirname(os.path.dirname(_backend_dir))
@@ -57,7 +187,13 @@ if os.path.exists(apps_dir):
     for app_name in os.listdir(apps_dir):
         app_path = os.path.join(apps_dir, app_name)
         if os.path.isdir(app_path):
-            app.mount(f"/app/{app_name}", StaticFiles(directory=app_path, html=True), name=app_name)
+            assets = StaticAssets(
+                app_path,
+                html=True,
+                memory_max_bytes=config.STATIC_MEMORY_MAX_BYTES,
+                revalidate=config.STATIC_REVALIDATE
+            )
+            app.mount(f"/app/{app_name}", assets, name=app_name)
 
 
 @app.get("/health")
@@ -65,3 +201,23 @@ async def health():
     """Health check endpoint"""
     logger.debug("health_check_called")
     return {"status": "ok"}
+
+
+@app.get("/health/load")
+async def health_load():
+    """Concurrency limit, queue depth, shed counts and event loop lag of this worker"""
+    return {**concurrency_limiter.stats(), "event_loop": loop_monitor.stats()}
+
+
+if config.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    def metrics(authorization: Optional[str] = Header(None)):
+        """Prometheus scrape endpoint (aggregated over all workers)"""
+        # Bytes: compare_digest() rejects non-ASCII str (headers are latin-1)
+        if config.METRICS_TOKEN and not secrets.compare_digest(
+            (authorization or "").encode("latin-1"), f"Bearer {config.METRICS_TOKEN}".encode()
+        ):
+            raise AuthError("Metrics token required", code=ErrorCodes.INVALID_TOKEN)
+        runtime_metrics.refresh()
+        body, content_type = render_metrics()
+        return Response(body, media_type=content_type)
@@ -0,0 +1,228 @@
+"""
+Response Compression Middleware
+
+Negotiates zstd / brotli / gzip from Accept-Encoding and compresses
+responses incrementally (streaming responses are flushed chunk by chunk).
+
+- Only content types on the allow-list are compressed
+- Small non-streaming bodies (below minimum_size) are sent as-is
+- Already encoded responses and excluded paths (/app/* static assets) are
+  passed through untouched
+
+brotli and zstd are optional: without the `brotli` / `zstandard` packages
+only gzip is offered.
+"""
+import zlib
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+DEFAULT_COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/problem+json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+# Server preference when the client rates several encodings equally
+ENCODING_PREFERENCE = ("zstd", "br", "gzip")
+
+
+class _GzipEncoder:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class _BrotliEncoder:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+class _ZstdEncoder:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """Encodings supported by the installed libraries, in preference order."""
+    supported = {"gzip"}
+    if brotli is not None:
+        supported.add("br")
+    if zstandard is not None:
+        supported.add("zstd")
+    return tuple(e for e in ENCODING_PREFERENCE if e in supported)
+
+
+def negotiate_encoding(accept_encoding: str, supported: Iterable[str]) -> Optional[str]:
+    """
+    Pick the best content coding for an Accept-Encoding header.
+
+    Highest q-value wins; ties are broken by server preference (order of
+    `supported`). Returns None if nothing acceptable is supported.
+    """
+    if not accept_encoding:
+        return None
+
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[token] = q
+
+    best, best_q = None, 0.0
+    for encoding in supported:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware for negotiated response compression.
+
+    Usage:
+        >>> app.add_middleware(CompressionMiddleware, minimum_size=1024)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        compressible_types: Iterable[str] = DEFAULT_COMPRESSIBLE_TYPES,
+        excluded_paths: Iterable[str] = ("/app/",),
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compressible_types = tuple(compressible_types)
+        self.excluded_paths = tuple(excluded_paths)
+        self.supported = available_encodings()
+        self._factories: Dict[str, Callable[[], object]] = {
+            "gzip": lambda: _GzipEncoder(gzip_level),
+            "br": lambda: _BrotliEncoder(brotli_quality),
+            "zstd": lambda: _ZstdEncoder(zstd_level),
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.excluded_paths):
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.supported)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def is_compressible(self, headers: Headers) -> bool:
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").split(";", 1)[0].strip().lower()
+        return bool(content_type) and content_type.startswith(self.compressible_types)
+
+
+class _CompressionResponder:
+    """Per-request send wrapper holding the encoder state."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Optional[Message] = None
+        self._encoder = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            self._start = message
+            headers = Headers(raw=message.get("headers", []))
+            if message["status"] < 200 or message["status"] in (204, 304) or not self.middleware.is_compressible(headers):
+                self._passthrough = True
+                await self._send(message)
+            return
+
+        if message_type != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._encoder is None:
+            # First body chunk decides: small complete bodies go out unchanged
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self._passthrough = True
+                await self._send(self._start)
+                await self._send(message)
+                return
+
+            self._encoder = self.middleware._factories[self.encoding]()
+            headers = MutableHeaders(scope=self._start)
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+
+            if more_body:
+                # Streaming: length unknown, send chunks as they are compressed
+                del headers["Content-Length"]
+            else:
+                compressed = self._encoder.finish(body)
+                headers["Content-Length"] = str(len(compressed))
+                await self._send(self._start)
+                await self._send({"type": "http.response.body", "body": compressed})
+                return
+
+            await self._send(self._start)
+
+        if more_body:
+            chunk = self._encoder.compress(body)
+        else:
+            chunk = self._encoder.finish(body)
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
@@ -0,0 +1,136 @@
+"""
+Deadline Middleware
+
+Gives every HTTP request a deadline and enforces it on the response.
+
+Timeout per request (seconds):
+- longest matching route rule ("[METHOD ]/path/prefix=seconds"), else
+- default_timeout
+A timeout of 0 means no deadline (e.g. SSE streams). Clients can only
+shorten it with an X-Request-Timeout header; the header is ignored on
+routes without a deadline.
+
+The deadline is stored in infrastructure.deadline for downstream code
+(statement_timeout in get_db, AI calls). If the app hasn't started the
+response when the deadline passes, it is cancelled and the client gets a
+504 problem detail right away.
+"""
+import asyncio
+from typing import List, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.deadline import DeadlineExceededError, reset_deadline, set_deadline
+from infrastructure.errors import problem_response
+from infrastructure.logging import get_logger
+
+logger = get_logger("api.middleware.deadline")
+
+RouteTimeout = Tuple[Optional[str], str, float]
+
+
+def parse_route_timeouts(spec: str) -> List[RouteTimeout]:
+    """
+    Parse "GET /api/v1/items=5,/api/v1/items/stream=0".
+
+    Returns:
+        (method or None, path prefix, seconds), longest prefix first
+    """
+    rules: List[RouteTimeout] = []
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        route, _, seconds = entry.rpartition("=")
+        method, _, path = route.strip().rpartition(" ")
+        if not path.startswith("/"):
+            raise ValueError(f"Invalid route timeout: {entry!r}")
+        rules.append((method.upper() or None, path, float(seconds)))
+    return sorted(rules, key=lambda rule: (len(rule[1]), rule[0] is not None), reverse=True)
+
+
+def parse_timeout_header(value: str) -> Optional[float]:
+    """X-Request-Timeout in seconds ("2.5") or milliseconds ("2500ms")."""
+    value = value.strip().lower()
+    try:
+        if value.endswith("ms"):
+            timeout = float(value[:-2]) / 1000
+        else:
+            timeout = float(value.rstrip("s"))
+    except ValueError:
+        return None
+    return timeout if timeout > 0 else None
+
+
+class DeadlineMiddleware:
+    """Per-request deadline with fail-fast 504."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_timeout: float = 30.0,
+        route_timeouts: str = "",
+    ):
+        """
+        Args:
+            app: ASGI app
+            default_timeout: Seconds if no rule/header matches (0 = none)
+            route_timeouts: Rules, see parse_route_timeouts()
+        """
+        self.app = app
+        self.default_timeout = default_timeout
+        self.rules = parse_route_timeouts(route_timeouts)
+
+    def timeout_for(self, scope: Scope) -> Optional[float]:
+        """Effective timeout in seconds, None for no deadline."""
+        timeout = self.default_timeout
+        for method, prefix, seconds in self.rules:
+            if scope["path"].startswith(prefix) and method in (None, scope["method"]):
+                timeout = seconds
+                break
+        if not timeout:
+            return None
+
+        header = Headers(scope=scope).get("x-request-timeout")
+        requested = parse_timeout_header(header) if header is not None else None
+        return min(requested, timeout) if requested is not None else timeout
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timeout = self.timeout_for(scope)
+        if timeout is None:
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        token = set_deadline(timeout)
+        deadline = asyncio.timeout(timeout)
+        try:
+            async with deadline:
+                await self.app(scope, receive, send_wrapper)
+        except TimeoutError:
+            if not deadline.expired():
+                # Raised by the app (socket, httpx, wait_for), not our deadline
+                raise
+            logger.warning(
+                "request_deadline_exceeded",
+                path=scope["path"],
+                timeout_s=timeout,
+                response_started=response_started
+            )
+            if response_started:
+                # Too late for an error response; drop the connection
+                raise
+            request_id = scope.get("state", {}).get("request_id")
+            error = DeadlineExceededError(context={"timeout_s": timeout})
+            await problem_response(error, instance=scope["path"], request_id=request_id)(scope, receive, send)
+        finally:
+            reset_deadline(token)
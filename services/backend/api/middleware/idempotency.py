@@ -0,0 +1,294 @@
+"""
+Idempotency Middleware
+
+Makes retried writes safe: POST/PUT/PATCH/DELETE requests carrying an
+`Idempotency-Key` header execute once per (user, key); retries get the
+stored first response (`Idempotent-Replayed: true`) without reaching the
+route, i.e. without touching the item table.
+
+- Same key, different method/path/body -> 422 (key reused)
+- Duplicate while the first request still runs -> waits for its result
+  (same worker: in-process event, other workers: polls the store);
+  409 + Retry-After if it doesn't finish within wait_timeout
+- 5xx, 408/409/425/429 and exceptions are not stored: the key is
+  released so the retry executes
+- Requests without valid credentials pass through (the route answers 401)
+- Store unavailable -> fail open (request executes without idempotency)
+
+Follows draft-ietf-httpapi-idempotency-key-header.
+"""
+import asyncio
+import hashlib
+import uuid
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from adapters.idempotency import IdempotencyRecord, IdempotencyStore, StoredResponse
+from api.dependencies import resolve_user
+from infrastructure.errors import BaseError, ErrorCodes, ValidationError, problem_response
+from infrastructure.logging import get_logger
+
+logger = get_logger("api.middleware.idempotency")
+
+MAX_KEY_LENGTH = 255
+
+# Responses that don't reflect an executed operation: never replayed
+NOT_STORED = frozenset({408, 409, 425, 429})
+
+# Not replayed: per-response or per-connection headers
+EXCLUDED_HEADERS = frozenset({"date", "server", "set-cookie"})
+
+
+class InvalidIdempotencyKeyError(ValidationError):
+    """Idempotency-Key header empty or too long"""
+    code = ErrorCodes.FORMAT_ERROR
+    message = f"Idempotency-Key must be 1-{MAX_KEY_LENGTH} visible ASCII characters"
+
+
+class IdempotencyKeyReusedError(BaseError):
+    """Key already used for a different request"""
+    code = ErrorCodes.IDEMPOTENCY_KEY_REUSED
+    message = "Idempotency-Key was already used for a different request"
+    http_status = 422
+    title = "Unprocessable Content"
+
+
+class IdempotencyKeyInUseError(BaseError):
+    """First request with this key is still running"""
+    code = ErrorCodes.IDEMPOTENCY_KEY_IN_USE
+    message = "A request with this Idempotency-Key is still in progress"
+    http_status = 409
+    recoverable = True
+    title = "Conflict"
+
+
+def request_fingerprint(method: str, path: str, query_string: bytes, body: bytes) -> str:
+    """sha256 over everything that makes two requests "the same"."""
+    digest = hashlib.sha256()
+    for part in (method.encode(), path.encode(), query_string, body):
+        digest.update(part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _valid_key(key: str) -> bool:
+    return 0 < len(key) <= MAX_KEY_LENGTH and key.isascii() and key.isprintable()
+
+
+class IdempotencyMiddleware:
+    """Store and replay responses per (user, Idempotency-Key)."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store_factory: Callable[[], IdempotencyStore],
+        methods: Sequence[str] = ("POST", "PUT", "PATCH", "DELETE"),
+        paths: Sequence[str] = ("/api/",),
+        wait_timeout: float = 10.0,
+        max_body_bytes: int = 1024 * 1024,
+    ):
+        """
+        Args:
+            app: ASGI app
+            store_factory: Creates the store on first use (inside the worker)
+            methods: Methods honouring the header
+            paths: Path prefixes honouring the header
+            wait_timeout: Max seconds a duplicate waits for the first request
+            max_body_bytes: Larger responses are not stored
+        """
+        self.app = app
+        self._store_factory = store_factory
+        self._store: Optional[IdempotencyStore] = None
+        self.methods = frozenset(methods)
+        self.paths = tuple(paths)
+        self.wait_timeout = wait_timeout
+        self.max_body_bytes = max_body_bytes
+        # Requests of this worker currently executing, by scoped key
+        self._inflight: Dict[str, asyncio.Event] = {}
+
+    @property
+    def store(self) -> IdempotencyStore:
+        if self._store is None:
+            self._store = self._store_factory()
+        return self._store
+
+    async def _call(self, method: Callable, *args):
+        if self.store.blocking:
+            return await run_in_threadpool(method, *args)
+        return method(*args)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in self.methods
+            or not scope["path"].startswith(self.paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        key = headers.get("idempotency-key")
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not _valid_key(key):
+            await self._problem(InvalidIdempotencyKeyError(), scope, receive, send)
+            return
+
+        # Verified once per request: get_current_user reuses state["auth"]
+        auth = await run_in_threadpool(resolve_user, headers.get("authorization"))
+        scope.setdefault("state", {})["auth"] = auth
+        if isinstance(auth, BaseError):
+            await self.app(scope, receive, send)
+            return
+        user = auth
+
+        body, receive = await self._buffer_body(receive)
+        scoped_key = f"{user.user_id}:{key}"
+        fingerprint = request_fingerprint(scope["method"], scope["path"], scope["query_string"], body)
+
+        claim = uuid.uuid4().hex
+        try:
+            record = await self._claim(scoped_key, fingerprint, claim)
+        except IdempotencyKeyInUseError as error:
+            await self._problem(error, scope, receive, send)
+            return
+        except Exception as exc:
+            logger.warning("idempotency_store_unavailable", error=str(exc), error_type=type(exc).__name__)
+            await self.app(scope, receive, send)
+            return
+
+        if record is not None:
+            if record.fingerprint != fingerprint:
+                await self._problem(IdempotencyKeyReusedError(), scope, receive, send)
+                return
+            logger.info("idempotent_replay", path=scope["path"], status_code=record.response.status_code)
+            await self._replay(record.response, send)
+            return
+
+        await self._execute(scoped_key, claim, scope, receive, send)
+
+    async def _buffer_body(self, receive: Receive) -> Tuple[bytes, Receive]:
+        """Read the request body (for the fingerprint) and replay it to the app."""
+        chunks: List[bytes] = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+
+        replayed = False
+
+        async def replay_receive() -> Message:
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        return body, replay_receive
+
+    async def _claim(self, scoped_key: str, fingerprint: str, claim: str) -> Optional[IdempotencyRecord]:
+        """
+        Claim the key, waiting while another request holds it.
+
+        Returns:
+            None if this request executes, else the completed record
+            (or a record with a different fingerprint)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.wait_timeout
+        poll_interval = 0.05
+
+        while True:
+            local = self._inflight.get(scoped_key)
+            if local is not None:
+                # Same worker: wake up as soon as the first request finishes
+                try:
+                    async with asyncio.timeout_at(deadline):
+                        await local.wait()
+                except TimeoutError:
+                    raise IdempotencyKeyInUseError(headers={"Retry-After": "1"})
+                continue
+
+            record = await self._call(self.store.begin, scoped_key, fingerprint, claim)
+            if record is None or not record.in_progress or record.fingerprint != fingerprint:
+                return record
+
+            # Another worker runs it: poll with backoff
+            if loop.time() + poll_interval > deadline:
+                raise IdempotencyKeyInUseError(headers={"Retry-After": "1"})
+            await asyncio.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, 0.5)
+
+    async def _execute(self, scoped_key: str, claim: str, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request once and store its response."""
+        event = self._inflight[scoped_key] = asyncio.Event()
+        status_code: Optional[int] = None
+        response_headers: List[Tuple[str, str]] = []
+        chunks: List[bytes] = []
+        size = 0
+        complete = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, size, complete
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_headers.extend(
+                    (name.decode("latin-1"), value.decode("latin-1"))
+                    for name, value in message.get("headers", [])
+                    if name.decode("latin-1").lower() not in EXCLUDED_HEADERS
+                )
+            elif message["type"] == "http.response.body":
+                body = message.get("body", b"")
+                size += len(body)
+                if size <= self.max_body_bytes:
+                    chunks.append(body)
+                complete = not message.get("more_body", False)
+            await send(message)
+
+        stored = False
+        try:
+            await self.app(scope, receive, send_wrapper)
+            if (
+                complete
+                and status_code is not None
+                and status_code < 500
+                and status_code not in NOT_STORED
+                and size <= self.max_body_bytes
+            ):
+                response = StoredResponse(status_code, response_headers, b"".join(chunks))
+                try:
+                    await self._call(self.store.complete, scoped_key, claim, response)
+                    stored = True
+                except Exception as exc:
+                    # Response already sent; a retry will execute again
+                    logger.warning("idempotency_store_unavailable", error=str(exc), error_type=type(exc).__name__)
+        finally:
+            if not stored:
+                try:
+                    await self._call(self.store.release, scoped_key, claim)
+                except Exception as exc:
+                    # Claim expires after the store's lock_timeout
+                    logger.warning("idempotency_release_failed", error=str(exc), error_type=type(exc).__name__)
+            del self._inflight[scoped_key]
+            event.set()
+
+    @staticmethod
+    async def _replay(response: StoredResponse, send: Send) -> None:
+        headers = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in response.headers]
+        headers.append((b"idempotent-replayed", b"true"))
+        await send({"type": "http.response.start", "status": response.status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": response.body})
+
+    @staticmethod
+    async def _problem(error: BaseError, scope: Scope, receive: Receive, send: Send) -> None:
+        request_id = scope.get("state", {}).get("request_id")
+        await problem_response(error, instance=scope["path"], request_id=request_id)(scope, receive, send)
@@ -0,0 +1,300 @@
+"""
+Load Shedding Middleware
+
+Caps in-flight HTTP requests per worker with an adaptive concurrency limit
+and rejects overflow early (503 + Retry-After, RFC 7807) instead of letting
+every request queue on the DB pool until all of them time out.
+
+- Limit: gradient of long-term vs. short-term latency (after Netflix
+  concurrency-limits "Gradient2"); shrinks when latency rises, grows while
+  latency is stable and the limit is actually used. 503/504 responses cut
+  it multiplicatively (AIMD backoff).
+- Priority: reads may use the whole limit, writes only `write_share` of it,
+  and queued reads are admitted before queued writes.
+- Queue: overflow waits up to `queue_timeout` for a slot, then is shed.
+- Bypass: /health (and long-lived streams) are never limited.
+
+One limiter per worker process (asyncio, single event loop).
+"""
+import asyncio
+import math
+import time
+from collections import Counter, deque
+from typing import Any, Deque, Dict, Optional, Sequence
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.errors import BaseError, ErrorCodes, problem_response
+from infrastructure.logging import get_logger
+
+logger = get_logger("api.middleware.load_shedding")
+
+READ = "read"
+WRITE = "write"
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ServiceOverloadedError(BaseError):
+    """Worker at its concurrency limit - retry later"""
+    code = ErrorCodes.SERVICE_OVERLOADED
+    message = "Server is overloaded, please retry"
+    http_status = 503
+    recoverable = True
+    title = "Service Unavailable"
+
+
+class GradientLimit:
+    """
+    Latency-gradient concurrency limit.
+
+    gradient = clamp(tolerance * long_rtt / short_rtt, 0.5, 1.0)
+    limit    = smooth(limit * gradient + sqrt(limit))
+
+    The sqrt(limit) term is the headroom that lets the limit grow while
+    latency stays at its long-term level.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 4,
+        max_limit: int = 200,
+        smoothing: float = 0.2,
+        tolerance: float = 1.5,
+        long_window: int = 600,
+        backoff_ratio: float = 0.9,
+    ):
+        """
+        Args:
+            initial_limit: Starting limit
+            min_limit, max_limit: Bounds
+            smoothing: Weight of a new estimate (0..1)
+            tolerance: Accepted latency increase before the limit shrinks
+            long_window: Samples in the long-term latency average
+            backoff_ratio: Multiplier on 503/504 (drops)
+        """
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.smoothing = smoothing
+        self.tolerance = tolerance
+        self.backoff_ratio = backoff_ratio
+        self._long_alpha = 2.0 / (long_window + 1)
+        self._short_alpha = 0.5
+        self.short_rtt: Optional[float] = None
+        self.long_rtt: Optional[float] = None
+
+    def on_drop(self) -> None:
+        """Request timed out or was rejected downstream."""
+        self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+
+    def on_sample(self, rtt: float, in_flight: int) -> None:
+        """
+        Update the limit from one completed request.
+
+        Args:
+            rtt: Request latency in seconds
+            in_flight: Requests in flight when it completed
+        """
+        if self.short_rtt is None:
+            self.short_rtt = self.long_rtt = rtt
+            return
+
+        self.short_rtt += self._short_alpha * (rtt - self.short_rtt)
+        self.long_rtt += self._long_alpha * (rtt - self.long_rtt)
+
+        # Latency dropped for good (e.g. after a slow deploy): let the
+        # baseline follow so the limit can grow again
+        if self.long_rtt / self.short_rtt > 2:
+            self.long_rtt *= 0.95
+
+        # App-limited: the limit wasn't the bottleneck, nothing learned
+        if in_flight < self.limit / 2:
+            return
+
+        gradient = max(0.5, min(1.0, self.tolerance * self.long_rtt / self.short_rtt))
+        estimate = self.limit * gradient + math.sqrt(self.limit)
+        limit = self.limit * (1 - self.smoothing) + estimate * self.smoothing
+        self.limit = max(self.min_limit, min(self.max_limit, limit))
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Admission control for one worker: slots, priority queue, statistics.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[GradientLimit] = None,
+        write_share: float = 0.8,
+        queue_timeout: float = 0.1,
+        max_queue: Optional[int] = None,
+    ):
+        """
+        Args:
+            limit: Limit algorithm (default GradientLimit())
+            write_share: Fraction of the limit writes may occupy
+            queue_timeout: Max seconds to wait for a slot
+            max_queue: Max waiting requests (default: current limit)
+        """
+        self.limit = limit or GradientLimit()
+        self.write_share = write_share
+        self.queue_timeout = queue_timeout
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {READ: deque(), WRITE: deque()}
+        self.accepted = Counter()
+        self.shed = Counter()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters[READ]) + len(self._waiters[WRITE])
+
+    def _capacity(self, priority: str) -> int:
+        limit = int(self.limit.limit)
+        if priority == WRITE:
+            return max(1, int(limit * self.write_share))
+        return limit
+
+    def _has_priority_waiters(self, priority: str) -> bool:
+        if priority == READ:
+            return bool(self._waiters[READ])
+        return self.queued > 0
+
+    async def acquire(self, priority: str) -> bool:
+        """
+        Take a slot, waiting up to queue_timeout.
+
+        Returns:
+            False if the request should be shed
+        """
+        if self.in_flight < self._capacity(priority) and not self._has_priority_waiters(priority):
+            self.in_flight += 1
+            self.accepted[priority] += 1
+            return True
+
+        max_queue = self.max_queue if self.max_queue is not None else int(self.limit.limit)
+        if self.queued >= max_queue:
+            self.shed[(priority, "queue_full")] += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(waiter)
+        try:
+            async with asyncio.timeout(self.queue_timeout):
+                await waiter
+        except TimeoutError:
+            # A slot granted right as the timeout fired still counts
+            if not self._granted(waiter):
+                self._discard(priority, waiter)
+                self.shed[(priority, "queue_timeout")] += 1
+                return False
+        except BaseException:
+            # Client gone while queued: hand back a slot granted meanwhile
+            if self._granted(waiter):
+                self.release()
+            else:
+                self._discard(priority, waiter)
+            raise
+
+        self.accepted[priority] += 1
+        return True
+
+    @staticmethod
+    def _granted(waiter: asyncio.Future) -> bool:
+        return waiter.done() and not waiter.cancelled()
+
+    def _discard(self, priority: str, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters[priority].remove(waiter)
+        except ValueError:
+            pass
+
+    def release(self, rtt: Optional[float] = None, dropped: bool = False) -> None:
+        """
+        Free a slot and admit waiters.
+
+        Args:
+            rtt: Latency of the finished request (None: no sample)
+            dropped: Request ended in 503/504 (backs the limit off)
+        """
+        self.in_flight -= 1
+        if dropped:
+            self.limit.on_drop()
+        elif rtt is not None:
+            self.limit.on_sample(rtt, self.in_flight + 1)
+
+        for priority in (READ, WRITE):
+            waiters = self._waiters[priority]
+            while waiters and self.in_flight < self._capacity(priority):
+                waiter = waiters.popleft()
+                if waiter.done():
+                    continue
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Current limit, in-flight/queued requests and counters."""
+        return {
+            "limit": int(self.limit.limit),
+            "in_flight": self.in_flight,
+            "queued": {READ: len(self._waiters[READ]), WRITE: len(self._waiters[WRITE])},
+            "accepted": dict(self.accepted),
+            "shed": {f"{priority}:{reason}": count for (priority, reason), count in self.shed.items()},
+            "latency_ms": {
+                "short": round(self.limit.short_rtt * 1000, 2) if self.limit.short_rtt else None,
+                "long": round(self.limit.long_rtt * 1000, 2) if self.limit.long_rtt else None,
+            },
+        }
+
+
+class LoadSheddingMiddleware:
+    """Admit requests through an AdaptiveConcurrencyLimiter."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: AdaptiveConcurrencyLimiter,
+        bypass_paths: Sequence[str] = ("/health",),
+        retry_after: int = 1,
+    ):
+        """
+        Args:
+            app: ASGI app
+            limiter: Shared limiter (see api.main for stats export)
+            bypass_paths: Path prefixes never limited (health, streams)
+            retry_after: Retry-After seconds on 503
+        """
+        self.app = app
+        self.limiter = limiter
+        self.bypass_paths = tuple(bypass_paths)
+        self.retry_after = retry_after
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.bypass_paths):
+            await self.app(scope, receive, send)
+            return
+
+        priority = READ if scope["method"] in READ_METHODS else WRITE
+        if not await self.limiter.acquire(priority):
+            logger.debug("request_shed", path=scope["path"], priority=priority, limit=int(self.limiter.limit.limit))
+            error = ServiceOverloadedError(headers={"Retry-After": str(self.retry_after)})
+            request_id = scope.get("state", {}).get("request_id")
+            await problem_response(error, instance=scope["path"], request_id=request_id)(scope, receive, send)
+            return
+
+        status_code = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        rtt: Optional[float] = None
+        try:
+            await self.app(scope, receive, send_wrapper)
+            rtt = time.perf_counter() - start
+        finally:
+            self.limiter.release(rtt, dropped=status_code in (503, 504))
@@ -0,0 +1,36 @@
+"""
+Rate Limit Headers Middleware
+
+Adds RateLimit-* headers to responses of rate-limited routes.
+
+The limiter dependency leaves its result in request.state.rate_limit;
+this middleware copies it onto the response (including 429 problem
+responses). Pure ASGI so it works for streamed and pre-encoded bodies.
+"""
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.rate_limit import rate_limit_headers
+
+
+class RateLimitHeadersMiddleware:
+    """Append RateLimit-Limit/-Remaining/-Reset/-Policy headers."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                result = scope.get("state", {}).get("rate_limit")
+                if result is not None:
+                    headers = MutableHeaders(scope=message)
+                    for name, value in rate_limit_headers(result).items():
+                        headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
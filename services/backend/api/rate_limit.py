@@ -1,9 +1,152 @@
 """
-Rate Limiting Configuration
+Rate Limiting
 
-Global limiter instance shared across routes.
+Per-user GCRA token buckets as FastAPI dependencies.
+
+Usage:
+    @router.post("", dependencies=[Depends(limiter.limit("20/minute"))])
+
+Buckets are keyed on route + authenticated user_id (client IP for
+anonymous routes, per_user=False) and live in the store selected by
+RATE_LIMIT_STORAGE (memory | shm | redis), so all workers share one
+limit. RateLimit-* headers are added by RateLimitHeadersMiddleware.
 """
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+import math
+import re
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi import Depends, Request
+from starlette.concurrency import run_in_threadpool
+
+from adapters.auth import UserInfo
+from adapters.rate_limit import RateLimitResult, RateLimitStore
+from api.dependencies import get_current_user, get_rate_limit_store
+from infrastructure.errors import BaseError, ErrorCodes
+from infrastructure.logging import get_logger
+
+logger = get_logger("api.rate_limit")
+
+_RATE_PATTERN = re.compile(r"^\s*(\d+)\s*/\s*(\d+)?\s*(second|minute|hour|day)s?\s*$")
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+class RateLimitExceededError(BaseError):
+    """Too many requests - retry after the Retry-After header"""
+    code = ErrorCodes.RATE_LIMIT_EXCEEDED
+    message = "Rate limit exceeded"
+    http_status = 429
+    recoverable = True
+    title = "Too Many Requests"
+
+
+def parse_rate(rate: str) -> Tuple[int, float]:
+    """
+    Parse "20/minute", "100/hour", "5/10 seconds".
+
+    Returns:
+        (limit, period in seconds)
+    """
+    match = _RATE_PATTERN.match(rate)
+    if not match or int(match.group(1)) < 1:
+        raise ValueError(f"Invalid rate: {rate!r}")
+    count, multiplier, unit = match.groups()
+    return int(count), int(multiplier or 1) * _PERIODS[unit]
+
+
+def rate_limit_headers(result: RateLimitResult) -> Dict[str, str]:
+    """RateLimit-* response headers (IETF draft-ietf-httpapi-ratelimit-headers)."""
+    return {
+        "RateLimit-Limit": str(result.limit),
+        "RateLimit-Remaining": str(result.remaining),
+        "RateLimit-Reset": str(math.ceil(result.reset_after)),
+        "RateLimit-Policy": f"{result.limit};w={int(result.period)}",
+    }
+
+
+def client_ip(request: Request) -> str:
+    """Client address of the connection."""
+    return request.client.host if request.client else "unknown"
+
+
+class Limiter:
+    """
+    Creates rate limit dependencies sharing one store.
+
+    The store is created on first use, i.e. inside the worker process.
+    """
+
+    def __init__(self, store_factory: Callable[[], RateLimitStore]):
+        self._store_factory = store_factory
+        self._store: Optional[RateLimitStore] = None
+
+    @property
+    def store(self) -> RateLimitStore:
+        if self._store is None:
+            self._store = self._store_factory()
+        return self._store
+
+    def limit(self, rate: str, scope: Optional[str] = None, per_user: bool = True) -> Callable:
+        """
+        Dependency enforcing `rate` per user (or per IP).
+
+        Args:
+            rate: e.g. "20/minute"
+            scope: Bucket name to share a limit across routes
+                (default: one bucket per route)
+            per_user: Key on the authenticated user (requires auth);
+                False keys on client IP
+
+        Returns:
+            FastAPI dependency (raises RateLimitExceededError)
+        """
+        limit, period = parse_rate(rate)
+
+        if per_user:
+            async def dependency(request: Request, current_user: UserInfo = Depends(get_current_user)) -> None:
+                await self.check(request, f"user:{current_user.user_id}", limit, period, scope)
+        else:
+            async def dependency(request: Request) -> None:
+                await self.check(request, f"ip:{client_ip(request)}", limit, period, scope)
+
+        return dependency
+
+    async def check(
+        self,
+        request: Request,
+        identity: str,
+        limit: int,
+        period: float,
+        scope: Optional[str] = None
+    ) -> RateLimitResult:
+        """
+        Consume one token; raise if the bucket is empty.
+
+        The result is stored in request.state.rate_limit for the
+        RateLimit-* headers.
+        """
+        if scope is None:
+            route = request.scope.get("route")
+            scope = f"{request.method}:{route.path if route else request.url.path}"
+        key = f"{scope}:{identity}"
+
+        store = self.store
+        if store.blocking:
+            result = await run_in_threadpool(store.acquire, key, limit, period)
+        else:
+            result = store.acquire(key, limit, period)
+
+        request.state.rate_limit = result
+        if not result.allowed:
+            logger.warning("rate_limit_exceeded", key=key, retry_after=round(result.retry_after, 3))
+            raise RateLimitExceededError(
+                context={"scope": scope},
+                headers={"Retry-After": str(max(1, math.ceil(result.retry_after)))}
+            )
+        return result
+
+    def reset(self) -> None:
+        """Forget all buckets (tests)."""
+        self.store.reset()
+
 
-limiter = Limiter(key_func=get_remote_address, default_limits=["60/minute"])
+limiter = Limiter(get_rate_limit_store)
@@ -0,0 +1,84 @@
+"""
+Fast Response Serialization
+
+orjson-based encoding for item endpoints.
+
+Routes return pre-encoded bodies as Response instances, so FastAPI skips
+the response_model validation/serialization pass. The response_model on the
+route decorator still drives the OpenAPI schema.
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+import orjson
+from fastapi.responses import Response
+
+from modules.item_manager.models import Item
+from modules.item_manager.sync import ItemChanges
+
+
+class ORJSONResponse(Response):
+    """
+    JSON response rendered with orjson.
+
+    Accepts already encoded bytes (passed through untouched) or any
+    orjson-serializable object.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return bytes(content)
+        return orjson.dumps(content)
+
+
+def item_to_dict(item: Item) -> Dict[str, Any]:
+    """
+    Convert domain Item to the ItemResponse shape.
+
+    datetime values are left as-is; orjson renders them in ISO 8601 format.
+    """
+    return {
+        "id": item.id,
+        "owner_id": item.owner_id,
+        "label": item.label,
+        "content_type": item.content_type,
+        "payload": item.payload,
+        "tags": item.tags,
+        "created_at": item.created_at,
+        "updated_at": item.updated_at,
+    }
+
+
+def encode_item(item: Item) -> bytes:
+    """Encode a single Item as ItemResponse JSON bytes."""
+    return orjson.dumps(item_to_dict(item))
+
+
+def encode_item_list(items: Iterable[Item], total: int, limit: int, offset: int) -> bytes:
+    """Encode a page of Items as ItemListResponse JSON bytes."""
+    return orjson.dumps({
+        "items": [item_to_dict(item) for item in items],
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+    })
+
+
+def encode_item_lookup(item_ids: List[str], items: List[Optional[Item]]) -> bytes:
+    """Encode multi-get results as ItemMultiGetResponse JSON bytes."""
+    return orjson.dumps({
+        "items": [
+            {"id": item_id, "found": item is not None, "item": item_to_dict(item) if item else None}
+            for item_id, item in zip(item_ids, items)
+        ],
+    })
+
+
+def encode_item_changes(changes: ItemChanges) -> bytes:
+    """Encode a delta sync page as ItemChangesResponse JSON bytes."""
+    return orjson.dumps({
+        "items": [item_to_dict(item) for item in changes.items],
+        "deleted": [{"id": item.id, "deleted_at": item.deleted_at} for item in changes.deleted],
+        "watermark": changes.watermark,
+        "has_more": changes.has_more,
+    })
@@ -3,26 +3,36 @@ Item API Routes
 
 Compliant with REQ-000 Infrastructure Standards.
 """
-from fastapi import APIRouter, HTTPException, Query, Depends, Request
+from fastapi import APIRouter, HTTPException, Query, Depends, Header
+from fastapi.responses import StreamingResponse
 from typing import Optional, List
 
 from modules.item_manager.models import Item
 from modules.item_manager.repository import ItemRepository
 from modules.item_manager.exceptions import ItemNotFoundError
-from api.schemas.items import ItemCreate, ItemUpdate, ItemResponse, ItemListResponse
-from api.dependencies import get_item_repository, get_current_user
+from api.schemas.items import (
+    ItemCreate, ItemUpdate, ItemPatch, ItemResponse, ItemListResponse,
+    ItemMultiGetRequest, ItemMultiGetResponse, ItemChangesResponse
+)
+from api.responses import (
+    ORJSONResponse, encode_item, encode_item_list, encode_item_lookup, encode_item_changes
+)
+from api.dependencies import get_item_repository, get_current_user, get_event_broker
+from api.sse import item_event_stream, parse_last_event_id
 from adapters.auth import UserInfo
+from infrastructure.config import config
 from infrastructure.logging import get_logger
 from api.rate_limit import limiter
 
 router = APIRouter(prefix="/items", tags=["items"])
 logger = get_logger()
 
+# Per user and route, shared across workers (see api.rate_limit)
+write_rate_limit = limiter.limit("20/minute")
 
-@router.post("", response_model=ItemResponse, status_code=201)
-@limiter.limit("20/minute")
+
+@router.post("", response_model=ItemResponse, status_code=201, dependencies=[Depends(write_rate_limit)])
 async def create_item(
-    request: Request,
     data: ItemCreate,
     current_user: UserInfo = Depends(get_current_user),
     repo: ItemRepository = Depends(get_item_repository)
@@ -45,16 +55,7 @@ async def create_item(
 
     saved = repo.save(item)
 
-    return ItemResponse(
-        id=saved.id,
-        owner_id=saved.owner_id,
-        label=saved.label,
-        content_type=saved.content_type,
-        payload=saved.payload,
-        tags=saved.tags,
-        created_at=saved.created_at,
-        updated_at=saved.updated_at
-    )
+    return ORJSONResponse(encode_item(saved), status_code=201)
 
 
 @router.get("", response_model=ItemListResponse)
@@ -90,26 +91,94 @@ async def list_items(
         offset=offset
     )
 
-    return ItemListResponse(
-        items=[
-            ItemResponse(
-                id=item.id,
-                owner_id=item.owner_id,
-                label=item.label,
-                content_type=item.content_type,
-                payload=item.payload,
-                tags=item.tags,
-                created_at=item.created_at,
-                updated_at=item.updated_at
-            )
-            for item in items
-        ],
+    return ORJSONResponse(encode_item_list(
+        items,
         total=len(items),  # TODO: Separate count query for pagination
         limit=limit,
         offset=offset
+    ))
+
+
+@router.get("/changes", response_model=ItemChangesResponse)
+async def list_item_changes(
+    since: Optional[str] = Query(None, description="Watermark from the previous sync"),
+    limit: int = Query(500, ge=1, le=1000),
+    current_user: UserInfo = Depends(get_current_user),
+    repo: ItemRepository = Depends(get_item_repository)
+):
+    """
+    Delta sync for offline clients.
+
+    Returns items created or updated since the watermark, tombstones for
+    items deleted since then, and the new watermark to send next time.
+    Omit `since` for the initial sync. While has_more is true, call again
+    with the returned watermark. Changes from the last SYNC_SETTLE_SECONDS
+    are sent again on every sync; apply them by id.
+    Requires authentication via Bearer token.
+    """
+    owner_id = current_user.user_id
+    changes = repo.changes_since(owner_id, watermark=since, limit=limit)
+
+    logger.debug(
+        "item_changes_synced",
+        owner_id=owner_id,
+        changed=len(changes.items),
+        deleted=len(changes.deleted),
+        has_more=changes.has_more
+    )
+    return ORJSONResponse(encode_item_changes(changes))
+
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}, "description": "SSE change feed"}}
+)
+async def stream_item_events(
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    current_user: UserInfo = Depends(get_current_user)
+):
+    """
+    Server-Sent Events feed of item changes for the authenticated user.
+
+    Events: item.created, item.updated, item.deleted (data: type, item_id).
+    Reconnecting clients send Last-Event-ID to replay missed events; an
+    `reset` event means events were lost and the client must resync.
+    Idle connections receive a keep-alive comment every
+    SSE_HEARTBEAT_SECONDS.
+    """
+    broker = get_event_broker()
+    subscription = broker.subscribe(current_user.user_id, parse_last_event_id(last_event_id))
+    logger.info("item_stream_opened", owner_id=current_user.user_id, resumed=last_event_id is not None)
+
+    return StreamingResponse(
+        item_event_stream(broker, subscription, config.SSE_HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
 
 
+@router.post("/multi-get", response_model=ItemMultiGetResponse)
+async def multi_get_items(
+    data: ItemMultiGetRequest,
+    current_user: UserInfo = Depends(get_current_user),
+    repo: ItemRepository = Depends(get_item_repository)
+):
+    """
+    Get several items by ID in one request (max 100).
+
+    Requires authentication via Bearer token.
+    Results come back in request order; IDs that don't exist, are deleted
+    or belong to another user are returned with found=false.
+    """
+    owner_id = current_user.user_id
+    logger.debug("item_multi_get_start", owner_id=owner_id, count=len(data.ids))
+
+    items = repo.find_many_by_ids(data.ids, owner_id=owner_id)
+
+    return ORJSONResponse(encode_item_lookup(data.ids, items))
+
+
 @router.get("/{item_id}", response_model=ItemResponse)
 async def get_item(
     item_id: str,
@@ -132,22 +201,11 @@ async def get_item(
         logger.warning("item_access_denied", item_id=item_id, owner_id=item.owner_id, requester_id=current_user.user_id)
         raise HTTPException(status_code=404, detail="Item not found")
 
-    return ItemResponse(
-        id=item.id,
-        owner_id=item.owner_id,
-        label=item.label,
-        content_type=item.content_type,
-        payload=item.payload,
-        tags=item.tags,
-        created_at=item.created_at,
-        updated_at=item.updated_at
-    )
+    return ORJSONResponse(encode_item(item))
 
 
-@router.put("/{item_id}", response_model=ItemResponse)
-@limiter.limit("20/minute")
+@router.put("/{item_id}", response_model=ItemResponse, dependencies=[Depends(write_rate_limit)])
 async def update_item(
-    request: Request,
     item_id: str,
     data: ItemUpdate,
     current_user: UserInfo = Depends(get_current_user),
@@ -181,22 +239,36 @@ async def update_item(
 
     updated = repo.update(item)
 
-    return ItemResponse(
-        id=updated.id,
-        owner_id=updated.owner_id,
-        label=updated.label,
-        content_type=updated.content_type,
-        payload=updated.payload,
-        tags=updated.tags,
-        created_at=updated.created_at,
-        updated_at=updated.updated_at
-    )
+    return ORJSONResponse(encode_item(updated))
+
+
+@router.patch("/{item_id}", response_model=ItemResponse, dependencies=[Depends(write_rate_limit)])
+async def patch_item(
+    item_id: str,
+    data: ItemPatch,
+    current_user: UserInfo = Depends(get_current_user),
+    repo: ItemRepository = Depends(get_item_repository)
+):
+    """
+    Partially update an item (RFC 7386 JSON Merge Patch).
+
+    Accepts application/json or application/merge-patch+json.
+    Only the fields sent are changed; payload keys are merged (null removes
+    a key). Requires authentication via Bearer token.
+    Only patches item if owned by authenticated user.
+    """
+    changes = data.model_dump(exclude_unset=True)
+    updated = repo.patch(item_id, changes, owner_id=current_user.user_id)
+
+    if not updated:
+        raise HTTPException(status_code=404, detail="Item not found")
+
+    logger.info("item_patched", item_id=item_id, fields=sorted(changes))
+    return ORJSONResponse(encode_item(updated))
 
 
-@router.delete("/{item_id}", status_code=204)
-@limiter.limit("20/minute")
+@router.delete("/{item_id}", status_code=204, dependencies=[Depends(write_rate_limit)])
 async def delete_item(
-    request: Request,
     item_id: str,
     current_user: UserInfo = Depends(get_current_user),
     repo: ItemRepository = Depends(get_item_repository)
@@ -4,6 +4,12 @@ API Schemas
 from .items import (
     ItemCreate,
     ItemUpdate,
+    ItemPatch,
     ItemResponse,
-    ItemListResponse
+    ItemListResponse,
+    ItemMultiGetRequest,
+    ItemMultiGetResult,
+    ItemMultiGetResponse,
+    ItemTombstone,
+    ItemChangesResponse
 )
@@ -1,7 +1,7 @@
 """
 Item API Schemas
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -22,6 +22,29 @@ class ItemUpdate(BaseModel):
     tags: Optional[List[str]] = None
 
 
+class ItemPatch(BaseModel):
+    """
+    Request schema for partial updates (RFC 7386 JSON Merge Patch).
+
+    payload is merged recursively (null removes a key); tags replaces the
+    list, tags_add / tags_remove modify it.
+    """
+    label: Optional[str] = Field(None, min_length=1, max_length=255)
+    content_type: Optional[str] = Field(None, max_length=100)
+    payload: Optional[Dict[str, Any]] = None
+    tags: Optional[List[str]] = None
+    tags_add: List[str] = Field(default_factory=list)
+    tags_remove: List[str] = Field(default_factory=list)
+
+    @field_validator("label", "content_type")
+    @classmethod
+    def not_null(cls, value: Optional[str]) -> str:
+        """Required item fields cannot be removed via null"""
+        if value is None:
+            raise ValueError("cannot be null")
+        return value
+
+
 class ItemResponse(BaseModel):
     """Response schema for a single item"""
     id: str
@@ -43,3 +66,34 @@ class ItemListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+
+
+class ItemMultiGetRequest(BaseModel):
+    """Request schema for fetching several items by ID"""
+    ids: List[str] = Field(..., min_length=1, max_length=100)
+
+
+class ItemMultiGetResult(BaseModel):
+    """One multi-get result; item is null when not found"""
+    id: str
+    found: bool
+    item: Optional[ItemResponse]
+
+
+class ItemMultiGetResponse(BaseModel):
+    """Response schema for multi-get, in request order"""
+    items: List[ItemMultiGetResult]
+
+
+class ItemTombstone(BaseModel):
+    """Soft-deleted item in a delta sync"""
+    id: str
+    deleted_at: datetime
+
+
+class ItemChangesResponse(BaseModel):
+    """Response schema for delta sync (changes since a watermark)"""
+    items: List[ItemResponse]
+    deleted: List[ItemTombstone]
+    watermark: Optional[str]
+    has_more: bool
@@ -0,0 +1,261 @@
+"""
+Production Server
+
+Pre-fork runner: imports the app once, binds the socket, then forks N
+uvicorn workers that share it.
+
+    python -m api.server [--workers N] [--host H] [--port P]
+
+- Preload: import errors fail the deploy before any worker starts, and
+  workers share the app's memory pages copy-on-write.
+- Per fork: the SQLAlchemy pool is disposed (close=False: never touch the
+  parent's connections) and the logging QueueListener thread is restarted.
+- SIGTERM/SIGINT: forwarded to the workers, which stop accepting, finish
+  in-flight requests (up to GRACEFUL_TIMEOUT_SECONDS), run the lifespan
+  shutdown (flushes logs) and exit. Stragglers are killed afterwards.
+- Crashed workers are replaced; a worker failing its startup (exit 3)
+  stops the server. Workers dying within MIN_UPTIME_SECONDS of their
+  start are respawned with an exponential delay per slot (no fork storm
+  on a crash-on-first-request bug).
+- Metrics: workers write to METRICS_MULTIPROC_DIR (emptied on start),
+  GET /metrics on any worker aggregates all of them.
+
+Development keeps using `uvicorn api.main:app --reload`.
+"""
+import argparse
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import uvicorn
+
+from infrastructure.config import config
+from infrastructure.logging import get_logger
+from infrastructure.logging.handlers import restart_async_handlers, stop_async_handlers
+
+logger = get_logger("api.server")
+
+# uvicorn's exit code when startup (e.g. lifespan) fails
+STARTUP_FAILURE = 3
+
+# Time for the lifespan shutdown after the drain, before SIGKILL
+KILL_MARGIN_SECONDS = 5.0
+
+# Respawn backoff for workers exiting sooner than MIN_UPTIME_SECONDS
+MIN_UPTIME_SECONDS = 10.0
+RESPAWN_DELAY_SECONDS = 1.0
+MAX_RESPAWN_DELAY_SECONDS = 30.0
+
+
+class PreforkServer:
+    """Forks and supervises uvicorn workers on one shared socket."""
+
+    def __init__(self, uvicorn_config: uvicorn.Config, workers: int, graceful_timeout: float):
+        """
+        Args:
+            uvicorn_config: Worker config (app already imported)
+            workers: Number of worker processes
+            graceful_timeout: Seconds workers get to drain on shutdown
+        """
+        self.config = uvicorn_config
+        self.workers = workers
+        self.graceful_timeout = graceful_timeout
+        self.children: Dict[int, Tuple[int, float]] = {}  # pid -> (slot, start time)
+        self.respawn_delays: Dict[int, float] = {}  # slot -> last delay
+        self.respawn_at: Dict[int, float] = {}  # slot -> due time
+        self.should_exit = False
+        self.exit_code = 0
+
+    def run(self) -> int:
+        """Run until SIGTERM/SIGINT; returns the process exit code."""
+        self.config.load()
+        sock = self.config.bind_socket()
+
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, self._handle_exit)
+
+        logger.info("server_starting", workers=self.workers, pid=os.getpid())
+        for slot in range(self.workers):
+            self._spawn(sock, slot)
+
+        while not self.should_exit:
+            self._reap(sock)
+            time.sleep(0.5)
+
+        self._shutdown()
+        sock.close()
+        logger.info("server_stopped", exit_code=self.exit_code)
+        stop_async_handlers()
+        return self.exit_code
+
+    def _handle_exit(self, sig: int, frame) -> None:
+        self.should_exit = True
+
+    def _spawn(self, sock: socket.socket, slot: int) -> None:
+        # Flush and stop the log thread: a fork must not copy a queue lock
+        # held by it, and the thread itself would be missing in the child
+        stop_async_handlers()
+        pid = os.fork()
+        if pid == 0:
+            self._run_worker(sock)
+        restart_async_handlers()
+        self.children[pid] = (slot, time.monotonic())
+        logger.info("worker_started", worker_pid=pid, slot=slot)
+
+    def _run_worker(self, sock: socket.socket) -> None:
+        """Child process: never returns."""
+        exit_code = 1
+        try:
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(sig, signal.SIG_DFL)
+            restart_async_handlers()
+
+            from infrastructure.database_sqlalchemy import engine
+            engine.dispose(close=False)
+
+            server = uvicorn.Server(self.config)
+            server.run(sockets=[sock])
+            exit_code = 0 if server.started else STARTUP_FAILURE
+        except BaseException:
+            logger.exception("worker_crashed", worker_pid=os.getpid())
+        finally:
+            stop_async_handlers()
+            # os._exit skips interpreter cleanup, including stdio buffers
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(exit_code)
+
+    def _reap(self, sock: socket.socket) -> None:
+        """Collect exited workers and replace them (delayed if crash-looping)."""
+        now = time.monotonic()
+        for pid, code in self._collect_exited():
+            if pid not in self.children:
+                continue
+            slot, started = self.children.pop(pid)
+            uptime = now - started
+            mark_worker_dead(pid)
+            logger.warning("worker_exited", worker_pid=pid, slot=slot, exit_code=code, uptime_s=round(uptime, 1))
+            if code == STARTUP_FAILURE:
+                logger.error("worker_startup_failed", worker_pid=pid)
+                self.exit_code = STARTUP_FAILURE
+                self.should_exit = True
+            else:
+                self.respawn_at[slot] = now + self._respawn_delay(slot, uptime)
+
+        for slot, due in list(self.respawn_at.items()):
+            if self.should_exit:
+                break
+            if due <= now:
+                del self.respawn_at[slot]
+                self._spawn(sock, slot)
+
+    def _respawn_delay(self, slot: int, uptime: float) -> float:
+        """0 after a worker ran long enough, else double the slot's last delay."""
+        if uptime >= MIN_UPTIME_SECONDS:
+            self.respawn_delays.pop(slot, None)
+            return 0.0
+        previous = self.respawn_delays.get(slot)
+        delay = min(previous * 2, MAX_RESPAWN_DELAY_SECONDS) if previous else RESPAWN_DELAY_SECONDS
+        self.respawn_delays[slot] = delay
+        if delay >= MAX_RESPAWN_DELAY_SECONDS:
+            logger.error("worker_crash_loop", slot=slot, uptime_s=round(uptime, 1), respawn_delay_s=delay)
+        return delay
+
+    def _collect_exited(self) -> List[tuple]:
+        exited = []
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            exited.append((pid, os.waitstatus_to_exitcode(status)))
+        return exited
+
+    def _shutdown(self) -> None:
+        """Let workers drain, then kill stragglers."""
+        logger.info("server_draining", workers=len(self.children), timeout_s=self.graceful_timeout)
+        self._signal_children(signal.SIGTERM)
+
+        deadline = time.monotonic() + self.graceful_timeout + KILL_MARGIN_SECONDS
+        while self.children and time.monotonic() < deadline:
+            for pid, _ in self._collect_exited():
+                self.children.pop(pid, None)
+            time.sleep(0.1)
+
+        if self.children:
+            logger.warning("workers_killed", worker_pids=list(self.children))
+            self._signal_children(signal.SIGKILL)
+            for pid in list(self.children):
+                try:
+                    os.waitpid(pid, 0)
+                except ChildProcessError:
+                    pass
+            self.children.clear()
+
+    def _signal_children(self, sig: int) -> None:
+        for pid in self.children:
+            try:
+                os.kill(pid, sig)
+            except ProcessLookupError:
+                pass
+
+
+def prepare_metrics_dir(path: str) -> None:
+    """
+    Enable prometheus_client multi-process mode with an empty directory.
+
+    Must run before prometheus_client is imported: it picks the value
+    backend (in-memory vs. mmap files) at import time.
+    """
+    if not config.METRICS_ENABLED:
+        return
+    path = os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", path)
+    os.makedirs(path, exist_ok=True)
+    for name in os.listdir(path):
+        if name.endswith(".db"):
+            os.remove(os.path.join(path, name))
+
+
+def mark_worker_dead(pid: int) -> None:
+    """Drop the live gauges of an exited worker (counters are kept)."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(pid)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="ChrisBuilds64 API production server")
+    parser.add_argument("--host", default=config.HOST)
+    parser.add_argument("--port", type=int, default=config.PORT)
+    parser.add_argument("--workers", type=int, default=config.WEB_CONCURRENCY or os.cpu_count() or 1)
+    parser.add_argument("--graceful-timeout", type=float, default=config.GRACEFUL_TIMEOUT_SECONDS)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    prepare_metrics_dir(config.METRICS_MULTIPROC_DIR)
+
+    # Preload: import the app (and its logging setup) in the parent
+    from api.main import app
+
+    uvicorn_config = uvicorn.Config(
+        app,
+        host=args.host,
+        port=args.port,
+        lifespan="on",
+        access_log=False,  # LoggingMiddleware logs requests
+        log_config=None,  # keep our structlog setup
+        timeout_graceful_shutdown=args.graceful_timeout,
+    )
+    return PreforkServer(uvicorn_config, args.workers, args.graceful_timeout).run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+Server-Sent Events
+
+Encoding and streaming of item change events (GET /items/stream).
+https://html.spec.whatwg.org/multipage/server-sent-events.html
+"""
+import asyncio
+from typing import AsyncIterator, Optional
+
+import orjson
+
+from adapters.events.base import EventBroker, Subscription
+
+# Client reconnect delay (ms) sent with the first message
+RETRY_MS = 3000
+
+HEARTBEAT = b": keep-alive\n\n"
+
+
+def format_event(event) -> bytes:
+    """Encode an ItemEvent as an SSE message."""
+    data = orjson.dumps({"type": event.type, "item_id": event.item_id})
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (event.id, event.type.encode(), data)
+
+
+def format_reset() -> bytes:
+    """Tell the client it missed events and must resync."""
+    return b"event: reset\ndata: {}\n\n"
+
+
+def parse_last_event_id(value: Optional[str]) -> Optional[int]:
+    """Parse Last-Event-ID header (None if missing or malformed)."""
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+async def item_event_stream(
+    broker: EventBroker,
+    subscription: Subscription,
+    heartbeat_interval: float,
+) -> AsyncIterator[bytes]:
+    """
+    Yield SSE messages for a subscription until the client disconnects.
+
+    Sends a heartbeat comment when idle for heartbeat_interval seconds so
+    proxies keep the connection open and dead clients are detected.
+    """
+    try:
+        yield b"retry: %d\n\n" % RETRY_MS
+
+        if subscription.reset:
+            yield format_reset()
+        for event in subscription.replay:
+            yield format_event(event)
+
+        while not subscription.overflowed:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), heartbeat_interval)
+            except asyncio.TimeoutError:
+                yield HEARTBEAT
+                continue
+            yield format_event(event)
+
+        # Client too slow: ask it to resync on reconnect
+        yield format_reset()
+    finally:
+        broker.unsubscribe(subscription)
@@ -0,0 +1,365 @@
+"""
+Static Assets
+
+Serves a frontend app directory (/app/<name>/*) from a manifest built once
+at startup instead of stat()ing the file system on every request.
+
+Per file the manifest holds:
+- media type, content-hash ETag, Last-Modified
+- encoded variants: precompressed `.br` / `.gz` siblings from the build,
+  otherwise (small compressible files) compressed once at startup
+- the bytes of small files (served from memory); larger files are sent
+  with FileResponse (zero-copy `http.response.pathsend` where the server
+  supports it, 64 KB chunks otherwise)
+
+Caching:
+- fingerprinted names (app.3f2a9c1d.js): `public, max-age=31536000, immutable`
+- everything else: `no-cache` (revalidated with If-None-Match -> 304)
+
+Dotfiles are never served. With `revalidate=True` (development) changed
+files are re-indexed on request. Variants sent from disk are always
+re-stat()ed first: a file replaced on a mounted volume is re-indexed
+instead of being sent with its old Content-Length. The manifest is built at import, so
+pre-fork workers (api/server.py) share it copy-on-write.
+"""
+import gzip
+import hashlib
+import os
+import posixpath
+import re
+import stat
+import time
+from dataclasses import dataclass, field
+from email.utils import formatdate, parsedate_to_datetime
+from mimetypes import guess_type
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, RedirectResponse, Response
+from starlette.types import Receive, Scope, Send
+
+from api.middleware.compression import DEFAULT_COMPRESSIBLE_TYPES, negotiate_encoding
+from infrastructure.logging import get_logger
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+logger = get_logger("api.static")
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+# Hex hash of 8+ chars with at least one digit and one letter between
+# separators: app.3f2a9c1d.js, chunk-5b1e0a7f9c.css (not photo-20231012.jpg)
+FINGERPRINT = re.compile(r"[.-](?=[0-9a-f]*[0-9])(?=[0-9a-f]*[a-f])[0-9a-f]{8,}\.[^/]+$")
+
+# Content coding -> file suffix of precompressed siblings
+SIBLINGS = {"br": ".br", "gzip": ".gz"}
+ENCODING_PREFERENCE = ("br", "gzip")
+
+# Startup compression only pays off above this size
+PRECOMPRESS_MIN_SIZE = 1024
+
+
+@dataclass
+class Variant:
+    """One representation (identity or encoded) of an asset."""
+    path: str
+    stat_result: os.stat_result  # of the file on disk (identity for startup-compressed)
+    etag: str
+    body: Optional[bytes] = None  # None: send from disk
+
+
+@dataclass
+class Asset:
+    """Manifest entry of one file."""
+    relpath: str
+    media_type: str
+    immutable: bool
+    last_modified: str
+    variants: Dict[str, Variant] = field(default_factory=dict)  # "identity", "br", "gzip"
+
+    @property
+    def encodings(self) -> tuple:
+        return tuple(e for e in ENCODING_PREFERENCE if e in self.variants)
+
+
+def _is_hidden(relpath: str) -> bool:
+    return any(part.startswith(".") for part in relpath.split("/"))
+
+
+def _content_hash(path: str, body: Optional[bytes]) -> str:
+    if body is not None:
+        return hashlib.blake2b(body, digest_size=10).hexdigest()
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=10)).hexdigest()
+
+
+def _changed_on_disk(variant: Variant) -> bool:
+    try:
+        current = os.stat(variant.path)
+    except OSError:
+        return True
+    known = variant.stat_result
+    return (known.st_mtime_ns, known.st_size) != (current.st_mtime_ns, current.st_size)
+
+
+def _compress(encoding: str, body: bytes) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=11)
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+class StaticAssets:
+    """
+    ASGI app serving one directory from an in-memory manifest.
+
+    Usage:
+        >>> app.mount("/app/feldorakel", StaticAssets("apps/feldorakel"))
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        html: bool = True,
+        memory_max_bytes: int = 64 * 1024,
+        precompress: bool = True,
+        revalidate: bool = False,
+    ):
+        """
+        Args:
+            directory: Root directory to serve
+            html: Serve index.html for directories and 404.html if present
+            memory_max_bytes: Files up to this size are kept in memory
+            precompress: Compress small text assets at startup when the
+                build shipped no .br/.gz sibling
+            revalidate: stat() files per request and re-index changes (dev)
+        """
+        self.directory = os.path.realpath(directory)
+        self.html = html
+        self.memory_max_bytes = memory_max_bytes
+        self.precompress = precompress
+        self.revalidate = revalidate
+        self.manifest: Dict[str, Asset] = {}
+        self.build()
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    def build(self) -> None:
+        """(Re)index the whole directory."""
+        start = time.perf_counter()
+        manifest: Dict[str, Asset] = {}
+        for root, dirs, files in os.walk(self.directory):
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            for name in files:
+                relpath = os.path.relpath(os.path.join(root, name), self.directory).replace(os.sep, "/")
+                if self._is_sibling(relpath):
+                    continue
+                asset = self._index(relpath)
+                if asset is not None:
+                    manifest[relpath] = asset
+        self.manifest = manifest
+
+        logger.info(
+            "static_manifest_built",
+            directory=self.directory,
+            files=len(manifest),
+            memory_bytes=sum(
+                len(v.body) for a in manifest.values() for v in a.variants.values() if v.body is not None
+            ),
+            duration_ms=round((time.perf_counter() - start) * 1000, 1)
+        )
+
+    def _is_sibling(self, relpath: str) -> bool:
+        """Precompressed sibling of an indexed file (served as a variant)."""
+        for suffix in SIBLINGS.values():
+            if relpath.endswith(suffix) and os.path.isfile(self._abspath(relpath[:-len(suffix)])):
+                return True
+        return False
+
+    def _abspath(self, relpath: str) -> str:
+        return os.path.join(self.directory, *relpath.split("/"))
+
+    def _load(self, path: str) -> Optional[tuple]:
+        """(stat, body or None) of a regular file inside the directory."""
+        if not os.path.realpath(path).startswith(self.directory + os.sep):
+            return None  # symlink pointing outside
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(stat_result.st_mode):
+            return None
+        body = None
+        if stat_result.st_size <= self.memory_max_bytes:
+            with open(path, "rb") as f:
+                body = f.read()
+        return stat_result, body
+
+    def _index(self, relpath: str) -> Optional[Asset]:
+        if _is_hidden(relpath):
+            return None
+        path = self._abspath(relpath)
+        loaded = self._load(path)
+        if loaded is None:
+            return None
+        stat_result, body = loaded
+
+        digest = _content_hash(path, body)
+        media_type = guess_type(relpath)[0] or "application/octet-stream"
+        asset = Asset(
+            relpath=relpath,
+            media_type=media_type,
+            immutable=bool(FINGERPRINT.search(posixpath.basename(relpath))),
+            last_modified=formatdate(stat_result.st_mtime, usegmt=True),
+        )
+        asset.variants["identity"] = Variant(path, stat_result, f'"{digest}"', body)
+
+        for encoding, suffix in SIBLINGS.items():
+            sibling = self._load(path + suffix)
+            if sibling is not None:
+                asset.variants[encoding] = Variant(path + suffix, sibling[0], f'"{digest}-{encoding}"', sibling[1])
+
+        if (
+            self.precompress
+            and body is not None
+            and len(asset.variants) == 1
+            and len(body) >= PRECOMPRESS_MIN_SIZE
+            and media_type.startswith(DEFAULT_COMPRESSIBLE_TYPES)
+        ):
+            for encoding in ENCODING_PREFERENCE:
+                if encoding == "br" and brotli is None:
+                    continue
+                encoded = _compress(encoding, body)
+                if len(encoded) < len(body) * 0.9:
+                    asset.variants[encoding] = Variant(path, stat_result, f'"{digest}-{encoding}"', encoded)
+        return asset
+
+    def _refresh(self, relpath: str, asset: Optional[Asset]) -> Optional[Asset]:
+        """Re-index a file whose size/mtime changed (revalidate mode)."""
+        if _is_hidden(relpath) or ".." in relpath.split("/"):
+            return None
+        try:
+            current = os.stat(self._abspath(relpath))
+        except OSError:
+            self.manifest.pop(relpath, None)
+            return None
+        if asset is not None:
+            known = asset.variants["identity"].stat_result
+            if (known.st_mtime_ns, known.st_size) == (current.st_mtime_ns, current.st_size):
+                return asset
+        return self._reindex(relpath)
+
+    def _reindex(self, relpath: str) -> Optional[Asset]:
+        asset = self._index(relpath)
+        if asset is None:
+            self.manifest.pop(relpath, None)
+        else:
+            self.manifest[relpath] = asset
+        return asset
+
+    def lookup(self, relpath: str) -> Optional[Asset]:
+        asset = self.manifest.get(relpath)
+        if self.revalidate:
+            asset = self._refresh(relpath, asset)
+        return asset
+
+    # ------------------------------------------------------------------
+    # Serving
+    # ------------------------------------------------------------------
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        assert scope["type"] == "http"
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405)
+
+        route_path = scope["path"][len(scope.get("root_path", "")):]
+        relpath = route_path.lstrip("/")
+        status_code = 200
+
+        asset = self.lookup(relpath) if relpath and not relpath.endswith("/") else None
+        if asset is None and self.html:
+            index = posixpath.join(relpath, "index.html")
+            if relpath.endswith("/") or not relpath:
+                asset = self.lookup(index)
+            elif self.lookup(index) is not None:
+                # Directory without trailing slash: redirect so relative URLs resolve
+                url = scope["path"] + "/"
+                if scope.get("query_string"):
+                    url += "?" + scope["query_string"].decode("latin-1")
+                await RedirectResponse(url=url)(scope, receive, send)
+                return
+            if asset is None:
+                asset = self.lookup("404.html")
+                status_code = 404
+        if asset is None:
+            raise HTTPException(status_code=404)
+
+        response = self.file_response(asset, Headers(scope=scope), status_code)
+        await response(scope, receive, send)
+
+    def file_response(self, asset: Asset, request_headers: Headers, status_code: int = 200) -> Response:
+        """Pick the variant, answer conditionals, build the response."""
+        encoding, variant = self._select(asset, request_headers)
+        if variant.body is None and _changed_on_disk(variant):
+            # Replaced since indexing: FileResponse would announce the old
+            # Content-Length and the client would get a truncated body
+            asset = self._reindex(asset.relpath)
+            if asset is None:
+                raise HTTPException(status_code=404)
+            encoding, variant = self._select(asset, request_headers)
+
+        headers = {
+            "ETag": variant.etag,
+            "Cache-Control": IMMUTABLE if asset.immutable else REVALIDATE,
+            "Last-Modified": asset.last_modified,
+        }
+        if len(asset.variants) > 1:
+            headers["Vary"] = "Accept-Encoding"
+
+        if status_code == 200 and self._not_modified(asset, variant, request_headers):
+            return Response(status_code=304, headers=headers)
+
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        if variant.body is not None:
+            return Response(variant.body, status_code=status_code, headers=headers, media_type=asset.media_type)
+        return FileResponse(
+            variant.path,
+            status_code=status_code,
+            headers=headers,
+            media_type=asset.media_type,
+            stat_result=variant.stat_result
+        )
+
+    @staticmethod
+    def _select(asset: Asset, request_headers: Headers) -> tuple:
+        """(encoding or None, variant) to send."""
+        # Byte ranges refer to the identity representation
+        encoding = None
+        if "range" not in request_headers and len(asset.variants) > 1:
+            encoding = negotiate_encoding(request_headers.get("accept-encoding", ""), asset.encodings)
+        return encoding, asset.variants[encoding or "identity"]
+
+    @staticmethod
+    def _not_modified(asset: Asset, variant: Variant, request_headers: Headers) -> bool:
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            if if_none_match.strip() == "*":
+                return True
+            # Weak comparison (RFC 9110 13.1.2)
+            return variant.etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+        if_modified_since = request_headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(asset.variants["identity"].stat_result.st_mtime) <= since
+        return False
@@ -0,0 +1,121 @@
+"""
+Benchmark: item list serialization
+
+Compares the previous path (ItemResponse built by hand, re-validated
+against response_model, serialized by FastAPI) with the orjson encoder
+in api/responses.py, on 100 and 1000 item pages.
+
+Also measures the full GET /api/v1/items round trip via TestClient.
+
+Usage:
+    cd services/backend
+    python benchmarks/bench_item_serialization.py
+"""
+import os
+import sys
+import timeit
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("ENV", "test")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.dependencies import get_database_adapter
+from api.responses import encode_item_list
+from api.schemas.items import ItemResponse, ItemListResponse
+from adapters.database.mock import MockDatabaseAdapter
+from modules.item_manager.models import Item
+
+PAGE_SIZES = (100, 1000)
+OWNER_ID = "mock-user-chris-123"
+
+
+def make_items(count: int) -> list:
+    """Items with a realistic payload (nested dict, a few tags)."""
+    return [
+        Item(
+            id=f"item-{i:05d}",
+            owner_id=OWNER_ID,
+            label=f"Item {i}",
+            content_type="app/address",
+            payload={
+                "street": "Hauptstrasse 1",
+                "city": "Wien",
+                "geo": {"lat": 48.2082, "lon": 16.3738},
+                "notes": "x" * 200,
+            },
+            tags=["home", "favourite", f"tag-{i % 7}"],
+            created_at=datetime(2026, 1, 13, 14, 0, 0, i % 1000000),
+            updated_at=datetime(2026, 1, 14, 9, 30, 0),
+        )
+        for i in range(count)
+    ]
+
+
+def legacy_encode(items: list, limit: int) -> bytes:
+    """Previous route path: build models, re-validate, serialize."""
+    response = ItemListResponse(
+        items=[
+            ItemResponse(
+                id=item.id,
+                owner_id=item.owner_id,
+                label=item.label,
+                content_type=item.content_type,
+                payload=item.payload,
+                tags=item.tags,
+                created_at=item.created_at,
+                updated_at=item.updated_at
+            )
+            for item in items
+        ],
+        total=len(items),
+        limit=limit,
+        offset=0
+    )
+    # FastAPI validates the returned object against response_model again
+    validated = ItemListResponse.model_validate(response, from_attributes=True)
+    return validated.model_dump_json().encode()
+
+
+def fast_encode(items: list, limit: int) -> bytes:
+    """New route path: one orjson pass."""
+    return encode_item_list(items, total=len(items), limit=limit, offset=0)
+
+
+def bench_encode(count: int, number: int) -> None:
+    items = make_items(count)
+    legacy = min(timeit.repeat(lambda: legacy_encode(items, count), number=number, repeat=5)) / number
+    fast = min(timeit.repeat(lambda: fast_encode(items, count), number=number, repeat=5)) / number
+    print(
+        f"encode  {count:>5} items: legacy {legacy * 1000:8.3f} ms  "
+        f"orjson {fast * 1000:8.3f} ms  speedup {legacy / fast:5.1f}x"
+    )
+
+
+def bench_http(count: int, number: int) -> None:
+    db = MockDatabaseAdapter()
+    for item in make_items(count):
+        db.save(item)
+
+    app.dependency_overrides[get_database_adapter] = lambda: db
+    try:
+        with TestClient(app) as client:
+            headers = {"Authorization": "Bearer test-chris"}
+            url = f"/api/v1/items?limit={count}"
+            assert client.get(url, headers=headers).status_code == 200
+            elapsed = min(timeit.repeat(lambda: client.get(url, headers=headers), number=number, repeat=3)) / number
+    finally:
+        app.dependency_overrides.clear()
+
+    print(f"http    {count:>5} items: GET /api/v1/items {elapsed * 1000:8.3f} ms/request")
+
+
+if __name__ == "__main__":
+    for size in PAGE_SIZES:
+        bench_encode(size, number=200 if size == 100 else 20)
+    for size in PAGE_SIZES:
+        bench_http(size, number=50 if size == 100 else 10)
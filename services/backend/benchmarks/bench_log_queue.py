@@ -0,0 +1,57 @@
+"""
+Benchmark: async log listener throughput
+
+Fills the queue with rendered records and measures how fast the listener
+drains it into a file: stdlib QueueListener + StreamHandler (flush per
+record) vs BatchingQueueListener + BufferedStreamHandler (flush per
+batch).
+
+Usage:
+    cd services/backend
+    python benchmarks/bench_log_queue.py
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+from logging.handlers import QueueListener
+from queue import Queue
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infrastructure.logging.handlers import BatchingQueueListener, BufferedStreamHandler
+
+RECORDS = 100_000
+LINE = (
+    '{"event": "request_completed", "status_code": 200, "duration_ms": 3.42, '
+    '"request_id": "9f1c2b7e-6a51-4d0e-a1f3-8f7f2c1d9e00", "method": "GET", '
+    '"path": "/api/v1/items", "level": "info", "timestamp": "2026-10-19T10:15:42.123456Z"}'
+)
+
+
+def records_per_second(make_listener, make_handler) -> float:
+    """Best of 3 runs."""
+    best = 0.0
+    for _ in range(3):
+        with tempfile.TemporaryFile("w") as out:
+            log_queue: Queue = Queue()
+            for _ in range(RECORDS):
+                log_queue.put(logging.LogRecord("bench", logging.INFO, __file__, 1, LINE, None, None))
+            listener = make_listener(log_queue, make_handler(out))
+            start = time.perf_counter()
+            listener.start()
+            listener.stop()
+            best = max(best, RECORDS / (time.perf_counter() - start))
+    return best
+
+
+def main() -> None:
+    stdlib = records_per_second(QueueListener, logging.StreamHandler)
+    batching = records_per_second(BatchingQueueListener, BufferedStreamHandler)
+    print(f"stdlib QueueListener   {stdlib:10,.0f} records/s")
+    print(f"BatchingQueueListener  {batching:10,.0f} records/s  ({batching / stdlib:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark: LoggingMiddleware throughput
+
+Compares the previous BaseHTTPMiddleware implementation with the pure ASGI
+LoggingMiddleware on /health and /api/v1/items (requests/sec, in-process
+via httpx.ASGITransport, fixed concurrency).
+
+Usage:
+    cd services/backend
+    python benchmarks/bench_logging_middleware.py
+"""
+import asyncio
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("ENV", "test")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import httpx
+import structlog
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from api.main import app
+from api.dependencies import get_database_adapter
+from adapters.database.mock import MockDatabaseAdapter
+from infrastructure.logging.middleware import LoggingMiddleware
+from modules.item_manager.models import Item
+
+REQUESTS = 2000
+CONCURRENCY = 20
+HEADERS = {"Authorization": "Bearer test-chris"}
+
+logger = structlog.get_logger()
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    """The BaseHTTPMiddleware implementation replaced by LoggingMiddleware."""
+
+    async def dispatch(self, request, call_next):
+        request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
+        structlog.contextvars.clear_contextvars()
+        structlog.contextvars.bind_contextvars(
+            request_id=request_id,
+            method=request.method,
+            path=request.url.path,
+            client_ip=request.client.host if request.client else None,
+        )
+        start_time = time.perf_counter()
+        logger.info(
+            "request_started",
+            query_params=dict(request.query_params) if request.query_params else None,
+        )
+        try:
+            response = await call_next(request)
+            logger.info(
+                "request_completed",
+                status_code=response.status_code,
+                duration_ms=round((time.perf_counter() - start_time) * 1000, 2),
+            )
+            response.headers["X-Request-ID"] = request_id
+            return response
+        finally:
+            structlog.contextvars.clear_contextvars()
+
+
+def use_logging_middleware(middleware_class) -> None:
+    """Swap the logging middleware in the app's stack and force a rebuild."""
+    app.user_middleware = [
+        Middleware(middleware_class) if m.cls in (LoggingMiddleware, LegacyLoggingMiddleware) else m
+        for m in app.user_middleware
+    ]
+    app.middleware_stack = None
+
+
+async def run(path: str) -> float:
+    """Return requests/sec for REQUESTS GETs at CONCURRENCY."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        queue = asyncio.Queue()
+        for _ in range(REQUESTS):
+            queue.put_nowait(None)
+
+        async def worker():
+            while not queue.empty():
+                queue.get_nowait()
+                response = await client.get(path, headers=HEADERS)
+                assert response.status_code == 200
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+        return REQUESTS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    db = MockDatabaseAdapter()
+    for i in range(20):
+        db.save(Item(owner_id="mock-user-chris-123", label=f"Item {i}", payload={"n": i}))
+    app.dependency_overrides[get_database_adapter] = lambda: db
+
+    for path in ("/health", "/api/v1/items"):
+        results = {}
+        for name, middleware_class in (("BaseHTTPMiddleware", LegacyLoggingMiddleware), ("pure ASGI", LoggingMiddleware)):
+            use_logging_middleware(middleware_class)
+            asyncio.run(run(path))  # warm-up
+            results[name] = max(asyncio.run(run(path)) for _ in range(3))
+        legacy, fast = results["BaseHTTPMiddleware"], results["pure ASGI"]
+        print(f"{path:<16} BaseHTTPMiddleware {legacy:8.0f} req/s  pure ASGI {fast:8.0f} req/s  (+{(fast / legacy - 1) * 100:.0f}%)")
+
+    app.dependency_overrides.clear()
+
+
+if __name__ == "__main__":
+    main()
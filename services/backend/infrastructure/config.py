@@ -18,17 +18,116 @@ class Config:
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_FORMAT: str = os.getenv("LOG_FORMAT", "json")  # json | human
+    # Keep 1 in N per event name: "request_started=10,auth_success=10" (empty = keep all)
+    LOG_SAMPLE_RATES: str = os.getenv("LOG_SAMPLE_RATES", "")
+    # Requests at or above: always logged, plus a slow_request event (0 = no slow_request)
+    LOG_SLOW_REQUEST_MS: float = float(os.getenv("LOG_SLOW_REQUEST_MS", "1000"))
+    # Identical warnings: burst, then N per second (0 = no limit); rest summarized as suppressed=N
+    LOG_WARNING_BURST: int = int(os.getenv("LOG_WARNING_BURST", "10"))
+    LOG_WARNING_PER_SECOND: float = float(os.getenv("LOG_WARNING_PER_SECOND", "1"))
+    # Async log queue: capacity and what to do when full
+    LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", "1000"))
+    LOG_QUEUE_OVERFLOW: str = os.getenv("LOG_QUEUE_OVERFLOW", "drop_debug_first")  # block | drop_newest | drop_debug_first | spill
+    # Production stdout: write in chunks of this size, at least every N ms (errors immediately)
+    LOG_BUFFER_BYTES: int = int(os.getenv("LOG_BUFFER_BYTES", "65536"))
+    LOG_FLUSH_INTERVAL_MS: int = int(os.getenv("LOG_FLUSH_INTERVAL_MS", "200"))
 
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./dev.db")
+    # Warn (n_plus_one_query) when one statement shape runs more often per request, 0 = off
+    DB_REPEATED_QUERY_THRESHOLD: int = int(os.getenv("DB_REPEATED_QUERY_THRESHOLD", "10"))
+    # Log statements at or above this duration as slow_query, 0 = off
+    DB_SLOW_QUERY_MS: float = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
 
     # Auth
     CLERK_SECRET_KEY: str = os.getenv("CLERK_SECRET_KEY", "")
     SUPERTOKENS_CONNECTION_URI: str = os.getenv("SUPERTOKENS_CONNECTION_URI", "")
 
+    # Server (api/server.py)
+    HOST: str = os.getenv("HOST", "0.0.0.0")
+    PORT: int = int(os.getenv("PORT", "8000"))
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "0"))  # workers, 0 = CPU count
+    GRACEFUL_TIMEOUT_SECONDS: float = float(os.getenv("GRACEFUL_TIMEOUT_SECONDS", "30"))
+
+    # HTTP
+    COMPRESSION_MIN_SIZE: int = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))  # bytes
+    SSE_HEARTBEAT_SECONDS: float = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+    # Delta sync: changes this recent are sent again (> longest write transaction + clock skew)
+    SYNC_SETTLE_SECONDS: float = float(os.getenv("SYNC_SETTLE_SECONDS", "90"))
+
+    # Static assets (/app/*, api/static.py)
+    STATIC_MEMORY_MAX_BYTES: int = int(os.getenv("STATIC_MEMORY_MAX_BYTES", "65536"))  # larger files stream from disk
+    # Re-stat files per request to pick up edits (default: on in development)
+    STATIC_REVALIDATE: bool = os.getenv(
+        "STATIC_REVALIDATE", str(os.getenv("ENV", "development") == "development")
+    ).lower() == "true"
+
+    # Request deadlines (seconds, 0 = no deadline)
+    REQUEST_TIMEOUT_SECONDS: float = float(os.getenv("REQUEST_TIMEOUT_SECONDS", "30"))
+    # Per route: "[METHOD ]/path/prefix=seconds", comma separated
+    REQUEST_TIMEOUTS: str = os.getenv("REQUEST_TIMEOUTS", "/api/v1/items/stream=0")
+
+    # Load shedding (adaptive concurrency limit per worker)
+    LOAD_SHEDDING_ENABLED: bool = os.getenv("LOAD_SHEDDING_ENABLED", "true").lower() == "true"
+    CONCURRENCY_LIMIT_INITIAL: int = int(os.getenv("CONCURRENCY_LIMIT_INITIAL", "20"))
+    CONCURRENCY_LIMIT_MIN: int = int(os.getenv("CONCURRENCY_LIMIT_MIN", "4"))
+    CONCURRENCY_LIMIT_MAX: int = int(os.getenv("CONCURRENCY_LIMIT_MAX", "200"))
+    CONCURRENCY_WRITE_SHARE: float = float(os.getenv("CONCURRENCY_WRITE_SHARE", "0.8"))
+    CONCURRENCY_QUEUE_TIMEOUT_MS: int = int(os.getenv("CONCURRENCY_QUEUE_TIMEOUT_MS", "100"))
+
+    # Rate limiting
+    RATE_LIMIT_STORAGE: str = os.getenv("RATE_LIMIT_STORAGE", "memory")  # memory | shm | redis
+    RATE_LIMIT_REDIS_URL: str = os.getenv("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0")
+    RATE_LIMIT_SHM_PATH: str = os.getenv("RATE_LIMIT_SHM_PATH", "/dev/shm/chrisbuilds64-ratelimit")
+    RATE_LIMIT_SHM_SLOTS: int = int(os.getenv("RATE_LIMIT_SHM_SLOTS", "65536"))
+
+    # Idempotency-Key (retried writes)
+    IDEMPOTENCY_STORAGE: str = os.getenv("IDEMPOTENCY_STORAGE", "sql")  # memory | sql
+    IDEMPOTENCY_TTL_SECONDS: float = float(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+    IDEMPOTENCY_WAIT_SECONDS: float = float(os.getenv("IDEMPOTENCY_WAIT_SECONDS", "10"))  # duplicate waits for first
+    # In-progress claim abandoned after this (keep above the longest request)
+    IDEMPOTENCY_LOCK_TIMEOUT_SECONDS: float = float(os.getenv("IDEMPOTENCY_LOCK_TIMEOUT_SECONDS", "90"))
+
+    # Metrics (GET /metrics, Prometheus text format)
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    METRICS_TOKEN: str = os.getenv("METRICS_TOKEN", "")  # if set: scrapes need "Authorization: Bearer <token>"
+    METRICS_REFRESH_SECONDS: float = float(os.getenv("METRICS_REFRESH_SECONDS", "5"))  # pool/queue/limiter gauges
+    # api/server.py: workers share metric values through files here
+    METRICS_MULTIPROC_DIR: str = os.getenv("METRICS_MULTIPROC_DIR", "/dev/shm/chrisbuilds64-metrics")
+
+    # Event loop lag: heartbeat every N ms (event_loop_lag_seconds); stalls above the
+    # threshold are logged with the blocking stack (event_loop_blocked)
+    LOOP_MONITOR_ENABLED: bool = os.getenv("LOOP_MONITOR_ENABLED", "true").lower() == "true"
+    LOOP_MONITOR_INTERVAL_MS: float = float(os.getenv("LOOP_MONITOR_INTERVAL_MS", "100"))
+    LOOP_BLOCKED_THRESHOLD_MS: float = float(os.getenv("LOOP_BLOCKED_THRESHOLD_MS", "100"))
+
+    # Tracing (OTLP JSON spans, W3C traceparent in/out)
+    TRACING_ENABLED: bool = os.getenv("TRACING_ENABLED", "false").lower() == "true"
+    TRACING_SAMPLE_RATIO: float = float(os.getenv("TRACING_SAMPLE_RATIO", "1.0"))  # new traces; callers' traceparent decides otherwise
+    TRACING_EXPORTER: str = os.getenv("TRACING_EXPORTER", "file")  # file | memory
+    TRACING_FILE: str = os.getenv("TRACING_FILE", "logs/traces.jsonl")
+
+    # Profiling (speedscope files): per request with "X-Profile: 1" / ?profile=1
+    # Production: only with PROFILING_TOKEN (sent as X-Profile-Token); elsewhere open unless a token is set
+    PROFILING_TOKEN: str = os.getenv("PROFILING_TOKEN", "")
+    PROFILING_DIR: str = os.getenv("PROFILING_DIR", "logs/profiles")
+    PROFILING_INTERVAL_MS: float = float(os.getenv("PROFILING_INTERVAL_MS", "5"))
+    PROFILING_KEEP_FILES: int = int(os.getenv("PROFILING_KEEP_FILES", "200"))
+    # Continuous low-rate sampling, one aggregated profile per period and worker
+    PROFILING_CONTINUOUS: bool = os.getenv("PROFILING_CONTINUOUS", "false").lower() == "true"
+    PROFILING_CONTINUOUS_INTERVAL_MS: float = float(os.getenv("PROFILING_CONTINUOUS_INTERVAL_MS", "100"))
+    PROFILING_CONTINUOUS_PERIOD_SECONDS: float = float(os.getenv("PROFILING_CONTINUOUS_PERIOD_SECONDS", "60"))
+
     # AI
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     ANTHROPIC_API_KEY: str = os.getenv("ANTHROPIC_API_KEY", "")
+    # Pooled HTTP client of the AI adapter (keep-alive; HTTP/2 with the optional h2 package)
+    AI_HTTP_TIMEOUT_SECONDS: float = float(os.getenv("AI_HTTP_TIMEOUT_SECONDS", "60"))  # per call, capped by the deadline
+    AI_HTTP_CONNECT_TIMEOUT_SECONDS: float = float(os.getenv("AI_HTTP_CONNECT_TIMEOUT_SECONDS", "5"))
+    AI_HTTP_MAX_CONNECTIONS: int = int(os.getenv("AI_HTTP_MAX_CONNECTIONS", "20"))
+    AI_HTTP_MAX_KEEPALIVE: int = int(os.getenv("AI_HTTP_MAX_KEEPALIVE", "10"))
+    AI_HTTP_KEEPALIVE_SECONDS: float = float(os.getenv("AI_HTTP_KEEPALIVE_SECONDS", "30"))
+    AI_HTTP2: bool = os.getenv("AI_HTTP2", "true").lower() == "true"
 
 
 # Singleton instance
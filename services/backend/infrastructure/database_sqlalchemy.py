@@ -3,14 +3,18 @@ SQLAlchemy Database Setup
 
 Zentrale Stelle für SQLAlchemy Engine, Session, Base.
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 from sqlalchemy.pool import StaticPool
 from contextlib import contextmanager
 from typing import Generator
 
 from infrastructure.config import config
+from infrastructure.deadline import DeadlineExceededError, check_deadline, remaining
 from infrastructure.logging import get_logger
+from infrastructure.query_stats import instrument_engine
+from infrastructure.tracing import trace_engine
 
 logger = get_logger("infrastructure.database")
 
@@ -45,8 +49,11 @@ def get_engine():
     return engine
 
 
-# Create engine
+# Create engine (statements/time counted per request, slow_query log: infrastructure.query_stats,
+# one span per statement in traced requests: infrastructure.tracing)
 engine = get_engine()
+instrument_engine(engine, slow_query_ms=config.DB_SLOW_QUERY_MS)
+trace_engine(engine)
 
 # Session factory
 SessionLocal = sessionmaker(
@@ -86,21 +93,50 @@ def get_session() -> Generator[Session, None, None]:
         session.close()
 
 
+# PostgreSQL SQLSTATE for statements cancelled by statement_timeout
+QUERY_CANCELED = "57014"
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     FastAPI dependency for database sessions.
 
+    Applies the request deadline: fails fast if it has already passed,
+    otherwise limits every statement (PostgreSQL: SET LOCAL
+    statement_timeout) to the remaining time. A statement cancelled that
+    way raises DeadlineExceededError (504).
+
     Usage:
         @app.get("/items")
         def get_items(db: Session = Depends(get_db)):
             ...
     """
+    check_deadline("database")
     session = SessionLocal()
     try:
+        _apply_statement_timeout(session)
         yield session
         session.commit()
+    except OperationalError as exc:
+        session.rollback()
+        if getattr(exc.orig, "pgcode", None) == QUERY_CANCELED:
+            raise DeadlineExceededError(context={"operation": "database"}) from exc
+        raise
     except Exception:
         session.rollback()
         raise
     finally:
         session.close()
+
+
+def _apply_statement_timeout(session: Session) -> None:
+    """SET LOCAL statement_timeout to the time left (PostgreSQL only)."""
+    left = remaining()
+    if left is None or engine.dialect.name != "postgresql":
+        return
+    timeout_ms = max(1, int(left * 1000))
+    # set_config(..., true) == SET LOCAL, but accepts bind parameters
+    session.execute(
+        text("SELECT set_config('statement_timeout', :timeout, true)"),
+        {"timeout": str(timeout_ms)}
+    )
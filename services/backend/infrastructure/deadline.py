@@ -0,0 +1,77 @@
+"""
+Request Deadlines
+
+Per-request deadline in a contextvar, set by DeadlineMiddleware and read
+wherever work may outlive the client:
+- get_db: SET LOCAL statement_timeout to the remaining time
+- AI adapters: check before the call, cap the HTTP timeout
+
+Outside a request (CLI, background jobs) there is no deadline and all
+helpers are no-ops.
+"""
+import time
+from contextvars import ContextVar, Token
+from typing import Optional
+
+from .errors import BaseError, ErrorCodes
+
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceededError(BaseError):
+    """Request ran past its deadline - E4xxx"""
+    code = ErrorCodes.DEADLINE_EXCEEDED
+    message = "Request deadline exceeded"
+    http_status = 504
+    recoverable = True
+    title = "Deadline Exceeded"
+
+
+def set_deadline(timeout: float) -> Token:
+    """
+    Set deadline `timeout` seconds from now (never later than an outer one).
+
+    Returns:
+        Token for reset_deadline()
+    """
+    deadline = time.monotonic() + timeout
+    current = _deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    return _deadline.set(deadline)
+
+
+def reset_deadline(token: Token) -> None:
+    """Restore the previous deadline."""
+    _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left until the deadline (negative if past), None without deadline."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def check_deadline(operation: str) -> None:
+    """
+    Fail fast if the deadline has passed.
+
+    Args:
+        operation: What was about to run (logged in the error context)
+
+    Raises:
+        DeadlineExceededError
+    """
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceededError(context={"operation": operation, "overdue_ms": round(-left * 1000)})
+
+
+def timeout_within_deadline(timeout: float) -> float:
+    """Cap a timeout (seconds) to the time left until the deadline."""
+    left = remaining()
+    if left is None:
+        return timeout
+    return max(0.0, min(timeout, left))
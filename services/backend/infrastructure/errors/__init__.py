@@ -12,7 +12,7 @@ from .base import (
     InternalError
 )
 from .codes import ErrorCodes
-from .responses import ProblemDetail, create_problem_detail
+from .responses import ProblemDetail, create_problem_detail, problem_response
 from .middleware import register_exception_handlers
 
 __all__ = [
@@ -28,6 +28,7 @@ __all__ = [
     # RFC 7807
     "ProblemDetail",
     "create_problem_detail",
+    "problem_response",
     # FastAPI integration
     "register_exception_handlers"
 ]
@@ -16,24 +16,29 @@ class BaseError(Exception):
         context: Debug-Informationen
         recoverable: Kann der User etwas tun?
         http_status: HTTP Status Code für API
+        title: Problem title (default: derived from code category)
+        headers: Extra HTTP response headers (z.B. Retry-After)
     """
 
     code: str = "E0000"
     message: str = "An error occurred"
     http_status: int = 500
     recoverable: bool = False
+    title: Optional[str] = None
 
     def __init__(
         self,
         message: Optional[str] = None,
         code: Optional[str] = None,
         context: Optional[dict] = None,
-        recoverable: Optional[bool] = None
+        recoverable: Optional[bool] = None,
+        headers: Optional[dict] = None
     ):
         self.message = message or self.__class__.message
         self.code = code or self.__class__.code
         self.context = context or {}
         self.recoverable = recoverable if recoverable is not None else self.__class__.recoverable
+        self.headers = headers or {}
         super().__init__(self.message)
 
 
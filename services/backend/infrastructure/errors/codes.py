@@ -22,6 +22,9 @@ class ErrorCodes:
     MISSING_REQUIRED_FIELD = "E1002"
     FORMAT_ERROR = "E1003"
     VALUE_OUT_OF_RANGE = "E1004"
+    RATE_LIMIT_EXCEEDED = "E1005"
+    IDEMPOTENCY_KEY_REUSED = "E1006"
+    IDEMPOTENCY_KEY_IN_USE = "E1007"
 
     # === NotFound (E2xxx) ===
     ITEM_NOT_FOUND = "E2001"
@@ -40,8 +43,10 @@ class ErrorCodes:
     AUTH_PROVIDER_ERROR = "E4002"
     AI_PROVIDER_ERROR = "E4003"
     EXTERNAL_SERVICE_TIMEOUT = "E4004"
+    DEADLINE_EXCEEDED = "E4005"
 
     # === Internal (E5xxx) ===
     UNEXPECTED_ERROR = "E5001"
     CONFIGURATION_ERROR = "E5002"
     STATE_ERROR = "E5003"
+    SERVICE_OVERLOADED = "E5004"
@@ -10,7 +10,7 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 import structlog
 
 from .base import BaseError, ValidationError, InternalError
-from .responses import ProblemDetail, create_problem_detail, ERROR_TYPE_BASE_URI
+from .responses import ProblemDetail, problem_response, ERROR_TYPE_BASE_URI
 
 
 logger = structlog.get_logger("infrastructure.errors")
@@ -36,18 +36,12 @@ async def handle_base_error(request: Request, error: BaseError) -> JSONResponse:
     _log_error(error, request_id, request.url.path)
 
     # Create RFC 7807 response
-    problem = create_problem_detail(
+    return problem_response(
         error=error,
         instance=request.url.path,
         request_id=request_id
     )
 
-    return JSONResponse(
-        status_code=error.http_status,
-        content=problem.model_dump(exclude_none=True),
-        media_type="application/problem+json"
-    )
-
 
 async def handle_validation_error(request: Request, error: RequestValidationError) -> JSONResponse:
     """Handle Pydantic/FastAPI validation errors."""
@@ -6,6 +6,7 @@ https://datatracker.ietf.org/doc/html/rfc7807
 """
 from typing import Optional, Any
 from pydantic import BaseModel, Field
+from starlette.responses import JSONResponse
 
 from .base import BaseError
 
@@ -96,6 +97,33 @@ def create_problem_detail(
     )
 
 
+def problem_response(
+    error: BaseError,
+    instance: Optional[str] = None,
+    request_id: Optional[str] = None
+) -> JSONResponse:
+    """
+    Create application/problem+json response from BaseError.
+
+    For code outside FastAPI exception handlers (e.g. ASGI middleware).
+
+    Args:
+        error: Application error
+        instance: Request path that caused the error
+        request_id: Request ID for tracing
+
+    Returns:
+        JSONResponse with the error's status and headers
+    """
+    problem = create_problem_detail(error, instance=instance, request_id=request_id)
+    return JSONResponse(
+        status_code=error.http_status,
+        content=problem.model_dump(exclude_none=True),
+        media_type="application/problem+json",
+        headers=error.headers or None
+    )
+
+
 def _error_code_to_slug(code: str) -> str:
     """Convert error code to URL-friendly slug."""
     # E2001 -> e2001
@@ -104,6 +132,9 @@ def _error_code_to_slug(code: str) -> str:
 
 def _get_error_title(error: BaseError) -> str:
     """Get human-readable title for error type."""
+    if error.title:
+        return error.title
+
     # Map error categories to titles
     titles = {
         "E1": "Validation Error",
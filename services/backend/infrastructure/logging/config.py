@@ -6,23 +6,32 @@ Supports JSON output (production) and pretty console (development).
 """
 import sys
 import logging
-from typing import Literal
+from typing import Callable, Dict, List, Literal, Optional
 
 import structlog
 from .processors import (
-    mask_sensitive_data,
+    redact_sensitive_data,
     add_app_context,
-    censor_sql_passwords,
+    render_json_bytes,
 )
-from .handlers import setup_async_handlers, stop_async_handlers
+from .handlers import RenderedFormatter, setup_async_handlers, stop_async_handlers
+from .sampling import LogSampler
 
 
 def setup_logging(
     environment: Literal["development", "production"] = "production",
     log_level: str = "INFO",
     enable_async: bool = True,
-    enable_file_logging: bool = False
-) -> None:
+    enable_file_logging: bool = False,
+    sample_rates: Optional[Dict[str, int]] = None,
+    slow_request_ms: float = 1000.0,
+    warning_burst: int = 10,
+    warning_per_second: float = 1.0,
+    queue_size: int = 1000,
+    overflow_policy: str = "drop_debug_first",
+    buffer_bytes: int = 64 * 1024,
+    flush_interval: float = 0.2,
+) -> LogSampler:
     """
     Configure structlog for production use.
 
@@ -31,6 +40,17 @@ def setup_logging(
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         enable_async: Enable async logging with QueueHandler (default: True)
         enable_file_logging: Enable file logging with rotation (default: False)
+        sample_rates: Event name -> keep 1 in N (e.g. {"request_started": 10})
+        slow_request_ms: Sampled events with duration_ms at or above are always kept
+        warning_burst: Identical warnings logged before suppression starts
+        warning_per_second: Refill rate for identical warnings (0 = no limit)
+        queue_size: Async queue capacity (records)
+        overflow_policy: Full async queue: block | drop_newest | drop_debug_first | spill
+        buffer_bytes: Production stdout write size (async only)
+        flush_interval: Max seconds production stdout output stays buffered (async only)
+
+    Returns:
+        The LogSampler in the chain (dropped counts via stats())
 
     Examples:
         >>> # Production setup (JSON output, async)
@@ -41,26 +61,67 @@ def setup_logging(
 
         >>> # With file logging
         >>> setup_logging(environment="production", enable_file_logging=True)
+
+        >>> # Keep 1 in 10 request_started lines
+        >>> setup_logging(sample_rates={"request_started": 10})
     """
+    level = getattr(logging, log_level.upper())
+
     # Setup async handlers if enabled
     if enable_async:
         setup_async_handlers(
             environment=environment,
             log_level=log_level,
-            enable_file_logging=enable_file_logging
+            enable_file_logging=enable_file_logging,
+            queue_size=queue_size,
+            overflow_policy=overflow_policy,
+            buffer_bytes=buffer_bytes,
+            flush_interval=flush_interval,
         )
     else:
         # Fallback to basic config (blocking I/O)
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(RenderedFormatter())
         logging.basicConfig(
-            format="%(message)s",
-            stream=sys.stdout,
-            level=getattr(logging, log_level.upper()),
+            handlers=[stream_handler],
+            level=level,
         )
 
+    # stdlib must not filter again (root defaults to WARNING)
+    logging.getLogger().setLevel(level)
+
     # Quiet uvicorn access logs (we handle request logging via middleware)
     logging.getLogger("uvicorn.access").handlers = []
     logging.getLogger("uvicorn.access").propagate = False
 
+    sampler = LogSampler(
+        rates=sample_rates,
+        slow_ms=slow_request_ms,
+        warning_burst=warning_burst,
+        warning_per_second=warning_per_second,
+    )
+
+    # Configure structlog
+    structlog.configure(
+        processors=build_processors(environment, sampler),
+        # Methods below `level` are no-ops: a disabled logger.debug() costs
+        # one call, no processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+    return sampler
+
+
+def build_processors(environment: str, sampler: Optional[LogSampler] = None) -> List[Callable]:
+    """
+    Processor chain for an environment (renderer last).
+
+    Args:
+        environment: "development" or "production"
+        sampler: Optional LogSampler (runs before timestamp/redaction/rendering)
+    """
     # Shared processors (used in both environments)
     shared_processors = [
         # Merge context variables (request_id, user_id, etc.)
@@ -75,6 +136,9 @@ def setup_logging(
         # Add log level
         structlog.stdlib.add_log_level,
 
+        # Sampling / warning suppression (drop early, before the costly part)
+        *([sampler] if sampler is not None else []),
+
         # Support positional arguments
         structlog.stdlib.PositionalArgumentsFormatter(),
 
@@ -87,32 +151,20 @@ def setup_logging(
         # Format exception info
         structlog.processors.format_exc_info,
 
-        # Security: Mask sensitive data (passwords, tokens, etc.)
-        mask_sensitive_data,
-
-        # Security: Censor passwords in SQL connection strings
-        censor_sql_passwords,
+        # Security: Mask sensitive data (passwords, tokens, SQL URLs, etc.)
+        redact_sensitive_data,
     ]
 
     if environment == "production":
-        # JSON output for production (log aggregators)
-        processors = shared_processors + [
-            structlog.processors.JSONRenderer()
-        ]
-    else:
-        # Pretty console output for development
-        processors = shared_processors + [
-            structlog.dev.ConsoleRenderer(colors=True)
+        # JSON output for production (log aggregators), bytes via orjson
+        return shared_processors + [
+            render_json_bytes
         ]
 
-    # Configure structlog
-    structlog.configure(
-        processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
-        context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        cache_logger_on_first_use=True,
-    )
+    # Pretty console output for development
+    return shared_processors + [
+        structlog.dev.ConsoleRenderer(colors=True)
+    ]
 
 
 def get_environment() -> Literal["development", "production"]:
@@ -2,22 +2,330 @@
 Logging Handlers Configuration
 
 Async logging with QueueHandler and multiple output handlers.
+
+The queue is bounded. What happens when the listener falls behind and
+the queue is full is the overflow policy:
+
+- block: wait for space (logging backpressure becomes request latency)
+- drop_newest: drop the record
+- drop_debug_first: drop records below WARNING once the queue is 80%
+  full, keep the rest of the space for warnings and errors
+- spill: write the record to a spill file from the calling thread
+
+Dropped and spilled records are counted (get_queue_stats). The listener
+drains the queue in batches and flushes each output once per batch.
+
+Production records arrive pre-rendered as bytes (render_json_bytes).
+BatchingStreamHandler collects them and writes to stdout in large chunks
+(size threshold or flush interval); RenderedFormatter decodes them for
+text outputs.
 """
+import copy
+import io
 import sys
 import logging
 import os
+import queue
+import time
+from collections import Counter
 from queue import Queue
 from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
+
+OVERFLOW_POLICIES = ("block", "drop_newest", "drop_debug_first", "spill")
+
+
+class RenderedFormatter(logging.Formatter):
+    """Formatter passing pre-rendered structlog output (bytes or str) through."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        if isinstance(record.msg, bytes):
+            return record.msg.decode("utf-8", "replace")
+        return super().format(record)
+
+
+class OverflowQueueHandler(QueueHandler):
+    """QueueHandler with an overflow policy for a full queue."""
+
+    def __init__(
+        self,
+        log_queue: Queue,
+        policy: str = "drop_debug_first",
+        spill_handler: Optional[logging.Handler] = None,
+        high_water: float = 0.8,
+    ):
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {policy!r} (expected one of {OVERFLOW_POLICIES})")
+        if policy == "spill" and spill_handler is None:
+            raise ValueError("Overflow policy 'spill' needs a spill_handler")
+        super().__init__(log_queue)
+        self.policy = policy
+        self.spill_handler = spill_handler
+        self.high_water = int(log_queue.maxsize * high_water) if log_queue.maxsize > 0 else 0
+        # Updated under the handler lock (Handler.handle serializes emit)
+        self.dropped: Counter = Counter()
+        self.spilled = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if not isinstance(record.msg, bytes):
+            return super().prepare(record)
+        # Already rendered: keep the bytes, skip format() (str(bytes))
+        record = copy.copy(record)
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.policy == "block":
+            self.queue.put(record)
+            return
+
+        if (
+            self.policy == "drop_debug_first"
+            and self.high_water
+            and record.levelno < logging.WARNING
+            and self.queue.qsize() >= self.high_water
+        ):
+            self.dropped[record.levelname] += 1
+            return
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.policy == "spill":
+                self.spill_handler.handle(record)
+                self.spilled += 1
+            else:
+                self.dropped[record.levelname] += 1
+
+    def close(self) -> None:
+        if self.spill_handler is not None:
+            self.spill_handler.close()
+        super().close()
+
+
+def _flush_error_record(handler: logging.Handler) -> logging.LogRecord:
+    """Stand-in record for handleError() when a flush fails (no record at hand)."""
+    return logging.makeLogRecord({
+        "name": "infrastructure.logging",
+        "levelno": logging.ERROR,
+        "levelname": "ERROR",
+        "msg": f"{type(handler).__name__}.flush() failed",
+    })
+
+
+def _handle_error(handler: logging.Handler, record: logging.LogRecord) -> None:
+    """handleError() that never raises (it fails itself once stderr is closed)."""
+    try:
+        handler.handleError(record)
+    except Exception:
+        pass
+
+
+class _BatchFlushMixin:
+    """Skip the per-record flush while the listener handles a batch."""
+
+    batching = False
+
+    def flush(self) -> None:
+        if self.batching:
+            return
+        # StreamHandler.flush() raises; a failing output must not end the listener
+        try:
+            super().flush()
+        except Exception:
+            self.handleError(_flush_error_record(self))
+
+
+class BufferedStreamHandler(_BatchFlushMixin, logging.StreamHandler):
+    """StreamHandler flushed once per listener batch."""
+
+
+class BufferedRotatingFileHandler(_BatchFlushMixin, RotatingFileHandler):
+    """RotatingFileHandler flushed once per listener batch."""
+
+
+class BatchingStreamHandler(logging.Handler):
+    """
+    Coalesces records into large writes to a binary stream.
+
+    Bytes records (render_json_bytes) are appended as-is, others are
+    formatted and encoded. The buffer is written once it reaches
+    buffer_bytes, when flush_interval has passed since the last write,
+    for records at ERROR and above, and on flush().
+    """
+
+    def __init__(self, stream=None, buffer_bytes: int = 64 * 1024, flush_interval: float = 0.2):
+        """
+        Args:
+            stream: Output (text streams are unwrapped to their .buffer)
+            buffer_bytes: Write once this many bytes are buffered
+            flush_interval: Max seconds a record stays buffered while
+                records keep arriving (idle flush: BatchingQueueListener)
+        """
+        super().__init__()
+        stream = stream if stream is not None else sys.stdout
+        self.stream = getattr(stream, "buffer", stream)
+        self.buffer_bytes = buffer_bytes
+        self.flush_interval = flush_interval
+        self.setFormatter(RenderedFormatter())
+        self._buffer = bytearray()
+        self._last_write = time.monotonic()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = record.msg if isinstance(record.msg, bytes) else self.format(record).encode("utf-8")
+            self._buffer += msg
+            self._buffer += b"\n"
+            if (
+                len(self._buffer) >= self.buffer_bytes
+                or record.levelno >= logging.ERROR
+                or time.monotonic() - self._last_write >= self.flush_interval
+            ):
+                self._write()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._write()
+        except Exception:
+            self.handleError(_flush_error_record(self))
+        finally:
+            self.release()
+
+    def _write(self) -> None:
+        self._last_write = time.monotonic()
+        if not self._buffer:
+            return
+        data = bytes(self._buffer)
+        # Cleared first: a failing stream drops the chunk instead of retrying it forever
+        self._buffer.clear()
+        if isinstance(self.stream, io.TextIOBase):
+            self.stream.write(data.decode("utf-8", "replace"))
+        else:
+            self.stream.write(data)
+        if hasattr(self.stream, "flush"):
+            self.stream.flush()
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    QueueListener that drains up to batch_size records at a time.
+
+    Outputs are written without flushing per record and flushed once at
+    the end of each batch (one write syscall instead of one per line).
+    With flush_interval set, all outputs are also flushed when the queue
+    stays empty that long (BatchingStreamHandler buffers across batches).
+
+    Output errors go to the handler's handleError() and never end the
+    thread: nothing else drains the queue. stop() is bounded by
+    stop_timeout so a stuck output cannot hang shutdown.
+    """
+
+    stop_timeout = 5.0
+
+    def __init__(self, log_queue: Queue, *handlers: logging.Handler, respect_handler_level: bool = False,
+                 batch_size: int = 256, flush_interval: Optional[float] = None):
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+    def _monitor(self) -> None:
+        q = self.queue
+        has_task_done = hasattr(q, "task_done")
+        while True:
+            try:
+                batch = [q.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                # Idle: push out whatever is buffered
+                self._flush_handlers(self.handlers)
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.dequeue(False))
+                except queue.Empty:
+                    break
+
+            stop = self._handle_batch(batch)
+            if has_task_done:
+                for _ in batch:
+                    q.task_done()
+            if stop:
+                self._flush_handlers(self.handlers)
+                break
+
+    def handle(self, record: logging.LogRecord) -> None:
+        record = self.prepare(record)
+        for handler in self.handlers:
+            if self.respect_handler_level and record.levelno < handler.level:
+                continue
+            try:
+                handler.handle(record)
+            except Exception:
+                _handle_error(handler, record)
+
+    @staticmethod
+    def _flush_handlers(handlers) -> None:
+        for handler in handlers:
+            try:
+                handler.flush()
+            except Exception:
+                _handle_error(handler, _flush_error_record(handler))
+
+    def _handle_batch(self, batch: List[Any]) -> bool:
+        """Handle records up to the sentinel; True if the sentinel was seen."""
+        buffered = [h for h in self.handlers if isinstance(h, _BatchFlushMixin)]
+        for handler in buffered:
+            handler.batching = True
+        try:
+            for record in batch:
+                if record is self._sentinel:
+                    return True
+                self.handle(record)
+            return False
+        finally:
+            for handler in buffered:
+                handler.batching = False
+            self._flush_handlers(buffered)
+
+    def enqueue_sentinel(self) -> None:
+        # Dead thread: nobody would take it (and a full queue would block)
+        if self._thread is not None and not self._thread.is_alive():
+            return
+        # Wait for space (put_nowait would fail on a full queue at shutdown),
+        # but not forever
+        try:
+            self.queue.put(self._sentinel, timeout=self.stop_timeout)
+        except queue.Full:
+            pass
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self.enqueue_sentinel()
+        self._thread.join(self.stop_timeout)
+        self._thread = None
+
 
 # Global queue listener (started once, stopped on shutdown)
 _queue_listener: Optional[QueueListener] = None
+_queue_handler: Optional[OverflowQueueHandler] = None
+# Arguments of the last setup (for restart_async_handlers after fork)
+_settings: Dict[str, Any] = {}
 
 
 def setup_async_handlers(
     environment: str = "production",
     log_level: str = "INFO",
-    enable_file_logging: bool = True
+    enable_file_logging: bool = True,
+    queue_size: int = 1000,
+    overflow_policy: str = "drop_debug_first",
+    batch_size: int = 256,
+    buffer_bytes: int = 64 * 1024,
+    flush_interval: float = 0.2,
 ) -> Optional[QueueListener]:
     """
     Setup async logging with QueueHandler pattern.
@@ -26,49 +334,87 @@ def setup_async_handlers(
         environment: "development" or "production"
         log_level: Logging level
         enable_file_logging: Whether to enable file logging (default: True)
+        queue_size: Max queued records
+        overflow_policy: block | drop_newest | drop_debug_first | spill
+        batch_size: Max records the listener handles per flush
+        buffer_bytes: Production stdout write size
+        flush_interval: Max seconds production stdout output stays buffered
 
     Returns:
         QueueListener instance (or None if already started)
     """
-    global _queue_listener
+    global _queue_listener, _queue_handler
 
     # Don't create multiple listeners
     if _queue_listener is not None:
         return None
 
+    _settings.update(
+        environment=environment,
+        log_level=log_level,
+        enable_file_logging=enable_file_logging,
+        queue_size=queue_size,
+        overflow_policy=overflow_policy,
+        batch_size=batch_size,
+        buffer_bytes=buffer_bytes,
+        flush_interval=flush_interval,
+    )
+
     # Create handlers for I/O operations
     handlers: List[logging.Handler] = []
 
     # Console handler (stdout for Docker/Kubernetes)
-    console_handler = logging.StreamHandler(sys.stdout)
+    if environment == "production":
+        # Large writes of pre-rendered JSON bytes
+        console_handler: logging.Handler = BatchingStreamHandler(
+            sys.stdout, buffer_bytes=buffer_bytes, flush_interval=flush_interval
+        )
+    else:
+        # Pretty console: flushed per batch (shows up immediately)
+        console_handler = BufferedStreamHandler(sys.stdout)
+        console_handler.setFormatter(RenderedFormatter())
     console_handler.setLevel(getattr(logging, log_level.upper()))
     handlers.append(console_handler)
 
     # File handler (optional, for local debugging)
+    log_dir = os.getenv("LOG_DIR", "logs")
     if enable_file_logging:
-        log_dir = os.getenv("LOG_DIR", "logs")
         os.makedirs(log_dir, exist_ok=True)
 
-        file_handler = RotatingFileHandler(
+        file_handler = BufferedRotatingFileHandler(
             filename=f"{log_dir}/app.log",
             maxBytes=10 * 1024 * 1024,  # 10 MB
             backupCount=5,
             encoding="utf-8"
         )
         file_handler.setLevel(getattr(logging, log_level.upper()))
+        file_handler.setFormatter(RenderedFormatter())
         handlers.append(file_handler)
 
+    # Overflow target for the spill policy (written by the calling thread)
+    spill_handler = None
+    if overflow_policy == "spill":
+        os.makedirs(log_dir, exist_ok=True)
+        spill_handler = logging.FileHandler(f"{log_dir}/spill.log", encoding="utf-8", delay=True)
+        spill_handler.setFormatter(RenderedFormatter())
+
     # Create queue for async logging
-    log_queue: Queue = Queue(maxsize=1000)
+    log_queue: Queue = Queue(maxsize=queue_size)
 
-    # Create queue handler (non-blocking)
-    queue_handler = QueueHandler(log_queue)
+    # Create queue handler (policy decides what happens when full)
+    queue_handler = _queue_handler = OverflowQueueHandler(
+        log_queue,
+        policy=overflow_policy,
+        spill_handler=spill_handler,
+    )
 
     # Create queue listener (processes queue in background thread)
-    _queue_listener = QueueListener(
+    _queue_listener = BatchingQueueListener(
         log_queue,
         *handlers,
-        respect_handler_level=True
+        respect_handler_level=True,
+        batch_size=batch_size,
+        flush_interval=flush_interval,
     )
 
     # Replace root logger handlers with queue handler
@@ -87,12 +433,36 @@ def stop_async_handlers() -> None:
     Stop the queue listener (call on application shutdown).
 
     This ensures all queued log messages are processed before exit.
+    Records logged afterwards go to the output handlers directly
+    (blocking), so nothing is lost during interpreter teardown.
     """
-    global _queue_listener
+    global _queue_listener, _queue_handler
 
     if _queue_listener is not None:
         _queue_listener.stop()
+
+        root_logger = logging.getLogger()
+        root_logger.removeHandler(_queue_handler)
+        _queue_handler.close()
+        for handler in _queue_listener.handlers:
+            root_logger.addHandler(handler)
+
         _queue_listener = None
+        _queue_handler = None
+
+
+def restart_async_handlers() -> None:
+    """
+    Start a fresh queue listener with the last settings.
+
+    The listener thread does not survive fork(): stop (flush) it in the
+    parent before forking, then call this in the child and the parent.
+    No-op if async handlers were never set up.
+    """
+    if not _settings:
+        return
+    stop_async_handlers()
+    setup_async_handlers(**_settings)
 
 
 def get_queue_listener() -> Optional[QueueListener]:
@@ -103,3 +473,22 @@ def get_queue_listener() -> Optional[QueueListener]:
         QueueListener instance or None if not started
     """
     return _queue_listener
+
+
+def get_queue_stats() -> Dict[str, Any]:
+    """
+    Queue fill level and overflow counters of the current async setup.
+
+    Returns:
+        {"policy", "size", "capacity", "dropped": {level: count}, "spilled"}
+        (empty dict if async handlers are not running)
+    """
+    if _queue_handler is None:
+        return {}
+    return {
+        "policy": _queue_handler.policy,
+        "size": _queue_handler.queue.qsize(),
+        "capacity": _queue_handler.queue.maxsize,
+        "dropped": dict(_queue_handler.dropped),
+        "spilled": _queue_handler.spilled,
+    }
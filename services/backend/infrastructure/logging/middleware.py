@@ -2,27 +2,39 @@
 FastAPI Logging Middleware
 
 Request/response logging with correlation IDs and duration tracking.
+
+Implemented as a pure ASGI middleware: no extra task or memory stream per
+request (as with Starlette's BaseHTTPMiddleware), and streaming responses
+are passed through to the client chunk by chunk.
 """
 import time
 import uuid
-from typing import Callable
+from urllib.parse import parse_qsl
 
 import structlog
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.metrics.middleware import route_template
+from infrastructure.query_stats import QueryStats, masked_parameters, reset_query_stats, start_query_stats, statement_shape
+from infrastructure.tracing import current_span
 
 logger = structlog.get_logger()
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """
     Middleware for structured request/response logging.
 
     Features:
     - Generates or extracts request_id from X-Request-ID header
     - Binds request context (method, path, client_ip) to all logs
+    - Stores request_id on request.state (used by error handlers)
+    - Binds trace_id/span_id of the request span (TracingMiddleware)
     - Measures request duration
+    - Counts SQL statements and DB time (db_queries, db_time_ms)
+    - Warns when one statement shape repeats too often (n_plus_one_query)
+    - Logs slow_request above a duration threshold (route, DB, AI breakdown)
     - Logs request start and completion
     - Adds X-Request-ID to response headers
     - Handles exceptions with detailed logging
@@ -36,45 +48,75 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         >>> app.add_middleware(LoggingMiddleware)
     """
 
-    async def dispatch(
-        self, request: Request, call_next: Callable
-    ) -> Response:
+    def __init__(self, app: ASGIApp, repeated_query_threshold: int = 10, slow_request_ms: float = 0) -> None:
+        """
+        Args:
+            app: ASGI app
+            repeated_query_threshold: Warn when one statement shape runs
+                more often than this in a request (0 = never)
+            slow_request_ms: Log slow_request for requests at or above
+                this duration (0 = never)
+        """
+        self.app = app
+        self.repeated_query_threshold = repeated_query_threshold
+        self.slow_request_ms = slow_request_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and add logging context.
 
         Args:
-            request: FastAPI request object
-            call_next: Next middleware or route handler
-
-        Returns:
-            Response object with X-Request-ID header
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Generate or extract request ID
-        request_id = request.headers.get("X-Request-ID")
+        request_id = Headers(scope=scope).get("x-request-id")
         if not request_id:
             request_id = str(uuid.uuid4())
 
+        # Expose request ID to handlers via request.state
+        scope.setdefault("state", {})["request_id"] = request_id
+
         # Bind request-scoped context variables
+        client = scope.get("client")
         structlog.contextvars.clear_contextvars()
         structlog.contextvars.bind_contextvars(
             request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            client_ip=request.client.host if request.client else None,
+            method=scope["method"],
+            path=scope["path"],
+            client_ip=client[0] if client else None,
         )
+        span = current_span()
+        if span is not None and span.recording:
+            structlog.contextvars.bind_contextvars(trace_id=span.trace_id, span_id=span.span_id)
 
-        # Start timer
+        # Start timer and query counting
         start_time = time.perf_counter()
+        query_stats, query_stats_token = start_query_stats()
 
         # Log request start
-        logger.info(
-            "request_started",
-            query_params=dict(request.query_params) if request.query_params else None,
-        )
+        query_string = scope.get("query_string", b"")
+        query_params = dict(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True)) if query_string else None
+        logger.info("request_started", query_params=query_params)
+
+        status_code = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add request ID to response headers
+                MutableHeaders(scope=message).append("X-Request-ID", request_id)
+            await send(message)
 
         try:
             # Process request
-            response = await call_next(request)
+            await self.app(scope, receive, send_wrapper)
 
             # Calculate duration
             duration_ms = (time.perf_counter() - start_time) * 1000
@@ -82,14 +124,14 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             # Log successful completion
             logger.info(
                 "request_completed",
-                status_code=response.status_code,
+                status_code=status_code,
                 duration_ms=round(duration_ms, 2),
+                db_queries=query_stats.count,
+                db_time_ms=round(query_stats.time_ms, 2),
             )
-
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-
-            return response
+            self._warn_repeated_queries(query_stats)
+            if self.slow_request_ms and duration_ms >= self.slow_request_ms:
+                self._log_slow_request(scope, status_code, duration_ms, query_params, query_stats)
 
         except Exception as exc:
             # Calculate duration
@@ -99,6 +141,8 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             logger.exception(
                 "request_failed",
                 duration_ms=round(duration_ms, 2),
+                db_queries=query_stats.count,
+                db_time_ms=round(query_stats.time_ms, 2),
                 exception_type=type(exc).__name__,
                 exception_message=str(exc),
             )
@@ -108,4 +152,36 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
         finally:
             # Clear context after request (prevent leaks)
+            reset_query_stats(query_stats_token)
             structlog.contextvars.clear_contextvars()
+
+    def _warn_repeated_queries(self, query_stats: QueryStats) -> None:
+        """Log statement shapes above the threshold (likely N+1 loops)."""
+        if not self.repeated_query_threshold:
+            return
+        for statement, count in query_stats.repeated(self.repeated_query_threshold):
+            logger.warning(
+                "n_plus_one_query",
+                statement=statement[:500],
+                count=count,
+                threshold=self.repeated_query_threshold,
+            )
+
+    def _log_slow_request(self, scope: Scope, status_code, duration_ms: float, query_params, query_stats: QueryStats) -> None:
+        """Where the time of a slow request went (DB, slowest statement, AI)."""
+        slowest = query_stats.slowest
+        logger.warning(
+            "slow_request",
+            route=route_template(scope),
+            query_params=query_params,
+            status_code=status_code,
+            duration_ms=round(duration_ms, 2),
+            threshold_ms=self.slow_request_ms,
+            db_queries=query_stats.count,
+            db_time_ms=round(query_stats.time_ms, 2),
+            slowest_query=statement_shape(slowest[1])[:500] if slowest else None,
+            slowest_query_ms=round(slowest[0], 2) if slowest else None,
+            slowest_query_params=masked_parameters(slowest[2]) if slowest else None,
+            ai_calls=query_stats.ai_calls,
+            ai_time_ms=round(query_stats.ai_time_ms, 2),
+        )
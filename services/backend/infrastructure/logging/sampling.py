@@ -0,0 +1,142 @@
+"""
+Log Sampling
+
+Processor that thins out high-volume events before the expensive part of
+the chain (timestamp, redaction, rendering) runs.
+
+- Sampling: per event name "keep 1 in N" (e.g. request_started=10).
+  Events carrying a request_id are sampled per request (hash of the id),
+  so the lines of a kept request stay together. Kept events get
+  `sample_rate=N` so aggregators can re-weight counts.
+- Always kept: errors (error/exception/critical), responses >= 500 and
+  slow requests (duration_ms >= slow_ms).
+- Warning floods: identical warnings (logger + event) pass through a token
+  bucket; suppressed ones are counted and reported on the next warning
+  that passes (`suppressed=N`).
+
+Usage:
+    >>> setup_logging(sample_rates={"request_started": 10}, slow_request_ms=500)
+"""
+import threading
+import time
+import zlib
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+ALWAYS_KEEP_METHODS = frozenset({"error", "exception", "critical", "fatal"})
+WARNING_METHODS = frozenset({"warning", "warn"})
+
+
+def parse_sample_rates(spec: str) -> Dict[str, int]:
+    """
+    Parse "request_started=10,auth_success=10".
+
+    Returns:
+        event name -> N (keep 1 in N)
+    """
+    rates: Dict[str, int] = {}
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        event, _, rate = entry.partition("=")
+        if not event.strip() or not rate.strip().isdigit() or int(rate) < 1:
+            raise ValueError(f"Invalid sample rate: {entry!r}")
+        rates[event.strip()] = int(rate)
+    return rates
+
+
+class LogSampler:
+    """structlog processor: per-event sampling and warning rate limiting."""
+
+    def __init__(
+        self,
+        rates: Optional[Dict[str, int]] = None,
+        slow_ms: float = 1000.0,
+        warning_burst: int = 10,
+        warning_per_second: float = 1.0,
+        max_keys: int = 10_000,
+    ):
+        """
+        Args:
+            rates: Event name -> keep 1 in N (N <= 1: keep all)
+            slow_ms: Events with duration_ms at or above are always kept
+            warning_burst: Identical warnings logged before suppression
+            warning_per_second: Refill rate of the warning bucket
+                (0 disables warning suppression)
+            max_keys: Max tracked warning keys (oldest dropped)
+        """
+        self.rates = {event: n for event, n in (rates or {}).items() if n > 1}
+        self.slow_ms = slow_ms
+        self.warning_burst = warning_burst
+        self.warning_per_second = warning_per_second
+        self.max_keys = max_keys
+        self._counters: Counter = Counter()
+        # (logger, event) -> [tokens, last refill, suppressed]
+        self._buckets: "OrderedDict[tuple, List[Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.dropped: Counter = Counter()
+
+    def __call__(self, logger, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+        if method_name in ALWAYS_KEEP_METHODS:
+            return event_dict
+
+        if method_name in WARNING_METHODS:
+            if self.warning_per_second > 0:
+                self._limit_warning(event_dict)
+            return event_dict
+
+        event = event_dict.get("event")
+        rate = self.rates.get(event)
+        if rate is None or self._always_keep(event_dict):
+            return event_dict
+
+        request_id = event_dict.get("request_id")
+        if request_id is not None:
+            keep = zlib.crc32(str(request_id).encode()) % rate == 0
+        else:
+            with self._lock:
+                self._counters[event] += 1
+                keep = self._counters[event] % rate == 1
+
+        if not keep:
+            self.dropped[event] += 1
+            raise structlog.DropEvent
+        event_dict["sample_rate"] = rate
+        return event_dict
+
+    def _always_keep(self, event_dict: Dict[str, Any]) -> bool:
+        status_code = event_dict.get("status_code")
+        if isinstance(status_code, int) and status_code >= 500:
+            return True
+        duration_ms = event_dict.get("duration_ms")
+        return isinstance(duration_ms, (int, float)) and duration_ms >= self.slow_ms
+
+    def _limit_warning(self, event_dict: Dict[str, Any]) -> None:
+        """Token bucket per (logger, event); raises DropEvent when empty."""
+        key = (event_dict.get("logger"), event_dict.get("event"))
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(self.warning_burst), now, 0]
+                if len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                bucket[0] = min(self.warning_burst, bucket[0] + (now - bucket[1]) * self.warning_per_second)
+                bucket[1] = now
+
+            if bucket[0] < 1:
+                bucket[2] += 1
+                self.dropped[key[1]] += 1
+                raise structlog.DropEvent
+
+            bucket[0] -= 1
+            suppressed, bucket[2] = bucket[2], 0
+
+        if suppressed:
+            event_dict["suppressed"] = suppressed
+
+    def stats(self) -> Dict[str, int]:
+        """Dropped events per event name."""
+        return dict(self.dropped)
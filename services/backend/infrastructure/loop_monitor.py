@@ -0,0 +1,137 @@
+"""
+Event Loop Lag Monitor
+
+Finds blocking calls in async code (sync DB sessions, sync HTTP clients,
+CPU-heavy work in `async def` handlers):
+
+- Heartbeat: a task on the event loop sleeps `interval` seconds and
+  measures how late it wakes up (scheduling delay). Every measurement
+  goes to the event_loop_lag_seconds histogram.
+- Watchdog: a thread checks the heartbeat. If it is more than
+  `threshold` overdue, the loop is blocked right now; the watchdog
+  captures the stack of the loop thread (the blocking call is on top)
+  and logs event_loop_blocked with the running task, once per stall.
+
+Per worker; started and stopped in the lifespan.
+"""
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Dict, List, Optional
+
+from infrastructure.logging import get_logger
+from infrastructure.metrics.registry import EVENT_LOOP_BLOCKED, EVENT_LOOP_LAG
+
+logger = get_logger("infrastructure.loop_monitor")
+
+MAX_STACK_FRAMES = 30
+
+
+class LoopLagMonitor:
+    """
+    Heartbeat task plus watchdog thread for one event loop.
+
+    Usage:
+        >>> monitor = LoopLagMonitor(interval=0.1, threshold=0.1)
+        >>> monitor.start()   # inside the running loop (lifespan)
+        >>> monitor.stop()
+    """
+
+    def __init__(self, interval: float = 0.1, threshold: float = 0.1):
+        """
+        Args:
+            interval: Seconds between heartbeats
+            threshold: Delay (seconds) from which a stall is logged with stack
+        """
+        self.interval = interval
+        self.threshold = threshold
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.stalls = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._last_beat = 0.0
+        self._reported_beat = 0.0
+
+    def start(self) -> None:
+        """Start monitoring the running loop (call from a coroutine)."""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = self._loop.create_task(self._heartbeat(), name="loop-lag-heartbeat")
+        self._thread = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        self._task = None
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Lag of the last heartbeat, worst lag and stall count (ms)."""
+        return {
+            "lag_ms": round(self.last_lag * 1000, 2),
+            "max_lag_ms": round(self.max_lag * 1000, 2),
+            "stalls": self.stalls,
+        }
+
+    async def _heartbeat(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - expected)
+            self._last_beat = now
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            EVENT_LOOP_LAG.observe(lag)
+
+    def _watch(self) -> None:
+        check_every = max(0.01, min(self.interval, self.threshold) / 2)
+        while not self._stop.wait(check_every):
+            beat = self._last_beat
+            overdue = time.monotonic() - beat - self.interval
+            if overdue >= self.threshold and beat != self._reported_beat:
+                self._reported_beat = beat
+                self._report(overdue)
+
+    def _report(self, overdue: float) -> None:
+        """Log the loop thread's stack while it is blocked."""
+        self.stalls += 1
+        EVENT_LOOP_BLOCKED.inc()
+        frame = sys._current_frames().get(self._loop_thread_id)
+        task = _current_task(self._loop)
+        logger.warning(
+            "event_loop_blocked",
+            blocked_ms=round(overdue * 1000, 2),
+            threshold_ms=round(self.threshold * 1000, 2),
+            task=task.get_name() if task is not None else None,
+            coroutine=getattr(task.get_coro(), "__qualname__", None) if task is not None else None,
+            stack=_format_stack(frame) if frame is not None else None,
+        )
+
+
+def _current_task(loop: asyncio.AbstractEventLoop) -> Optional[asyncio.Task]:
+    # Read from the watchdog thread; the loop is blocked, so the task is stable
+    try:
+        return asyncio.current_task(loop)
+    except RuntimeError:
+        return None
+
+
+def _format_stack(frame) -> List[str]:
+    """Innermost frames last, as "file:line in function: source"."""
+    summary = traceback.extract_stack(frame)[-MAX_STACK_FRAMES:]
+    return [f"{entry.filename}:{entry.lineno} in {entry.name}: {entry.line}" for entry in summary]
@@ -0,0 +1,23 @@
+"""
+Metrics Infrastructure
+
+Prometheus metrics: per-route request counts/latency, DB pool, logging,
+load shedding and AI calls. Exposed at GET /metrics (api/main.py).
+
+Usage:
+    >>> from infrastructure.metrics import MetricsMiddleware, render_metrics
+    >>> app.add_middleware(MetricsMiddleware)
+    >>> body, content_type = render_metrics()
+"""
+from .registry import multiprocess_enabled, observe_ai_request, render_metrics
+from .middleware import MetricsMiddleware, route_template
+from .runtime import RuntimeMetrics
+
+__all__ = [
+    "MetricsMiddleware",     # Request count/latency per route template
+    "RuntimeMetrics",        # Pool, log queue, limiter stats -> metrics
+    "render_metrics",        # Text exposition (all workers)
+    "observe_ai_request",    # AI adapter call latency/tokens
+    "multiprocess_enabled",
+    "route_template",
+]
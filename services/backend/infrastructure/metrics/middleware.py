@@ -0,0 +1,78 @@
+"""
+Metrics Middleware
+
+Counts requests and records latency per route template (/api/v1/items/{item_id},
+not the raw URL), so label cardinality stays bounded. Requests that match
+no route are labelled "<unmatched>".
+
+Pure ASGI; the labelled children are cached, a request costs two dict
+lookups and two value updates.
+"""
+import time
+from typing import Dict, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .registry import HTTP_REQUEST_DURATION, HTTP_REQUESTS
+
+UNMATCHED = "<unmatched>"
+METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+
+
+def route_template(scope: Scope) -> str:
+    """Path template of the matched route (set by the router)."""
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or getattr(route, "path", None) or UNMATCHED
+
+
+class MetricsMiddleware:
+    """
+    Request count and latency histogram per method, route and status class.
+
+    Usage:
+        >>> app.add_middleware(MetricsMiddleware, excluded_paths=("/metrics",))
+    """
+
+    def __init__(self, app: ASGIApp, excluded_paths: Tuple[str, ...] = ("/metrics",)):
+        """
+        Args:
+            app: ASGI app
+            excluded_paths: Path prefixes not measured (scrapes)
+        """
+        self.app = app
+        self.excluded_paths = tuple(excluded_paths)
+        self._counters: Dict[tuple, object] = {}
+        self._histograms: Dict[tuple, object] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.excluded_paths):
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            method = scope["method"] if scope["method"] in METHODS else "other"
+            self._observe(method, route_template(scope), f"{status_code // 100}xx", time.perf_counter() - start)
+
+    def _observe(self, method: str, route: str, status: str, seconds: float) -> None:
+        counter_key = (method, route, status)
+        counter = self._counters.get(counter_key)
+        if counter is None:
+            counter = self._counters[counter_key] = HTTP_REQUESTS.labels(method, route, status)
+        counter.inc()
+
+        histogram_key = (method, route)
+        histogram = self._histograms.get(histogram_key)
+        if histogram is None:
+            histogram = self._histograms[histogram_key] = HTTP_REQUEST_DURATION.labels(method, route)
+        histogram.observe(seconds)
@@ -0,0 +1,121 @@
+"""
+Metric Definitions
+
+All Prometheus metrics of the service in one place.
+
+Multi-process: with PROMETHEUS_MULTIPROC_DIR set (api/server.py does this
+before the app is imported), every worker writes its values to mmap files
+in that directory and a scrape aggregates all of them. Gauges use
+"livesum": values of exited workers disappear (mark_process_dead).
+"""
+import os
+from typing import Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+AI_LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+# HTTP (MetricsMiddleware)
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route template and status class",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency (until the response is complete)",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+
+# Database pool (RuntimeMetrics)
+DB_POOL_SIZE = Gauge("db_pool_size", "Configured connection pool size", multiprocess_mode="livesum")
+DB_POOL_CHECKED_OUT = Gauge("db_pool_checked_out", "Connections in use", multiprocess_mode="livesum")
+DB_POOL_CHECKED_IN = Gauge("db_pool_checked_in", "Idle connections in the pool", multiprocess_mode="livesum")
+
+# Logging (RuntimeMetrics)
+LOG_QUEUE_SIZE = Gauge("log_queue_size", "Records waiting in the async log queue", multiprocess_mode="livesum")
+LOG_RECORDS_DROPPED = Counter("log_records_dropped_total", "Records dropped on a full log queue", ["level"])
+LOG_RECORDS_SPILLED = Counter("log_records_spilled_total", "Records written to the spill file")
+LOG_EVENTS_SAMPLED_OUT = Counter("log_events_sampled_out_total", "Events dropped by log sampling", ["event"])
+
+# Load shedding (RuntimeMetrics)
+CONCURRENCY_LIMIT = Gauge("concurrency_limit", "Adaptive concurrency limit", multiprocess_mode="livesum")
+CONCURRENCY_IN_FLIGHT = Gauge("concurrency_in_flight", "Admitted requests in flight", multiprocess_mode="livesum")
+CONCURRENCY_QUEUED = Gauge(
+    "concurrency_queued", "Requests waiting for admission", ["priority"], multiprocess_mode="livesum"
+)
+REQUESTS_SHED = Counter("requests_shed_total", "Requests rejected by load shedding", ["priority", "reason"])
+
+# Event loop (infrastructure.loop_monitor)
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "Scheduling delay of a periodic event loop callback",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+EVENT_LOOP_BLOCKED = Counter("event_loop_blocked_total", "Event loop stalls above the threshold (stack logged)")
+
+# AI adapters
+AI_REQUEST_DURATION = Histogram(
+    "ai_request_duration_seconds",
+    "AI provider call latency",
+    ["provider", "model", "outcome"],
+    buckets=AI_LATENCY_BUCKETS,
+)
+AI_TOKENS = Counter("ai_tokens_total", "Tokens used by AI provider calls", ["provider", "model", "kind"])
+
+
+def multiprocess_enabled() -> bool:
+    """True if values are shared through PROMETHEUS_MULTIPROC_DIR."""
+    return "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Text exposition of all metrics (all workers in multi-process mode).
+
+    Returns:
+        (body, content type)
+    """
+    if multiprocess_enabled():
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def observe_ai_request(
+    provider: str,
+    model: str,
+    seconds: float,
+    outcome: str,
+    prompt_tokens: int = 0,
+    completion_tokens: int = 0,
+) -> None:
+    """
+    Record one AI provider call.
+
+    Args:
+        provider: e.g. "anthropic"
+        model: Model name
+        seconds: Call duration
+        outcome: "ok", "error" or "timeout"
+        prompt_tokens: Input tokens (from the response usage)
+        completion_tokens: Output tokens
+    """
+    AI_REQUEST_DURATION.labels(provider, model, outcome).observe(seconds)
+    if prompt_tokens:
+        AI_TOKENS.labels(provider, model, "prompt").inc(prompt_tokens)
+    if completion_tokens:
+        AI_TOKENS.labels(provider, model, "completion").inc(completion_tokens)
@@ -0,0 +1,141 @@
+"""
+Runtime Metrics
+
+Copies state that lives in other components (DB pool, log queue, log
+sampler, concurrency limiter) into metrics: on every scrape and, per
+worker, every `interval` seconds from a background thread (a scrape is
+served by one worker, the others report through the refresher).
+
+Components keep plain counters; they are added to the Prometheus
+counters as deltas since the previous refresh.
+"""
+import threading
+from typing import Dict, Optional
+
+from infrastructure.logging import get_logger
+from infrastructure.logging.handlers import get_queue_stats
+
+from .registry import (
+    CONCURRENCY_IN_FLIGHT,
+    CONCURRENCY_LIMIT,
+    CONCURRENCY_QUEUED,
+    DB_POOL_CHECKED_IN,
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_SIZE,
+    LOG_EVENTS_SAMPLED_OUT,
+    LOG_QUEUE_SIZE,
+    LOG_RECORDS_DROPPED,
+    LOG_RECORDS_SPILLED,
+    REQUESTS_SHED,
+)
+
+logger = get_logger("infrastructure.metrics")
+
+
+class RuntimeMetrics:
+    """Periodic export of component stats (one instance per app)."""
+
+    def __init__(self, engine=None, limiter=None, log_sampler=None, interval: float = 5.0):
+        """
+        Args:
+            engine: SQLAlchemy engine (pool gauges; skipped for pools without stats)
+            limiter: AdaptiveConcurrencyLimiter
+            log_sampler: LogSampler returned by setup_logging
+            interval: Seconds between background refreshes
+        """
+        self.engine = engine
+        self.limiter = limiter
+        self.log_sampler = log_sampler
+        self.interval = interval
+        self._last: Dict[tuple, float] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the refresher in this process (call per worker, e.g. lifespan)."""
+        if self._thread is not None:
+            return
+        # Counts inherited from the parent process are not this worker's
+        self._snapshot_baseline()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="runtime-metrics", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the refresher (final refresh included)."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=self.interval + 1)
+        self._thread = None
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Export current stats."""
+        with self._lock:
+            self._refresh_pool()
+            self._refresh_logging()
+            self._refresh_limiter()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("runtime_metrics_refresh_failed")
+
+    def _refresh_pool(self) -> None:
+        pool = getattr(self.engine, "pool", None)
+        if pool is None or not hasattr(pool, "checkedout"):
+            return
+        DB_POOL_SIZE.set(pool.size())
+        DB_POOL_CHECKED_OUT.set(pool.checkedout())
+        DB_POOL_CHECKED_IN.set(pool.checkedin())
+
+    def _refresh_logging(self) -> None:
+        stats = get_queue_stats()
+        if stats:
+            LOG_QUEUE_SIZE.set(stats["size"])
+            for level, count in stats["dropped"].items():
+                self._inc(LOG_RECORDS_DROPPED.labels(level), ("log_dropped", level), count)
+            self._inc(LOG_RECORDS_SPILLED, ("log_spilled",), stats["spilled"])
+        if self.log_sampler is not None:
+            for event, count in self.log_sampler.stats().items():
+                self._inc(LOG_EVENTS_SAMPLED_OUT.labels(str(event)), ("sampled_out", event), count)
+
+    def _refresh_limiter(self) -> None:
+        if self.limiter is None:
+            return
+        stats = self.limiter.stats()
+        CONCURRENCY_LIMIT.set(stats["limit"])
+        CONCURRENCY_IN_FLIGHT.set(stats["in_flight"])
+        for priority, queued in stats["queued"].items():
+            CONCURRENCY_QUEUED.labels(priority).set(queued)
+        for key, count in stats["shed"].items():
+            priority, _, reason = key.partition(":")
+            self._inc(REQUESTS_SHED.labels(priority, reason), ("shed", key), count)
+
+    def _inc(self, counter, key: tuple, total: float) -> None:
+        """Add the growth of a component counter since the last refresh."""
+        last = self._last.get(key, 0)
+        # A smaller total means the component was recreated (e.g. log handlers after fork)
+        delta = total - last if total >= last else total
+        if delta:
+            counter.inc(delta)
+        self._last[key] = total
+
+    def _snapshot_baseline(self) -> None:
+        with self._lock:
+            self._last.clear()
+            stats = get_queue_stats()
+            if stats:
+                for level, count in stats["dropped"].items():
+                    self._last[("log_dropped", level)] = count
+                self._last[("log_spilled",)] = stats["spilled"]
+            if self.log_sampler is not None:
+                for event, count in self.log_sampler.stats().items():
+                    self._last[("sampled_out", event)] = count
+            if self.limiter is not None:
+                for key, count in self.limiter.stats()["shed"].items():
+                    self._last[("shed", key)] = count
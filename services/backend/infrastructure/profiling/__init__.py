@@ -0,0 +1,24 @@
+"""
+Profiling Infrastructure
+
+Sampling profiler (no dependencies) with speedscope output: on demand per
+request (X-Profile header, ProfilingMiddleware) and optionally continuous
+at a low rate (ContinuousProfiler, periodic aggregated files).
+
+Usage:
+    >>> from infrastructure.profiling import ProfilingMiddleware, ContinuousProfiler
+    >>> app.add_middleware(ProfilingMiddleware, output_dir="logs/profiles", token="secret")
+    >>> ContinuousProfiler("logs/profiles", interval=0.1, period=60).start()
+"""
+from .sampler import StackSampler, to_speedscope
+from .storage import write_profile
+from .middleware import ProfilingMiddleware
+from .continuous import ContinuousProfiler
+
+__all__ = [
+    "ProfilingMiddleware",    # X-Profile: 1 -> <request_id>.speedscope.json
+    "ContinuousProfiler",     # Low-rate background sampling, periodic files
+    "StackSampler",
+    "to_speedscope",
+    "write_profile",
+]
@@ -0,0 +1,72 @@
+"""
+Continuous Profiling
+
+Low-rate sampling for the whole process lifetime (default 10 Hz, well
+below 1% CPU); every `period` seconds the aggregated stacks are written
+as one speedscope file: continuous-<pid>-<timestamp>.speedscope.json.
+Started per worker (lifespan).
+"""
+import os
+import threading
+import time
+from typing import Optional
+
+from infrastructure.logging import get_logger
+
+from .sampler import StackSampler
+from .storage import write_profile
+
+logger = get_logger("infrastructure.profiling")
+
+
+class ContinuousProfiler:
+    """Background sampler with periodic aggregated profiles."""
+
+    def __init__(self, output_dir: str, interval: float = 0.1, period: float = 60.0, keep: int = 200):
+        """
+        Args:
+            output_dir: Directory for the profiles
+            interval: Seconds between samples
+            period: Seconds aggregated per file
+            keep: Profiles kept in output_dir (oldest removed)
+        """
+        self.output_dir = output_dir
+        self.period = period
+        self.keep = keep
+        self.sampler = StackSampler(interval=interval, max_seconds=None)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self.sampler.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="continuous-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and write the partial period."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.sampler.stop()
+        self.flush()
+
+    def flush(self) -> None:
+        """Write the stacks counted since the last flush (nothing if none)."""
+        stacks, thread_names = self.sampler.drain()
+        if not stacks:
+            return
+        name = f"continuous-{os.getpid()}-{time.strftime('%Y%m%dT%H%M%S')}"
+        document = self.sampler.to_speedscope(name, stacks, thread_names)
+        try:
+            write_profile(self.output_dir, name, document, keep=self.keep)
+        except OSError:
+            logger.exception("profile_write_failed", profile=name)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.period):
+            self.flush()
@@ -0,0 +1,126 @@
+"""
+Profiling Middleware
+
+Profiles single requests on demand: send `X-Profile: 1` (or `?profile=1`)
+and the request runs under a StackSampler. The speedscope file is stored
+as <output_dir>/<request_id>.speedscope.json and its name returned in the
+`X-Profile` response header (open it at https://www.speedscope.app).
+
+Access: with a token configured, requests must also send
+`X-Profile-Token: <token>`; without one, profiling is only available when
+`allow_without_token` is set (not in production, see api/main.py).
+Unauthorized profile requests are served normally, without a profile.
+
+The sampler sees all threads of the worker, so one profile per worker at a
+time (concurrent requests appear in it too). Pure ASGI.
+"""
+import re
+import secrets
+import threading
+import uuid
+from urllib.parse import parse_qsl
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.logging import get_logger
+
+from .sampler import StackSampler
+from .storage import SUFFIX, write_profile
+
+logger = get_logger("infrastructure.profiling")
+
+TRUE_VALUES = frozenset({"1", "true", "yes"})
+# X-Request-ID is client-controlled: keep file names to a safe alphabet
+_UNSAFE_NAME = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+class ProfilingMiddleware:
+    """
+    Per-request sampling profiler, activated by header or query flag.
+
+    Usage:
+        >>> app.add_middleware(ProfilingMiddleware, output_dir="logs/profiles", token="secret")
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        output_dir: str = "logs/profiles",
+        token: str = "",
+        allow_without_token: bool = False,
+        interval: float = 0.005,
+        max_seconds: float = 30.0,
+        keep: int = 200,
+    ):
+        """
+        Args:
+            app: ASGI app
+            output_dir: Directory for the profiles
+            token: Required in X-Profile-Token (empty = no token accepted)
+            allow_without_token: Profile without a token when none is configured
+            interval: Seconds between samples
+            max_seconds: Sampling stops after this long (streams)
+            keep: Profiles kept in output_dir (oldest removed)
+        """
+        self.app = app
+        self.output_dir = output_dir
+        self.token = token
+        self.allow_without_token = allow_without_token
+        self.interval = interval
+        self.max_seconds = max_seconds
+        self.keep = keep
+        self._busy = threading.Lock()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        if not self._authorized(scope):
+            await self.app(scope, receive, send)
+            return
+
+        if not self._busy.acquire(blocking=False):
+            await self.app(scope, receive, self._with_header(send, "busy"))
+            return
+
+        request_id = scope.get("state", {}).get("request_id") or str(uuid.uuid4())
+        name = _UNSAFE_NAME.sub("_", request_id)[:128]
+        sampler = StackSampler(interval=self.interval, max_seconds=self.max_seconds).start()
+        try:
+            await self.app(scope, receive, self._with_header(send, f"{name}{SUFFIX}"))
+        finally:
+            sampler.stop()
+            self._busy.release()
+            document = sampler.to_speedscope(f"{scope['method']} {scope['path']} ({request_id})")
+            try:
+                path = await anyio.to_thread.run_sync(write_profile, self.output_dir, name, document, self.keep)
+                logger.info("request_profiled", profile=str(path), samples=sampler.samples)
+            except OSError:
+                logger.exception("profile_write_failed", profile=name)
+
+    @staticmethod
+    def _requested(scope: Scope) -> bool:
+        for key, value in scope["headers"]:
+            if key == b"x-profile":
+                return value.decode("latin-1").lower() in TRUE_VALUES
+        query_string = scope.get("query_string", b"")
+        if b"profile" not in query_string:
+            return False
+        return dict(parse_qsl(query_string.decode("latin-1"))).get("profile", "").lower() in TRUE_VALUES
+
+    def _authorized(self, scope: Scope) -> bool:
+        if not self.token:
+            return self.allow_without_token
+        presented = Headers(scope=scope).get("x-profile-token", "")
+        return secrets.compare_digest(presented.encode("latin-1"), self.token.encode())
+
+    @staticmethod
+    def _with_header(send: Send, value: str) -> Send:
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Profile", value)
+            await send(message)
+        return send_wrapper
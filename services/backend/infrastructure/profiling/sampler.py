@@ -0,0 +1,165 @@
+"""
+Stack Sampler
+
+Wall-clock sampling profiler without dependencies: a background thread
+reads the Python stacks of all threads (sys._current_frames) every
+`interval` seconds and counts identical stacks. Idle threads (waiting on
+a lock, queue or selector) are skipped, so the event loop thread and busy
+threadpool workers (sync endpoints) are what remains.
+
+Stacks are counted per thread and exported in the speedscope format
+(https://www.speedscope.app), one "sampled" profile per thread.
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType
+from typing import Any, Dict, Optional, Tuple
+
+# Leaf frames of threads that are waiting, not working: (file name, function)
+IDLE_FRAMES = frozenset({
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("selectors.py", "select"),
+})
+
+MAX_DEPTH = 128
+
+
+class StackSampler:
+    """
+    Samples all threads until stopped (or for at most `max_seconds`).
+
+    Usage:
+        >>> sampler = StackSampler(interval=0.005).start()
+        >>> handle_request()
+        >>> profile = sampler.stop().to_speedscope("GET /api/v1/items")
+    """
+
+    def __init__(self, interval: float = 0.005, max_seconds: Optional[float] = 30.0):
+        """
+        Args:
+            interval: Seconds between samples
+            max_seconds: Stop sampling after this long (None = until stop())
+        """
+        self.interval = interval
+        self.max_seconds = max_seconds
+        self.samples = 0
+        self._stacks: Counter = Counter()
+        self._thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started = 0.0
+        self._duration = 0.0
+
+    def start(self) -> "StackSampler":
+        self._started = time.perf_counter()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> "StackSampler":
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self._duration = time.perf_counter() - self._started
+        return self
+
+    def sample(self) -> None:
+        """Record the current stack of every busy thread."""
+        own = threading.get_ident()
+        stacks = []
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own:
+                continue
+            code = frame.f_code
+            if (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES:
+                continue
+            stack = []
+            while frame is not None and len(stack) < MAX_DEPTH:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            stacks.append((thread_id, tuple(reversed(stack))))
+
+        with self._lock:
+            self.samples += 1
+            for key in stacks:
+                self._stacks[key] += 1
+                if key[0] not in self._thread_names:
+                    self._thread_names.update((t.ident, t.name) for t in threading.enumerate())
+
+    def drain(self) -> Tuple[Counter, Dict[int, str]]:
+        """Take the counted stacks and start over (continuous profiling)."""
+        with self._lock:
+            stacks, self._stacks = self._stacks, Counter()
+            self.samples = 0
+            return stacks, dict(self._thread_names)
+
+    def to_speedscope(self, name: str, stacks: Optional[Counter] = None,
+                      thread_names: Optional[Dict[int, str]] = None) -> Dict[str, Any]:
+        """Counted stacks as a speedscope file (weights in seconds)."""
+        if stacks is None:
+            with self._lock:
+                stacks, thread_names = Counter(self._stacks), dict(self._thread_names)
+        return to_speedscope(name, stacks, thread_names or {}, self.interval, self._duration)
+
+    def _run(self) -> None:
+        deadline = self._started + self.max_seconds if self.max_seconds else None
+        while not self._stop.wait(self.interval):
+            self.sample()
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+
+
+def to_speedscope(name: str, stacks: Counter, thread_names: Dict[int, str],
+                  interval: float, duration: float = 0.0) -> Dict[str, Any]:
+    """Build a speedscope document: shared frame table, one profile per thread."""
+    frames: list = []
+    frame_index: Dict[CodeType, int] = {}
+    profiles: Dict[int, Dict[str, Any]] = {}
+
+    for (thread_id, stack), count in stacks.most_common():
+        indices = []
+        for code in stack:
+            index = frame_index.get(code)
+            if index is None:
+                index = frame_index[code] = len(frames)
+                frames.append({
+                    "name": getattr(code, "co_qualname", code.co_name),
+                    "file": code.co_filename,
+                    "line": code.co_firstlineno,
+                })
+            indices.append(index)
+
+        profile = profiles.get(thread_id)
+        if profile is None:
+            profile = profiles[thread_id] = {
+                "type": "sampled",
+                "name": f"{name} [{thread_names.get(thread_id, thread_id)}]",
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": 0,
+                "samples": [],
+                "weights": [],
+            }
+        profile["samples"].append(indices)
+        profile["weights"].append(count * interval)
+        profile["endValue"] += count * interval
+
+    for profile in profiles.values():
+        profile["endValue"] = round(max(profile["endValue"], duration), 6)
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "chrisbuilds64-api",
+        "activeProfileIndex": 0,
+        "shared": {"frames": frames},
+        "profiles": list(profiles.values()),
+    }
@@ -0,0 +1,30 @@
+"""
+Profile Storage
+
+Speedscope files in one directory, oldest removed beyond `keep`.
+"""
+from pathlib import Path
+from typing import Any, Dict
+
+import orjson
+
+SUFFIX = ".speedscope.json"
+
+
+def write_profile(directory: str, name: str, document: Dict[str, Any], keep: int = 200) -> Path:
+    """
+    Write `<directory>/<name>.speedscope.json` and prune old profiles.
+
+    Returns:
+        Path of the written file
+    """
+    folder = Path(directory)
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / f"{name}{SUFFIX}"
+    path.write_bytes(orjson.dumps(document))
+
+    if keep:
+        profiles = sorted(folder.glob(f"*{SUFFIX}"), key=lambda p: p.stat().st_mtime)
+        for old in profiles[:-keep]:
+            old.unlink(missing_ok=True)
+    return path
@@ -0,0 +1,191 @@
+"""
+Per-Request Query Stats
+
+SQLAlchemy engine events count statements and database time into the
+QueryStats of the current request. LoggingMiddleware starts a QueryStats
+per request (contextvar) and logs it with request_completed
+(db_queries, db_time_ms); the same statement shape running more than N
+times in one request is logged as n_plus_one_query. The slowest statement
+and AI call time (AI adapters) go into slow_request.
+
+Statements slower than the slow query threshold are logged as slow_query
+(in and outside requests), with parameters masked by the log redaction.
+
+The contextvar holds a mutable object, so statements executed in the
+threadpool (sync endpoints and dependencies run in a copied context) are
+counted for the request too. Outside a request nothing is recorded.
+"""
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from infrastructure.logging.processors import redact_sensitive_data
+
+logger = structlog.get_logger("infrastructure.database")
+
+_current: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+# IN lists / VALUES rows with any number of placeholders: (?, ?, ?) -> (?)
+_PLACEHOLDER_LIST = re.compile(
+    r"\(\s*(?:\?|%\(\w+\)s|%s|:\w+|\$\d+)(?:\s*,\s*(?:\?|%\(\w+\)s|%s|:\w+|\$\d+))+\s*\)"
+)
+_WHITESPACE = re.compile(r"\s+")
+
+MAX_PARAMETER_LENGTH = 200
+
+# Statements at or above are logged as slow_query (instrument_engine), 0 = off
+_slow_query_ms: float = 0.0
+
+
+@lru_cache(maxsize=1024)
+def statement_shape(statement: str) -> str:
+    """Statement with IN lists collapsed (same query, different list sizes match)."""
+    return _WHITESPACE.sub(" ", _PLACEHOLDER_LIST.sub("(?)", statement)).strip()
+
+
+@dataclass
+class QueryStats:
+    """Statements and database time of one request."""
+
+    count: int = 0
+    time_ms: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+    # (ms, statement, parameters) of the slowest statement
+    slowest: Optional[Tuple[float, str, Any]] = None
+    ai_calls: int = 0
+    ai_time_ms: float = 0.0
+
+    def record(self, statement: str, seconds: float, parameters: Any = None) -> None:
+        ms = seconds * 1000
+        self.count += 1
+        self.time_ms += ms
+        self.shapes[statement_shape(statement)] += 1
+        if self.slowest is None or ms > self.slowest[0]:
+            self.slowest = (ms, statement, parameters)
+
+    def record_ai_call(self, seconds: float) -> None:
+        self.ai_calls += 1
+        self.ai_time_ms += seconds * 1000
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statement shapes executed more than `threshold` times."""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count > threshold]
+
+
+def start_query_stats() -> Tuple[QueryStats, Token]:
+    """
+    Start counting for the current request.
+
+    Returns:
+        (stats, token for reset_query_stats())
+    """
+    stats = QueryStats()
+    return stats, _current.set(stats)
+
+
+def reset_query_stats(token: Token) -> None:
+    """Stop counting (restore the previous stats)."""
+    _current.reset(token)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Stats of the current request, None outside a request."""
+    return _current.get()
+
+
+def masked_parameters(parameters: Any) -> Optional[Dict[str, Any]]:
+    """
+    Statement parameters for logs: long values cut, sensitive ones masked
+    (redact_sensitive_data on parameter names and values).
+
+    Positional parameters are named by position ("1", "2", ...); for
+    executemany only the first row is kept.
+    """
+    if not parameters:
+        return None
+    if isinstance(parameters, (list, tuple)) and isinstance(parameters[0], (dict, list, tuple)):
+        parameters = parameters[0]
+    if isinstance(parameters, dict):
+        items = parameters.items()
+    else:
+        items = ((str(position), value) for position, value in enumerate(parameters, 1))
+
+    masked = {}
+    for key, value in items:
+        if not isinstance(value, (str, int, float, bool, type(None))):
+            value = repr(value)
+        if isinstance(value, str) and len(value) > MAX_PARAMETER_LENGTH:
+            value = value[:MAX_PARAMETER_LENGTH] + "..."
+        masked[str(key)] = value
+    return redact_sensitive_data(None, None, masked)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None and (_slow_query_ms or _current.get() is not None):
+        context._query_stats_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    start = getattr(context, "_query_stats_start", None)
+    if start is None:
+        return
+    seconds = time.perf_counter() - start
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, seconds, parameters)
+    if _slow_query_ms and seconds * 1000 >= _slow_query_ms:
+        logger.warning(
+            "slow_query",
+            statement=statement_shape(statement)[:500],
+            duration_ms=round(seconds * 1000, 2),
+            parameters=masked_parameters(parameters),
+            threshold_ms=_slow_query_ms,
+        )
+
+
+def instrument_engine(engine: Engine, slow_query_ms: Optional[float] = None) -> None:
+    """
+    Attach the counting listeners (idempotent).
+
+    Args:
+        engine: SQLAlchemy engine
+        slow_query_ms: Log statements at or above as slow_query (0 = off,
+            None = keep the current setting; applies to all engines)
+    """
+    global _slow_query_ms
+    if slow_query_ms is not None:
+        _slow_query_ms = slow_query_ms
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def capture_queries(engine: Engine) -> Iterator[List[str]]:
+    """
+    Collect every statement executed on `engine` inside the block.
+
+    For tests (any thread, no request needed):
+        with capture_queries(engine) as statements:
+            client.delete(f"/api/v1/items/{item_id}")
+        assert len(statements) == 4
+    """
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
@@ -0,0 +1,55 @@
+"""
+Tracing Infrastructure
+
+Lightweight, OpenTelemetry-compatible request tracing: W3C traceparent in
+and out, spans for middleware, auth, repository, SQL and AI calls, OTLP
+JSON export to a file or memory. Off by default (TRACING_ENABLED);
+instrumented code then costs one contextvar lookup.
+
+Usage:
+    >>> from infrastructure.tracing import Tracer, FileSpanExporter, configure_tracing
+    >>> configure_tracing(Tracer(FileSpanExporter("logs/traces.jsonl"), sample_ratio=0.1))
+    >>> app.add_middleware(TracingMiddleware)
+    >>>
+    >>> @traced("ItemRepository.save")
+    ... def save(self, item): ...
+"""
+from .tracer import (
+    CLIENT,
+    INTERNAL,
+    SERVER,
+    Span,
+    Tracer,
+    configure_tracing,
+    current_span,
+    get_tracer,
+    inject_traceparent,
+    parse_traceparent,
+    shutdown_tracing,
+    start_span,
+    traced,
+)
+from .exporters import FileSpanExporter, InMemorySpanExporter, SpanExporter
+from .middleware import TracingMiddleware
+from .database import trace_engine
+
+__all__ = [
+    "Tracer",                 # Root spans, sampling, exporter
+    "Span",
+    "configure_tracing",      # Install / remove the process-wide tracer
+    "shutdown_tracing",       # Flush exporter (lifespan shutdown)
+    "get_tracer",
+    "current_span",
+    "start_span",             # Child span context manager
+    "traced",                 # Child span decorator (sync + async)
+    "inject_traceparent",     # Outgoing HTTP headers
+    "parse_traceparent",
+    "TracingMiddleware",      # SERVER span per request
+    "trace_engine",           # SQL statement spans
+    "SpanExporter",
+    "FileSpanExporter",       # OTLP JSON lines
+    "InMemorySpanExporter",   # Tests
+    "INTERNAL",
+    "SERVER",
+    "CLIENT",
+]
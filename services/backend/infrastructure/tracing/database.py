@@ -0,0 +1,54 @@
+"""
+SQL Spans
+
+One CLIENT span ("db.query") per statement, from SQLAlchemy cursor events.
+The statement attribute is the statement shape (IN lists collapsed, no
+parameter values), so spans never carry user data.
+"""
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from infrastructure.query_stats import statement_shape
+
+from .tracer import CLIENT, child_span
+
+MAX_STATEMENT_LENGTH = 2000
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is None:
+        return
+    span = child_span("db.query", CLIENT)
+    if span is not None:
+        span.attributes.update({
+            "db.system": conn.dialect.name,
+            "db.statement": statement_shape(statement)[:MAX_STATEMENT_LENGTH],
+        })
+        if executemany:
+            span.attributes["db.executemany"] = True
+        context._trace_span = span
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    span = getattr(context, "_trace_span", None)
+    if span is not None:
+        if cursor.rowcount is not None and cursor.rowcount >= 0:
+            span.attributes["db.rows_affected"] = cursor.rowcount
+        span.end()
+        context._trace_span = None
+
+
+def _handle_error(exception_context) -> None:
+    span = getattr(exception_context.execution_context, "_trace_span", None)
+    if span is not None:
+        span.record_exception(exception_context.original_exception)
+        span.end()
+        exception_context.execution_context._trace_span = None
+
+
+def trace_engine(engine: Engine) -> None:
+    """Attach the span listeners (idempotent)."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
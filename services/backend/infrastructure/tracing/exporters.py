@@ -0,0 +1,169 @@
+"""
+Span Exporters
+
+Finished spans go to an exporter. export() is called on the request path
+and must not block: FileSpanExporter only appends to a buffer, a
+background thread writes OTLP JSON lines (one ExportTraceServiceRequest
+per batch, loadable by OTel collectors' file receivers and Jaeger/Tempo
+import tools).
+"""
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+_KIND_NAMES = {1: "SPAN_KIND_INTERNAL", 2: "SPAN_KIND_SERVER", 3: "SPAN_KIND_CLIENT"}
+
+
+class SpanExporter(ABC):
+    """Receives finished, recording spans."""
+
+    @abstractmethod
+    def export(self, span) -> None:
+        """Accept one finished span (must not block)."""
+
+    def shutdown(self) -> None:
+        """Flush and release resources."""
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps the last `max_spans` spans (tests, debugging)."""
+
+    def __init__(self, max_spans: int = 10000):
+        self._spans: deque = deque(maxlen=max_spans)
+
+    def export(self, span) -> None:
+        self._spans.append(span)
+
+    def get_finished_spans(self) -> List[Any]:
+        return list(self._spans)
+
+    def clear(self) -> None:
+        self._spans.clear()
+
+
+class FileSpanExporter(SpanExporter):
+    """
+    OTLP JSON lines, written in batches from a background thread.
+
+    Fork-safe: a worker that inherited the exporter starts its own writer
+    thread on first export. Spans beyond `max_queue` are dropped (counted).
+    """
+
+    def __init__(self, path: str, service_name: str = "chrisbuilds64-api",
+                 flush_interval: float = 1.0, max_queue: int = 10000):
+        """
+        Args:
+            path: Output file (appended, created with parent directories)
+            service_name: OTel service.name resource attribute
+            flush_interval: Seconds between writes
+            max_queue: Buffered spans before new ones are dropped
+        """
+        self.path = Path(path)
+        self.service_name = service_name
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.dropped = 0
+        self._buffer: List[Any] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    def export(self, span) -> None:
+        if self._pid != os.getpid():
+            self._start()
+        with self._lock:
+            if len(self._buffer) >= self.max_queue:
+                self.dropped += 1
+                return
+            self._buffer.append(span)
+
+    def flush(self) -> None:
+        """Write buffered spans now."""
+        with self._lock:
+            spans, self._buffer = self._buffer, []
+        if spans:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "ab") as f:
+                f.write(orjson.dumps(to_otlp(spans, self.service_name)) + b"\n")
+
+    def shutdown(self) -> None:
+        if self._thread is not None and self._pid == os.getpid():
+            self._stop.set()
+            self._thread.join(timeout=self.flush_interval + 1)
+            self._thread = None
+        self.flush()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # Spans buffered by the parent before fork are the parent's to write
+            self._buffer = []
+            self._pid = os.getpid()
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except OSError:
+                # Disk full / permissions: lose this batch, keep serving requests
+                pass
+
+
+def to_otlp(spans: List[Any], service_name: str) -> Dict[str, Any]:
+    """Spans as an OTLP/JSON ExportTraceServiceRequest."""
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": _attributes({"service.name": service_name})},
+            "scopeSpans": [{
+                "scope": {"name": "infrastructure.tracing"},
+                "spans": [_span_to_otlp(span) for span in spans],
+            }],
+        }],
+    }
+
+
+def _span_to_otlp(span) -> Dict[str, Any]:
+    data = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": _KIND_NAMES.get(span.kind, "SPAN_KIND_INTERNAL"),
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": _attributes(span.attributes),
+        "status": {"code": span.status_code},
+    }
+    if span.parent_span_id:
+        data["parentSpanId"] = span.parent_span_id
+    if span.status_message:
+        data["status"]["message"] = span.status_message
+    if span.events:
+        data["events"] = [
+            {"name": e["name"], "timeUnixNano": str(e["time_ns"]), "attributes": _attributes(e["attributes"])}
+            for e in span.events
+        ]
+    return data
+
+
+def _attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _any_value(value)} for key, value in attributes.items()]
+
+
+def _any_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
@@ -0,0 +1,80 @@
+"""
+Tracing Middleware
+
+Starts the SERVER span of every HTTP request: continues the caller's trace
+(W3C traceparent header) or starts a new one, and returns the
+traceparent of the server span in the response, so a client can look up
+its request in the trace store.
+
+Added outermost (outside LoggingMiddleware), so the span covers logging,
+load shedding and all other middleware. The span is named after the
+route template once routing is done ("GET /api/v1/items/{item_id}").
+
+Pure ASGI; passes requests through untouched when no tracer is configured.
+"""
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.metrics.middleware import UNMATCHED, route_template
+
+from .tracer import SERVER, STATUS_ERROR, activate, deactivate, get_tracer
+
+
+class TracingMiddleware:
+    """
+    Root span per request, traceparent in and out.
+
+    Usage:
+        >>> app.add_middleware(TracingMiddleware, excluded_paths=("/metrics", "/health"))
+    """
+
+    def __init__(self, app: ASGIApp, excluded_paths: tuple = ("/metrics",)):
+        """
+        Args:
+            app: ASGI app
+            excluded_paths: Path prefixes not traced (scrapes, probes)
+        """
+        self.app = app
+        self.excluded_paths = tuple(excluded_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        tracer = get_tracer()
+        if tracer is None or scope["type"] != "http" or scope["path"].startswith(self.excluded_paths):
+            await self.app(scope, receive, send)
+            return
+
+        # Raw paths are unbounded; the name gets the route template below
+        span = tracer.start_root(
+            scope["method"],
+            kind=SERVER,
+            traceparent=Headers(scope=scope).get("traceparent"),
+        )
+        if span.recording:
+            span.attributes.update({
+                "http.request.method": scope["method"],
+                "url.path": scope["path"],
+                "url.scheme": scope.get("scheme", "http"),
+            })
+        traceparent = span.traceparent
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                span.set_attribute("http.response.status_code", message["status"])
+                if message["status"] >= 500:
+                    span.set_status(STATUS_ERROR)
+                MutableHeaders(scope=message).append("traceparent", traceparent)
+            await send(message)
+
+        token = activate(span)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            span.record_exception(exc)
+            raise
+        finally:
+            deactivate(token)
+            route = route_template(scope)
+            if route != UNMATCHED:
+                span.name = f"{scope['method']} {route}"
+                span.set_attribute("http.route", route)
+            span.end()
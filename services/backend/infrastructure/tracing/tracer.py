@@ -0,0 +1,269 @@
+"""
+Tracer
+
+Minimal OpenTelemetry-compatible tracing: 128-bit trace IDs, 64-bit span
+IDs, W3C traceparent propagation, parent-based ratio sampling, OTel span
+kinds and status codes. Spans are exported as OTLP JSON (exporters.py).
+
+The current span lives in a contextvar. Only TracingMiddleware starts
+traces (root spans); start_span() elsewhere creates a child of the
+current span and is a no-op outside a sampled trace, so instrumented code
+(repository, SQL, AI) costs one contextvar lookup when tracing is off or
+the request is not sampled.
+"""
+import functools
+import inspect
+import os
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+# OTel SpanKind
+INTERNAL, SERVER, CLIENT = 1, 2, 3
+# OTel StatusCode
+STATUS_UNSET, STATUS_OK, STATUS_ERROR = 0, 1, 2
+
+_TRACEPARENT = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+_INVALID_TRACE_ID = "0" * 32
+_INVALID_SPAN_ID = "0" * 16
+
+
+class Span:
+    """One timed operation. Not recording: context carrier of an unsampled trace."""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_span_id", "kind", "recording",
+        "start_ns", "end_ns", "attributes", "status_code", "status_message", "events", "_tracer",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        span_id: str,
+        parent_span_id: Optional[str] = None,
+        kind: int = INTERNAL,
+        recording: bool = True,
+        attributes: Optional[Dict[str, Any]] = None,
+        tracer: Optional["Tracer"] = None,
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_span_id = parent_span_id
+        self.kind = kind
+        self.recording = recording
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = attributes or {}
+        self.status_code = STATUS_UNSET
+        self.status_message = ""
+        self.events: list = []
+        self._tracer = tracer
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.recording:
+            self.attributes[key] = value
+
+    def set_status(self, code: int, message: str = "") -> None:
+        if self.recording:
+            self.status_code = code
+            self.status_message = message
+
+    def record_exception(self, exc: BaseException) -> None:
+        """Add an OTel exception event and mark the span as failed."""
+        if not self.recording:
+            return
+        self.events.append({
+            "name": "exception",
+            "time_ns": time.time_ns(),
+            "attributes": {"exception.type": type(exc).__name__, "exception.message": str(exc)},
+        })
+        self.set_status(STATUS_ERROR, type(exc).__name__)
+
+    def end(self) -> None:
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if self.recording and self._tracer is not None:
+            self._tracer.exporter.export(self)
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e6
+
+    @property
+    def traceparent(self) -> str:
+        """W3C traceparent header value for this span."""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.recording else '00'}"
+
+
+class Tracer:
+    """Creates spans and hands finished ones to the exporter."""
+
+    def __init__(self, exporter, sample_ratio: float = 1.0, service_name: str = "chrisbuilds64-api"):
+        """
+        Args:
+            exporter: SpanExporter (exporters.py)
+            sample_ratio: Share of new traces recorded (0..1); incoming
+                traceparent decides for continued traces
+            service_name: OTel service.name resource attribute
+        """
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+        self.service_name = service_name
+        # TraceIdRatioBased: compare the lower 64 bits of the trace ID
+        self._threshold = int(max(0.0, min(1.0, sample_ratio)) * (2 ** 64 - 1))
+
+    def start_root(self, name: str, kind: int = SERVER, traceparent: Optional[str] = None,
+                   attributes: Optional[Dict[str, Any]] = None) -> Span:
+        """Start a trace, or continue the caller's (traceparent header)."""
+        parent = parse_traceparent(traceparent) if traceparent else None
+        if parent:
+            trace_id, parent_span_id, sampled = parent
+        else:
+            trace_id, parent_span_id = _random_id(16), None
+            sampled = int(trace_id[16:], 16) <= self._threshold if self._threshold else False
+        return Span(name, trace_id, _random_id(8), parent_span_id, kind, sampled, attributes, self)
+
+    def shutdown(self) -> None:
+        self.exporter.shutdown()
+
+
+_tracer: Optional[Tracer] = None
+_current: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def configure_tracing(tracer: Optional[Tracer]) -> None:
+    """Install the process-wide tracer (None disables tracing)."""
+    global _tracer
+    _tracer = tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+def shutdown_tracing() -> None:
+    """Flush and close the exporter (lifespan shutdown)."""
+    if _tracer is not None:
+        _tracer.shutdown()
+
+
+def current_span() -> Optional[Span]:
+    """Span of the current context (recording or not), None outside a trace."""
+    return _current.get()
+
+
+def activate(span: Span):
+    """Make `span` current; returns the token for deactivate()."""
+    return _current.set(span)
+
+
+def deactivate(token) -> None:
+    _current.reset(token)
+
+
+def child_span(name: str, kind: int = INTERNAL, attributes: Optional[Dict[str, Any]] = None) -> Optional[Span]:
+    """
+    Child of the current span, not made current (caller ends it).
+
+    Returns:
+        Span, or None outside a sampled trace
+    """
+    parent = _current.get()
+    if parent is None or not parent.recording:
+        return None
+    return Span(name, parent.trace_id, _random_id(8), parent.span_id, kind, True, attributes, parent._tracer)
+
+
+@contextmanager
+def start_span(name: str, kind: int = INTERNAL, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Optional[Span]]:
+    """
+    Child span of the current span, current inside the block.
+
+    Yields None outside a sampled trace. Exceptions are recorded on the
+    span and re-raised.
+    """
+    span = child_span(name, kind, attributes)
+    if span is None:
+        yield None
+        return
+
+    token = _current.set(span)
+    try:
+        yield span
+    except BaseException as exc:
+        span.record_exception(exc)
+        raise
+    finally:
+        _current.reset(token)
+        span.end()
+
+
+def traced(name: Optional[str] = None, kind: int = INTERNAL) -> Callable:
+    """
+    Decorator: run the function (sync or async) in a child span.
+
+    Usage:
+        >>> @traced("ItemRepository.save")
+        ... def save(self, item): ...
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        # Fast path outside sampled traces: no context manager, no span
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                parent = _current.get()
+                if parent is None or not parent.recording:
+                    return await func(*args, **kwargs)
+                with start_span(span_name, kind):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            parent = _current.get()
+            if parent is None or not parent.recording:
+                return func(*args, **kwargs)
+            with start_span(span_name, kind):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def parse_traceparent(header: str) -> Optional[Tuple[str, str, bool]]:
+    """
+    Parse a W3C traceparent header.
+
+    Returns:
+        (trace_id, parent span_id, sampled) or None if invalid
+    """
+    match = _TRACEPARENT.match(header.strip().lower())
+    if not match:
+        return None
+    version, trace_id, span_id, flags = match.groups()
+    if version == "ff" or trace_id == _INVALID_TRACE_ID or span_id == _INVALID_SPAN_ID:
+        return None
+    return trace_id, span_id, bool(int(flags, 16) & 0x01)
+
+
+def inject_traceparent(headers: Dict[str, str]) -> Dict[str, str]:
+    """Add the current span's traceparent to outgoing request headers."""
+    span = _current.get()
+    if span is not None:
+        headers["traceparent"] = span.traceparent
+    return headers
+
+
+def _random_id(num_bytes: int) -> str:
+    value = os.urandom(num_bytes).hex()
+    # All-zero IDs are invalid in W3C trace context
+    return value if value.strip("0") else _random_id(num_bytes)
@@ -18,7 +18,7 @@ from infrastructure.database_sqlalchemy import Base
 from infrastructure.config import config as app_config
 
 # Import all models so Alembic can detect them
-from adapters.database.models import ItemModel  # noqa
+from adapters.database.models import ItemModel, IdempotencyKeyModel  # noqa
 
 # Alembic Config object
 config = context.config
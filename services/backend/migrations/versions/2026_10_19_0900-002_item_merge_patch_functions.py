@@ -0,0 +1,88 @@
+"""item_merge_patch_functions
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19 09:00:00.000000
+
+SQL functions for in-database partial item updates (PATCH /items/{id}):
+- jsonb_merge_patch(target, patch): RFC 7386 JSON Merge Patch
+- jsonb_array_patch(arr, additions, removals): tag add/remove
+
+PostgreSQL only; other dialects (SQLite) patch in Python, nothing to create.
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+JSONB_MERGE_PATCH = """
+CREATE OR REPLACE FUNCTION jsonb_merge_patch(target jsonb, patch jsonb)
+RETURNS jsonb
+LANGUAGE plpgsql
+IMMUTABLE
+AS $$
+DECLARE
+    result jsonb;
+    k text;
+    v jsonb;
+BEGIN
+    IF patch IS NULL OR jsonb_typeof(patch) <> 'object' THEN
+        RETURN patch;
+    END IF;
+
+    IF target IS NULL OR jsonb_typeof(target) <> 'object' THEN
+        result := '{}'::jsonb;
+    ELSE
+        result := target;
+    END IF;
+
+    FOR k, v IN SELECT * FROM jsonb_each(patch) LOOP
+        IF jsonb_typeof(v) = 'null' THEN
+            result := result - k;
+        ELSE
+            result := jsonb_set(result, ARRAY[k], jsonb_merge_patch(result -> k, v));
+        END IF;
+    END LOOP;
+
+    RETURN result;
+END;
+$$;
+"""
+
+JSONB_ARRAY_PATCH = """
+CREATE OR REPLACE FUNCTION jsonb_array_patch(arr jsonb, additions jsonb, removals jsonb)
+RETURNS jsonb
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT coalesce(jsonb_agg(elem ORDER BY pos), '[]'::jsonb)
+    FROM (
+        SELECT DISTINCT ON (elem) elem, pos
+        FROM jsonb_array_elements(coalesce(arr, '[]'::jsonb) || coalesce(additions, '[]'::jsonb))
+             WITH ORDINALITY AS e(elem, pos)
+        WHERE NOT coalesce(removals, '[]'::jsonb) @> jsonb_build_array(elem)
+        ORDER BY elem, pos
+    ) kept
+$$;
+"""
+
+
+def upgrade() -> None:
+    """Create merge patch functions"""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(JSONB_MERGE_PATCH)
+    op.execute(JSONB_ARRAY_PATCH)
+
+
+def downgrade() -> None:
+    """Drop merge patch functions"""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP FUNCTION IF EXISTS jsonb_array_patch(jsonb, jsonb, jsonb)")
+    op.execute("DROP FUNCTION IF EXISTS jsonb_merge_patch(jsonb, jsonb)")
@@ -0,0 +1,34 @@
+"""item_sync_index
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19 10:00:00.000000
+
+Index for delta sync (GET /items/changes):
+(owner_id, coalesce(updated_at, created_at), id) so a sync is a keyset
+scan per owner, and a sync without changes is a single index probe.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create sync index"""
+    op.create_index(
+        'ix_items_owner_changed_at',
+        'items',
+        ['owner_id', sa.text('coalesce(updated_at, created_at)'), 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Drop sync index"""
+    op.drop_index('ix_items_owner_changed_at', table_name='items')
@@ -0,0 +1,29 @@
+"""idempotency_claim
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-20 09:00:00.000000
+
+Claim token on idempotency_keys: complete()/release() of a request whose
+claim expired and was taken over must not touch the new owner's row.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add claim column"""
+    op.add_column('idempotency_keys', sa.Column('claim', sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop claim column"""
+    with op.batch_alter_table('idempotency_keys') as batch_op:
+        batch_op.drop_column('claim')
@@ -0,0 +1,63 @@
+"""
+Item Change Events
+
+Emitted by ItemRepository write paths, fanned out to SSE subscribers
+(GET /items/stream) via an EventBroker.
+"""
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Dict
+
+# Event types
+ITEM_CREATED = "item.created"
+ITEM_UPDATED = "item.updated"
+ITEM_DELETED = "item.deleted"
+
+_id_lock = threading.Lock()
+_last_event_id = 0
+
+
+def next_event_id() -> int:
+    """
+    Unique event ID (nanosecond wall clock, strictly increasing per worker).
+
+    Only an identifier: IDs are assigned before commit, so events can be
+    delivered out of ID order. Brokers resume by position, not by `>`.
+    """
+    global _last_event_id
+    with _id_lock:
+        _last_event_id = max(_last_event_id + 1, time.time_ns())
+        return _last_event_id
+
+
+@dataclass(frozen=True)
+class ItemEvent:
+    """
+    Item mutation event.
+
+    Kept small on purpose: Postgres NOTIFY payloads are limited to 8000
+    bytes, so clients fetch changed items via POST /items/multi-get.
+
+    Attributes:
+        id: Unique event ID (used for Last-Event-ID resume)
+        type: item.created | item.updated | item.deleted
+        owner_id: Owner of the item (events are only sent to the owner)
+        item_id: Changed item
+    """
+    id: int
+    type: str
+    owner_id: str
+    item_id: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ItemEvent":
+        return cls(
+            id=int(data["id"]),
+            type=data["type"],
+            owner_id=data["owner_id"],
+            item_id=data["item_id"],
+        )
@@ -17,3 +17,9 @@ class ItemValidationError(ValidationError):
     """Item validation failed"""
     code = ErrorCodes.INVALID_INPUT
     message = "Item validation failed"
+
+
+class InvalidWatermarkError(ValidationError):
+    """Sync watermark could not be decoded"""
+    code = ErrorCodes.FORMAT_ERROR
+    message = "Invalid sync watermark"
@@ -37,5 +37,10 @@ class Item:
         return self.deleted_at is not None
 
     def soft_delete(self) -> None:
-        """Mark item as deleted"""
+        """Mark item as deleted (counts as a change for delta sync)"""
         self.deleted_at = datetime.utcnow()
+        self.updated_at = self.deleted_at
+
+    def changed_at(self) -> Optional[datetime]:
+        """Time of the last change (sync position)"""
+        return self.updated_at or self.created_at
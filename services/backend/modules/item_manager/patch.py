@@ -0,0 +1,89 @@
+"""
+Item Merge Patch
+
+RFC 7386 JSON Merge Patch semantics for partial item updates.
+https://datatracker.ietf.org/doc/html/rfc7386
+
+Used by adapters that cannot apply the patch in the database
+(MockDatabaseAdapter, SQLite). PostgreSQL applies the same semantics
+in-database via jsonb_merge_patch() / jsonb_array_patch()
+(migration 002).
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Iterable
+
+from .models import Item
+
+
+def apply_merge_patch(target: Any, patch: Any) -> Any:
+    """
+    Apply an RFC 7386 merge patch to a JSON value.
+
+    - Non-object patch replaces the target
+    - null members remove the key
+    - Object members are merged recursively
+
+    Args:
+        target: Current JSON value (not modified)
+        patch: Merge patch document
+
+    Returns:
+        Patched JSON value
+    """
+    if not isinstance(patch, dict):
+        return patch
+
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = apply_merge_patch(result.get(key), value)
+    return result
+
+
+def apply_tag_changes(tags: List[str], add: Iterable[str] = (), remove: Iterable[str] = ()) -> List[str]:
+    """
+    Add/remove tags, keeping first-seen order and dropping duplicates.
+
+    Removal wins if a tag is both added and removed.
+    """
+    removed = set(remove)
+    result: List[str] = []
+    for tag in list(tags) + list(add):
+        if tag not in removed and tag not in result:
+            result.append(tag)
+    return result
+
+
+def apply_item_patch(item: Item, changes: Dict[str, Any]) -> Item:
+    """
+    Apply a partial update to an Item in place.
+
+    Supported changes:
+        - label, content_type: replaced
+        - payload: RFC 7386 merge patch (null resets to {})
+        - tags: replaced (null resets to [])
+        - tags_add, tags_remove: applied after tags
+
+    Args:
+        item: Item to modify
+        changes: Patch document (only keys present are applied)
+
+    Returns:
+        The modified item
+    """
+    if "label" in changes:
+        item.label = changes["label"]
+    if "content_type" in changes:
+        item.content_type = changes["content_type"]
+    if "payload" in changes:
+        patch = changes["payload"]
+        item.payload = {} if patch is None else apply_merge_patch(item.payload, patch)
+    if "tags" in changes:
+        item.tags = list(changes["tags"] or [])
+    if changes.get("tags_add") or changes.get("tags_remove"):
+        item.tags = apply_tag_changes(item.tags, changes.get("tags_add") or (), changes.get("tags_remove") or ())
+
+    item.updated_at = datetime.utcnow()
+    return item
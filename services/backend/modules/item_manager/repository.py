@@ -4,11 +4,15 @@ Item Repository
 High-level repository using DatabaseAdapter.
 Abstracts database operations for Item domain.
 """
-from typing import Optional, List
+from typing import Optional, List, Any, Dict
 from datetime import datetime
 
 from adapters.database.base import DatabaseAdapter
+from adapters.events.base import EventPublisher
+from infrastructure.tracing import traced
 from .models import Item
+from .events import ItemEvent, ITEM_CREATED, ITEM_UPDATED, ITEM_DELETED, next_event_id
+from .sync import DEFAULT_SETTLE_SECONDS, ItemChanges, decode_watermark, encode_watermark, settled_position
 
 
 class ItemRepository:
@@ -18,15 +22,37 @@ class ItemRepository:
     Uses DatabaseAdapter interface - implementation injected.
     """
 
-    def __init__(self, db_adapter: DatabaseAdapter[Item]):
+    def __init__(
+        self,
+        db_adapter: DatabaseAdapter[Item],
+        events: Optional[EventPublisher] = None,
+        sync_settle_seconds: float = DEFAULT_SETTLE_SECONDS
+    ):
         """
         Initialize repository with database adapter.
 
         Args:
             db_adapter: Implementation of DatabaseAdapter (PostgreSQL, Mock, etc.)
+            events: Publisher for item change events (optional)
+            sync_settle_seconds: Changes this recent are sent again by
+                changes_since() (writes still in flight, see sync.py)
         """
         self.db = db_adapter
+        self.events = events
+        self.sync_settle_seconds = sync_settle_seconds
+
+    def _emit(self, event_type: str, item: Item) -> None:
+        """Publish change event for write paths (no-op without publisher)."""
+        if self.events is None:
+            return
+        self.events.publish(ItemEvent(
+            id=next_event_id(),
+            type=event_type,
+            owner_id=item.owner_id,
+            item_id=item.id
+        ))
 
+    @traced("ItemRepository.save")
     def save(self, item: Item) -> Item:
         """
         Save item to database.
@@ -37,8 +63,11 @@ class ItemRepository:
         Returns:
             Saved item with ID
         """
-        return self.db.save(item)
+        saved = self.db.save(item)
+        self._emit(ITEM_CREATED, saved)
+        return saved
 
+    @traced("ItemRepository.find_by_id")
     def find_by_id(self, item_id: str) -> Optional[Item]:
         """
         Find item by ID (excludes soft-deleted).
@@ -54,6 +83,30 @@ class ItemRepository:
             return item
         return None
 
+    @traced("ItemRepository.find_many_by_ids")
+    def find_many_by_ids(
+        self,
+        item_ids: List[str],
+        owner_id: Optional[str] = None
+    ) -> List[Optional[Item]]:
+        """
+        Find several items by ID (excludes soft-deleted).
+
+        Args:
+            item_ids: Item UUIDs
+            owner_id: Only return items owned by this user
+
+        Returns:
+            One entry per requested ID, in request order;
+            None where the item is missing, deleted or not owned
+        """
+        found = {
+            item.id: item
+            for item in self.db.find_many_by_ids(item_ids, owner_id=owner_id)
+        }
+        return [found.get(item_id) for item_id in item_ids]
+
+    @traced("ItemRepository.find_all")
     def find_all(
         self,
         owner_id: Optional[str] = None,
@@ -97,6 +150,54 @@ class ItemRepository:
         # Apply pagination (adapter handles sorting)
         return items[offset:offset + limit]
 
+    @traced("ItemRepository.changes_since")
+    def changes_since(
+        self,
+        owner_id: str,
+        watermark: Optional[str] = None,
+        limit: int = 500
+    ) -> ItemChanges:
+        """
+        Get items changed since a watermark (delta sync).
+
+        Without a watermark this is the initial sync: all live items, no
+        tombstones. Hard-deleted items are not reported. Changes from the
+        last sync_settle_seconds are returned again (de-dupe by id).
+
+        Args:
+            owner_id: Owner whose items to sync
+            watermark: Cursor from a previous call
+            limit: Max changes per page
+
+        Returns:
+            ItemChanges with the new watermark
+
+        Raises:
+            InvalidWatermarkError: watermark is malformed
+        """
+        since = decode_watermark(watermark) if watermark else None
+        changed = self.db.find_changed_since(owner_id, since=since, limit=limit + 1)
+
+        has_more = len(changed) > limit
+        changed = changed[:limit]
+
+        position = (changed[-1].changed_at(), changed[-1].id) if changed else since
+        if position is not None and not has_more:
+            # Writes stamped before this point may not have committed yet
+            position = min(position, settled_position(self.sync_settle_seconds))
+
+        result = ItemChanges(has_more=has_more)
+        if position is not None:
+            result.watermark = encode_watermark(position)
+
+        for item in changed:
+            if not item.is_deleted():
+                result.items.append(item)
+            elif since is not None:
+                result.deleted.append(item)
+        return result
+
+    @traced("ItemRepository.update")
     def update(self, item: Item) -> Item:
         """
         Update existing item.
@@ -108,8 +209,38 @@ class ItemRepository:
             Updated item
         """
         item.updated_at = datetime.utcnow()
-        return self.db.update(item)
+        updated = self.db.update(item)
+        self._emit(ITEM_UPDATED, updated)
+        return updated
+
+    @traced("ItemRepository.patch")
+    def patch(
+        self,
+        item_id: str,
+        changes: Dict[str, Any],
+        owner_id: Optional[str] = None
+    ) -> Optional[Item]:
+        """
+        Partially update item (RFC 7386 merge patch).
+
+        The adapter applies the patch, in-database where supported, so
+        the write scales with the size of the change.
+
+        Args:
+            item_id: Item UUID
+            changes: Patch document (label, content_type, payload,
+                tags, tags_add, tags_remove)
+            owner_id: Only patch if owned by this user
+
+        Returns:
+            Patched item, or None if not found, deleted or not owned
+        """
+        patched = self.db.merge_patch(item_id, changes, owner_id=owner_id)
+        if patched:
+            self._emit(ITEM_UPDATED, patched)
+        return patched
 
+    @traced("ItemRepository.delete")
     def delete(self, item_id: str, hard: bool = False) -> bool:
         """
         Delete item.
@@ -122,7 +253,12 @@ class ItemRepository:
             True if deleted
         """
         if hard:
-            return self.db.delete(item_id)
+            # Owner is only needed for the change event
+            item = self.db.find_by_id(item_id) if self.events else None
+            deleted = self.db.delete(item_id)
+            if deleted and item:
+                self._emit(ITEM_DELETED, item)
+            return deleted
         else:
             # Soft delete: update deleted_at timestamp
             item = self.db.find_by_id(item_id)
@@ -130,8 +266,10 @@ class ItemRepository:
                 return False
             item.soft_delete()
             self.db.update(item)
+            self._emit(ITEM_DELETED, item)
             return True
 
+    @traced("ItemRepository.restore")
     def restore(self, item_id: str) -> Optional[Item]:
         """
         Restore soft-deleted item.
@@ -146,5 +284,7 @@ class ItemRepository:
         if item and item.is_deleted():
             item.deleted_at = None
             item.updated_at = datetime.utcnow()
-            return self.db.update(item)
+            restored = self.db.update(item)
+            self._emit(ITEM_CREATED, restored)
+            return restored
         return None
@@ -0,0 +1,129 @@
+"""
+AnthropicAdapter tests against a local HTTP server: pooled keep-alive
+connections (sync and async), lifecycle hooks, response mapping.
+"""
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from adapters.ai import Message, MockAIAdapter
+from adapters.ai import anthropic_adapter
+from adapters.ai.anthropic_adapter import AnthropicAdapter
+from api.dependencies import close_ai_adapter, get_ai_adapter
+
+MESSAGES = [Message(role="system", content="Be brief."), Message(role="user", content="Hi")]
+
+
+class FakeAnthropicHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append((dict(self.headers), request))
+        body = json.dumps({
+            "content": [{"type": "text", "text": "Hello"}],
+            "model": request["model"],
+            "usage": {"input_tokens": 7, "output_tokens": 3},
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeAnthropicHandler)
+    server.connections = 0
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def adapter(server):
+    adapter = AnthropicAdapter(api_key="test-key", model="claude-test")
+    adapter.API_URL = f"http://127.0.0.1:{server.server_address[1]}/v1/messages"
+    yield adapter
+    adapter.close()
+
+
+class TestPooledClient:
+
+    def test_sync_calls_share_one_connection(self, adapter, server):
+        for _ in range(3):
+            response = adapter.complete(MESSAGES)
+        assert response.content == "Hello"
+        assert response.usage == {"prompt_tokens": 7, "completion_tokens": 3}
+        assert server.connections == 1
+
+        headers, payload = server.requests[0]
+        assert headers["x-api-key"] == "test-key"
+        assert payload["system"] == "Be brief."
+        assert payload["messages"] == [{"role": "user", "content": "Hi"}]
+
+    def test_sync_client_shared_across_threads(self, adapter):
+        clients = []
+        threads = [threading.Thread(target=lambda: clients.append(adapter.client)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({id(client) for client in clients}) == 1
+
+    def test_async_lifecycle(self, adapter, server):
+        async def run():
+            await adapter.start()
+            client = adapter.async_client
+            for _ in range(3):
+                response = await adapter.complete_async(MESSAGES)
+            assert adapter.async_client is client
+            await adapter.aclose()
+            return response, client
+
+        response, client = asyncio.run(run())
+        assert response.content == "Hello"
+        assert server.connections == 1
+        assert client.is_closed
+        assert adapter._async_client is None and adapter._client is None
+
+    def test_new_loop_gets_new_async_client(self, adapter):
+        async def client_of_loop():
+            return adapter.async_client
+
+        first = asyncio.run(client_of_loop())
+        assert asyncio.run(client_of_loop()) is not first
+
+    def test_limits_and_http2(self):
+        adapter = AnthropicAdapter(api_key="k", max_connections=5, max_keepalive_connections=2, keepalive_expiry=10)
+        assert adapter.limits.max_connections == 5
+        assert adapter.limits.max_keepalive_connections == 2
+        # HTTP/2 only with the optional h2 package
+        assert adapter.http2 is (anthropic_adapter.h2 is not None)
+        assert AnthropicAdapter(api_key="k", http2=False).http2 is False
+
+    def test_timeout_capped_by_connect_timeout(self):
+        timeout = AnthropicAdapter(api_key="k", timeout=30, connect_timeout=2)._check_deadline()
+        assert timeout.read == 30 and timeout.connect == 2
+
+
+def test_test_env_uses_mock_adapter():
+    adapter = get_ai_adapter()
+    assert isinstance(adapter, MockAIAdapter)
+    assert get_ai_adapter() is adapter
+    asyncio.run(close_ai_adapter())
+    assert get_ai_adapter() is not adapter
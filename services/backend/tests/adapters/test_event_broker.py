@@ -0,0 +1,85 @@
+"""
+InProcessEventBroker unit tests.
+"""
+import asyncio
+
+from adapters.events.memory import InProcessEventBroker
+from modules.item_manager.events import ItemEvent, ITEM_CREATED, next_event_id
+
+
+def _event(owner_id="user-1", item_id="item-1"):
+    return ItemEvent(id=next_event_id(), type=ITEM_CREATED, owner_id=owner_id, item_id=item_id)
+
+
+class TestInProcessEventBroker:
+
+    def test_delivers_to_owner_only(self):
+        async def scenario():
+            broker = InProcessEventBroker()
+            mine = broker.subscribe("user-1")
+            other = broker.subscribe("user-2")
+            event = _event()
+            broker.publish(event)
+            received = await asyncio.wait_for(mine.queue.get(), 1)
+            assert received == event
+            await asyncio.sleep(0)
+            assert other.queue.empty()
+
+        asyncio.run(scenario())
+
+    def test_replay_after_last_event_id(self):
+        async def scenario():
+            broker = InProcessEventBroker()
+            first, second, third = _event(item_id="a"), _event(item_id="b"), _event(item_id="c")
+            for event in (first, second, third):
+                broker.publish(event)
+            subscription = broker.subscribe("user-1", last_event_id=first.id)
+            assert [e.item_id for e in subscription.replay] == ["b", "c"]
+            assert subscription.reset is False
+
+        asyncio.run(scenario())
+
+    def test_reset_when_events_evicted(self):
+        async def scenario():
+            broker = InProcessEventBroker(buffer_size=2)
+            events = [_event(item_id=str(i)) for i in range(4)]
+            for event in events:
+                broker.publish(event)
+            subscription = broker.subscribe("user-1", last_event_id=events[0].id)
+            assert subscription.reset is True
+
+        asyncio.run(scenario())
+
+    def test_replay_by_position_when_ids_out_of_order(self):
+        # A gets its ID first, B commits (is published) first
+        async def scenario():
+            broker = InProcessEventBroker()
+            a, b = _event(item_id="a"), _event(item_id="b")
+            assert a.id < b.id
+            broker.publish(b)
+            broker.publish(a)
+            subscription = broker.subscribe("user-1", last_event_id=b.id)
+            assert [e.item_id for e in subscription.replay] == ["a"]
+            assert subscription.reset is False
+
+        asyncio.run(scenario())
+
+    def test_reset_when_last_event_id_unknown(self):
+        async def scenario():
+            broker = InProcessEventBroker()
+            broker.publish(_event())
+            subscription = broker.subscribe("user-1", last_event_id=1)
+            assert subscription.reset is True
+            assert subscription.replay == []
+
+        asyncio.run(scenario())
+
+    def test_unsubscribe(self):
+        async def scenario():
+            broker = InProcessEventBroker()
+            subscription = broker.subscribe("user-1")
+            assert broker.subscriber_count("user-1") == 1
+            broker.unsubscribe(subscription)
+            assert broker.subscriber_count("user-1") == 0
+
+        asyncio.run(scenario())
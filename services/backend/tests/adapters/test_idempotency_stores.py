@@ -0,0 +1,97 @@
+"""
+Idempotency store tests (memory + SQL on in-memory SQLite).
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from adapters.database.models import IdempotencyKeyModel
+from adapters.idempotency import MemoryIdempotencyStore, StoredResponse
+from adapters.idempotency.sql import SQLIdempotencyStore
+
+RESPONSE = StoredResponse(201, [("content-type", "application/json")], b'{"id": "1"}')
+
+
+@pytest.fixture(params=["memory", "sql"])
+def make_store(request):
+    def factory(**kwargs):
+        if request.param == "memory":
+            return MemoryIdempotencyStore(**kwargs)
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        IdempotencyKeyModel.__table__.create(engine)
+        return SQLIdempotencyStore(sessionmaker(bind=engine), **kwargs)
+    return factory
+
+
+class TestStores:
+
+    def test_first_begin_claims(self, make_store):
+        store = make_store()
+        assert store.begin("u:k", "fp", "c1") is None
+        record = store.begin("u:k", "fp", "c1")
+        assert record.in_progress
+        assert record.fingerprint == "fp"
+
+    def test_complete_stores_response(self, make_store):
+        store = make_store()
+        store.begin("u:k", "fp", "c1")
+        store.complete("u:k", "c1", RESPONSE)
+        record = store.begin("u:k", "fp", "c1")
+        assert not record.in_progress
+        assert record.response == RESPONSE
+
+    def test_release_allows_new_claim(self, make_store):
+        store = make_store()
+        store.begin("u:k", "fp", "c1")
+        store.release("u:k", "c1")
+        assert store.get("u:k") is None
+        assert store.begin("u:k", "fp", "c1") is None
+
+    def test_abandoned_claim_taken_over(self, make_store):
+        store = make_store(lock_timeout=0)
+        store.begin("u:k", "fp", "c1")
+        assert store.begin("u:k", "fp2", "c2") is None
+        assert store.get("u:k") is None  # new claim also already expired
+
+    def test_expired_response_forgotten(self, make_store):
+        store = make_store(ttl=0)
+        store.begin("u:k", "fp", "c1")
+        store.complete("u:k", "c1", RESPONSE)
+        assert store.get("u:k") is None
+        assert store.begin("u:k", "fp", "c1") is None
+
+    def test_taken_over_claim_cannot_complete_or_release(self, make_store):
+        store = make_store(lock_timeout=0)
+        store.begin("u:k", "fp", "slow")
+        store.lock_timeout = 60
+        assert store.begin("u:k", "fp", "retry") is None  # abandoned claim taken over
+
+        store.release("u:k", "slow")
+        assert store.get("u:k").in_progress
+        store.complete("u:k", "slow", RESPONSE)
+        assert store.get("u:k").in_progress
+
+        store.complete("u:k", "retry", RESPONSE)
+        assert store.get("u:k").response == RESPONSE
+
+    def test_keys_are_independent(self, make_store):
+        store = make_store()
+        store.begin("u:a", "fp", "c1")
+        assert store.begin("u:b", "fp", "c1") is None
+
+    def test_reset(self, make_store):
+        store = make_store()
+        store.begin("u:k", "fp", "c1")
+        store.reset()
+        assert store.begin("u:k", "fp", "c1") is None
+
+
+def test_sql_purge_expired():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    IdempotencyKeyModel.__table__.create(engine)
+    store = SQLIdempotencyStore(sessionmaker(bind=engine), ttl=0, purge_every=0)
+    for key in ("u:a", "u:b"):
+        store.begin(key, "fp", "c1")
+        store.complete(key, "c1", RESPONSE)
+    assert store.purge_expired() == 2
@@ -74,3 +74,9 @@ class TestMockDatabaseAdapter:
         db.save(Item(owner_id="u1", label="A"))
         db.clear()
         assert db.find_all() == []
+
+    def test_find_many_by_ids(self, db):
+        a = db.save(Item(owner_id="user-1", label="A"))
+        b = db.save(Item(owner_id="user-2", label="B"))
+        results = db.find_many_by_ids([a.id, b.id, "missing"], owner_id="user-1")
+        assert [r.id for r in results] == [a.id]
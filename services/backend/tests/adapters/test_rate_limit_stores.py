@@ -0,0 +1,68 @@
+"""
+Rate limit store tests (GCRA).
+"""
+import pytest
+
+from adapters.rate_limit import MemoryRateLimitStore, gcra
+from adapters.rate_limit.shared_memory import SharedMemoryRateLimitStore
+
+
+class TestGcra:
+
+    def test_allows_burst_up_to_limit(self):
+        tat, now = 0.0, 100.0
+        for _ in range(5):
+            allowed, tat, _ = gcra(tat, now, limit=5, period=10)
+            assert allowed
+        allowed, _, retry_after = gcra(tat, now, limit=5, period=10)
+        assert not allowed
+        assert retry_after == pytest.approx(2.0)
+
+    def test_tokens_refill_over_time(self):
+        tat, now = 0.0, 100.0
+        for _ in range(5):
+            _, tat, _ = gcra(tat, now, limit=5, period=10)
+        allowed, _, _ = gcra(tat, now + 2.0, limit=5, period=10)
+        assert allowed
+
+
+@pytest.fixture(params=["memory", "shm"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryRateLimitStore()
+    return SharedMemoryRateLimitStore(str(tmp_path / "ratelimit"), slots=64)
+
+
+class TestStores:
+
+    def test_remaining_counts_down_then_denies(self, store):
+        results = [store.acquire("k", limit=3, period=60) for _ in range(4)]
+        assert [r.allowed for r in results] == [True, True, True, False]
+        assert [r.remaining for r in results[:3]] == [2, 1, 0]
+        assert results[3].retry_after > 0
+
+    def test_keys_are_independent(self, store):
+        for _ in range(3):
+            store.acquire("a", limit=3, period=60)
+        assert store.acquire("b", limit=3, period=60).allowed
+
+    def test_reset(self, store):
+        for _ in range(3):
+            store.acquire("k", limit=3, period=60)
+        store.reset()
+        assert store.acquire("k", limit=3, period=60).remaining == 2
+
+
+def test_shared_memory_store_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "ratelimit")
+    worker_a = SharedMemoryRateLimitStore(path, slots=64)
+    worker_b = SharedMemoryRateLimitStore(path, slots=64)
+    worker_a.acquire("k", limit=2, period=60)
+    worker_a.acquire("k", limit=2, period=60)
+    assert not worker_b.acquire("k", limit=2, period=60).allowed
+
+
+def test_shared_memory_store_evicts_when_window_full(tmp_path):
+    store = SharedMemoryRateLimitStore(str(tmp_path / "ratelimit"), slots=8)
+    for i in range(20):
+        assert store.acquire(f"user-{i}", limit=1, period=60).allowed
@@ -0,0 +1,106 @@
+"""
+CompressionMiddleware tests.
+
+Negotiation, size threshold, content-type allow-list, streaming and
+excluded static paths.
+"""
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from api.middleware.compression import CompressionMiddleware, negotiate_encoding
+
+zstandard = pytest.importorskip("zstandard")
+
+BIG_TEXT = "chrisbuilds64 " * 500
+
+
+@pytest.fixture
+def compress_client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/big")
+    async def big():
+        return PlainTextResponse(BIG_TEXT)
+
+    @app.get("/small")
+    async def small():
+        return PlainTextResponse("tiny")
+
+    @app.get("/binary")
+    async def binary():
+        return Response(b"\x00" * 4096, media_type="image/png")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(5):
+                yield BIG_TEXT
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/app/tweight/main.js")
+    async def static_asset():
+        return PlainTextResponse(BIG_TEXT)
+
+    with TestClient(app) as c:
+        yield c
+
+
+class TestNegotiation:
+
+    def test_server_preference_on_tie(self):
+        assert negotiate_encoding("gzip, br, zstd", ("zstd", "br", "gzip")) == "zstd"
+
+    def test_q_values(self):
+        assert negotiate_encoding("gzip;q=1.0, br;q=0.5", ("zstd", "br", "gzip")) == "gzip"
+
+    def test_refused_encoding(self):
+        assert negotiate_encoding("gzip;q=0", ("gzip",)) is None
+
+    def test_wildcard(self):
+        assert negotiate_encoding("*", ("br", "gzip")) == "br"
+
+    def test_empty_header(self):
+        assert negotiate_encoding("", ("gzip",)) is None
+
+
+class TestCompressionMiddleware:
+
+    def test_gzip(self, compress_client):
+        response = compress_client.get("/big", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.text == BIG_TEXT
+
+    def test_zstd(self, compress_client):
+        response = compress_client.get("/big", headers={"Accept-Encoding": "zstd"})
+        assert response.headers["content-encoding"] == "zstd"
+        assert int(response.headers["content-length"]) < len(BIG_TEXT)
+        assert zstandard.ZstdDecompressor().decompressobj().decompress(response.content).decode() == BIG_TEXT
+
+    def test_below_threshold_not_compressed(self, compress_client):
+        response = compress_client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+
+    def test_content_type_not_allowed(self, compress_client):
+        response = compress_client.get("/binary", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+
+    def test_no_accept_encoding(self, compress_client):
+        response = compress_client.get("/big", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+
+    def test_streaming_compressed_incrementally(self, compress_client):
+        with compress_client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+            assert response.headers["content-encoding"] == "gzip"
+            assert "content-length" not in response.headers
+            raw = b"".join(response.iter_raw())
+        assert gzip.decompress(raw).decode() == BIG_TEXT * 5
+
+    def test_static_apps_excluded(self, compress_client):
+        response = compress_client.get("/app/tweight/main.js", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
@@ -0,0 +1,150 @@
+"""
+Request deadline tests.
+
+DeadlineMiddleware (timeout selection, fail-fast 504) and the deadline
+contextvar helpers.
+"""
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.middleware.deadline import DeadlineMiddleware, parse_route_timeouts, parse_timeout_header
+from infrastructure.deadline import (
+    DeadlineExceededError, check_deadline, remaining, reset_deadline, set_deadline,
+    timeout_within_deadline
+)
+from infrastructure.errors import register_exception_handlers
+
+
+@pytest.fixture
+def deadline_client():
+    app = FastAPI()
+    app.add_middleware(
+        DeadlineMiddleware,
+        default_timeout=5.0,
+        route_timeouts="/stream=0,POST /slow=0.05"
+    )
+    register_exception_handlers(app)
+
+    @app.get("/slow")
+    async def slow():
+        await asyncio.sleep(1.0)
+        return {"ok": True}
+
+    @app.post("/slow")
+    async def slow_post():
+        await asyncio.sleep(1.0)
+        return {"ok": True}
+
+    @app.get("/remaining")
+    async def remaining_async():
+        return {"remaining": remaining()}
+
+    @app.get("/remaining-sync")
+    def remaining_sync():
+        return {"remaining": remaining()}
+
+    @app.get("/stream")
+    async def stream():
+        return {"remaining": remaining()}
+
+    @app.get("/app-timeout")
+    async def app_timeout():
+        raise TimeoutError("upstream read timed out")
+
+    @app.get("/expired")
+    async def expired():
+        await asyncio.sleep(0.06)
+        check_deadline("ai")
+        return {"ok": True}
+
+    with TestClient(app) as client:
+        yield client
+
+
+class TestDeadlineMiddleware:
+
+    def test_header_deadline_fails_fast_with_504(self, deadline_client):
+        start = time.monotonic()
+        response = deadline_client.get("/slow", headers={"X-Request-Timeout": "50ms"})
+        assert time.monotonic() - start < 0.5
+        assert response.status_code == 504
+        assert response.headers["content-type"] == "application/problem+json"
+        assert response.json()["error_code"] == "E4005"
+
+    def test_route_rule_applies(self, deadline_client):
+        assert deadline_client.post("/slow").status_code == 504
+
+    def test_deadline_visible_in_async_and_sync_routes(self, deadline_client):
+        for path in ("/remaining", "/remaining-sync"):
+            left = deadline_client.get(path).json()["remaining"]
+            assert 4.0 < left <= 5.0
+
+    def test_header_cannot_extend_route_timeout(self, deadline_client):
+        left = deadline_client.get("/remaining", headers={"X-Request-Timeout": "600"}).json()["remaining"]
+        assert left <= 5.0
+
+    def test_header_ignored_without_deadline(self, deadline_client):
+        response = deadline_client.get("/stream", headers={"X-Request-Timeout": "1"})
+        assert response.json()["remaining"] is None
+
+    def test_app_timeout_error_is_not_a_deadline(self, deadline_client):
+        with pytest.raises(TimeoutError, match="upstream"):
+            deadline_client.get("/app-timeout")
+
+    def test_zero_means_no_deadline(self, deadline_client):
+        assert deadline_client.get("/stream").json()["remaining"] is None
+
+    def test_check_deadline_raises_504(self, deadline_client):
+        response = deadline_client.get("/expired", headers={"X-Request-Timeout": "0.05"})
+        assert response.status_code == 504
+
+
+def test_parse_route_timeouts_longest_prefix_first():
+    rules = parse_route_timeouts("/api=10, GET /api/v1/items=5 ,/api/v1/items/stream=0")
+    assert rules == [
+        (None, "/api/v1/items/stream", 0.0),
+        ("GET", "/api/v1/items", 5.0),
+        (None, "/api", 10.0),
+    ]
+
+
+@pytest.mark.parametrize("value, expected", [("2.5", 2.5), ("2500ms", 2.5), ("3s", 3.0), ("0", None), ("soon", None)])
+def test_parse_timeout_header(value, expected):
+    assert parse_timeout_header(value) == expected
+
+
+def test_nested_deadline_never_extends():
+    outer = set_deadline(1.0)
+    inner = set_deadline(60.0)
+    try:
+        assert remaining() <= 1.0
+        assert timeout_within_deadline(30.0) <= 1.0
+    finally:
+        reset_deadline(inner)
+        reset_deadline(outer)
+    assert remaining() is None
+    assert timeout_within_deadline(30.0) == 30.0
+
+
+def test_check_deadline_past():
+    token = set_deadline(-1.0)
+    try:
+        with pytest.raises(DeadlineExceededError):
+            check_deadline("database")
+    finally:
+        reset_deadline(token)
+
+
+def test_get_db_fails_fast_past_deadline():
+    from infrastructure.database_sqlalchemy import get_db
+
+    token = set_deadline(-1.0)
+    try:
+        with pytest.raises(DeadlineExceededError):
+            next(get_db())
+    finally:
+        reset_deadline(token)
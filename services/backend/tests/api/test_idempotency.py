@@ -0,0 +1,129 @@
+"""
+Idempotency-Key tests.
+
+Item routes through the full app, plus a small app for concurrency and
+failure handling (driven with asyncio.run + httpx.ASGITransport).
+"""
+import asyncio
+import uuid
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from adapters.idempotency import MemoryIdempotencyStore
+from api.middleware.idempotency import IdempotencyMiddleware
+from infrastructure.errors import register_exception_handlers
+
+AUTH = {"Authorization": "Bearer test-chris"}
+
+
+def _key_headers(key=None, auth=AUTH):
+    return {**auth, "Idempotency-Key": key or str(uuid.uuid4())}
+
+
+class TestItemWrites:
+
+    def test_retry_returns_stored_response(self, client_with_db, sample_item_data):
+        headers = _key_headers()
+        first = client_with_db.post("/api/v1/items", json=sample_item_data, headers=headers)
+        retry = client_with_db.post("/api/v1/items", json=sample_item_data, headers=headers)
+
+        assert first.status_code == retry.status_code == 201
+        assert retry.json()["id"] == first.json()["id"]
+        assert retry.headers["idempotent-replayed"] == "true"
+        assert "idempotent-replayed" not in first.headers
+        assert client_with_db.get("/api/v1/items", headers=AUTH).json()["total"] == 1
+
+    def test_key_reused_with_different_body(self, client_with_db, sample_item_data):
+        headers = _key_headers()
+        client_with_db.post("/api/v1/items", json=sample_item_data, headers=headers)
+        response = client_with_db.post("/api/v1/items", json={**sample_item_data, "label": "Other"}, headers=headers)
+        assert response.status_code == 422
+        assert response.json()["error_code"] == "E1006"
+
+    def test_keys_scoped_per_user(self, client_with_db, sample_item_data):
+        key = str(uuid.uuid4())
+        chris = client_with_db.post("/api/v1/items", json=sample_item_data, headers=_key_headers(key))
+        lars = client_with_db.post(
+            "/api/v1/items",
+            json=sample_item_data,
+            headers=_key_headers(key, {"Authorization": "Bearer test-lars"})
+        )
+        assert lars.status_code == 201
+        assert lars.json()["id"] != chris.json()["id"]
+
+    def test_token_verified_once(self, client_with_db, sample_item_data, monkeypatch):
+        from api import dependencies
+        provider = dependencies._get_auth_provider()
+        calls = []
+        original = provider.verify_token
+        monkeypatch.setattr(provider, "verify_token", lambda token: calls.append(token) or original(token))
+
+        response = client_with_db.post("/api/v1/items", json=sample_item_data, headers=_key_headers())
+        assert response.status_code == 201
+        assert calls == ["test-chris"]
+
+    def test_without_auth_passes_through(self, client, sample_item_data):
+        response = client.post("/api/v1/items", json=sample_item_data, headers={"Idempotency-Key": "abc"})
+        assert response.status_code == 401
+
+    def test_invalid_key(self, client, sample_item_data):
+        response = client.post("/api/v1/items", json=sample_item_data, headers=_key_headers("x" * 256))
+        assert response.status_code == 400
+        assert response.json()["error_code"] == "E1003"
+
+
+def _app(wait_timeout=5.0, fail_first=False, delay=0.05):
+    calls = []
+    app = FastAPI()
+    register_exception_handlers(app)
+    store = MemoryIdempotencyStore()
+    app.add_middleware(IdempotencyMiddleware, store_factory=lambda: store, wait_timeout=wait_timeout)
+
+    @app.post("/api/things")
+    async def create():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        if fail_first and len(calls) == 1:
+            return JSONResponse({"error": "boom"}, status_code=503)
+        return {"call": len(calls)}
+
+    return app, calls
+
+
+async def _post_many(app, headers, count):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(*(client.post("/api/things", headers=headers) for _ in range(count)))
+
+
+class TestIdempotencyMiddleware:
+
+    def test_concurrent_duplicates_wait_for_first(self):
+        app, calls = _app()
+        responses = asyncio.run(_post_many(app, _key_headers(), 3))
+        assert len(calls) == 1
+        assert [r.json() for r in responses] == [{"call": 1}] * 3
+        assert sum(r.headers.get("idempotent-replayed") == "true" for r in responses) == 2
+
+    def test_duplicate_gets_409_after_wait_timeout(self):
+        app, calls = _app(wait_timeout=0.01, delay=0.2)
+        responses = asyncio.run(_post_many(app, _key_headers(), 2))
+        assert sorted(r.status_code for r in responses) == [200, 409]
+        conflict = next(r for r in responses if r.status_code == 409)
+        assert conflict.headers["retry-after"] == "1"
+
+    def test_server_error_not_stored(self):
+        app, calls = _app(fail_first=True, delay=0)
+        headers = _key_headers()
+        first = asyncio.run(_post_many(app, headers, 1))[0]
+        retry = asyncio.run(_post_many(app, headers, 1))[0]
+        assert first.status_code == 503
+        assert retry.status_code == 200
+        assert len(calls) == 2
+
+    def test_without_header_always_executes(self):
+        app, calls = _app(delay=0)
+        asyncio.run(_post_many(app, AUTH, 2))
+        assert len(calls) == 2
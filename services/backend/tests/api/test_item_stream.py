@@ -0,0 +1,61 @@
+"""
+SSE change feed tests.
+
+The stream itself never ends, so the generator is driven directly;
+the route is only checked for auth.
+"""
+import asyncio
+
+from adapters.database.mock import MockDatabaseAdapter
+from adapters.events.memory import InProcessEventBroker
+from api.sse import item_event_stream, parse_last_event_id
+from modules.item_manager.models import Item
+from modules.item_manager.repository import ItemRepository
+
+
+class TestItemEventStream:
+
+    def test_repository_writes_are_streamed(self):
+        async def scenario():
+            broker = InProcessEventBroker()
+            repo = ItemRepository(MockDatabaseAdapter(), events=broker)
+            subscription = broker.subscribe("user-1")
+            stream = item_event_stream(broker, subscription, heartbeat_interval=5)
+
+            assert await stream.__anext__() == b"retry: 3000\n\n"
+
+            item = repo.save(Item(owner_id="user-1", label="A"))
+            repo.delete(item.id)
+
+            created = await asyncio.wait_for(stream.__anext__(), 1)
+            deleted = await asyncio.wait_for(stream.__anext__(), 1)
+            assert b"event: item.created" in created
+            assert item.id.encode() in created
+            assert b"event: item.deleted" in deleted
+
+            await stream.aclose()
+            assert broker.subscriber_count() == 0
+
+        asyncio.run(scenario())
+
+    def test_heartbeat_when_idle(self):
+        async def scenario():
+            broker = InProcessEventBroker()
+            stream = item_event_stream(broker, broker.subscribe("user-1"), heartbeat_interval=0.01)
+            await stream.__anext__()
+            assert await asyncio.wait_for(stream.__anext__(), 1) == b": keep-alive\n\n"
+            await stream.aclose()
+
+        asyncio.run(scenario())
+
+    def test_parse_last_event_id(self):
+        assert parse_last_event_id("123") == 123
+        assert parse_last_event_id("garbage") is None
+        assert parse_last_event_id(None) is None
+
+
+class TestItemStreamRoute:
+
+    def test_stream_requires_auth(self, client):
+        response = client.get("/api/v1/items/stream")
+        assert response.status_code == 401
@@ -4,6 +4,9 @@ Item API integration tests.
 Tests CRUD operations at /api/v1/items with MockDatabaseAdapter.
 Uses client_with_db fixture for shared state across requests.
 """
+import pytest
+
+from infrastructure.config import config
 
 
 class TestCreateItem:
@@ -121,3 +124,180 @@ class TestDeleteItem:
         item_id = create_resp.json()["id"]
         response = client_with_db.delete(f"/api/v1/items/{item_id}", headers=auth_headers_lars)
         assert response.status_code == 404
+
+
+class TestPatchItem:
+
+    def _create(self, client, headers):
+        data = {
+            "label": "Patch Me",
+            "payload": {"text": "Hello", "meta": {"views": 1, "lang": "de"}},
+            "tags": ["a", "b"],
+        }
+        return client.post("/api/v1/items", json=data, headers=headers).json()["id"]
+
+    def test_merge_patch_nested_payload(self, client_with_db, auth_headers_chris):
+        item_id = self._create(client_with_db, auth_headers_chris)
+        response = client_with_db.patch(
+            f"/api/v1/items/{item_id}",
+            json={"payload": {"meta": {"views": 2, "lang": None}}},
+            headers=auth_headers_chris,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["payload"] == {"text": "Hello", "meta": {"views": 2}}
+        assert data["label"] == "Patch Me"
+        assert data["updated_at"] is not None
+
+    def test_merge_patch_content_type(self, client_with_db, auth_headers_chris):
+        item_id = self._create(client_with_db, auth_headers_chris)
+        response = client_with_db.patch(
+            f"/api/v1/items/{item_id}",
+            content='{"label": "Renamed"}',
+            headers={**auth_headers_chris, "Content-Type": "application/merge-patch+json"},
+        )
+        assert response.status_code == 200
+        assert response.json()["label"] == "Renamed"
+
+    def test_tag_add_remove(self, client_with_db, auth_headers_chris):
+        item_id = self._create(client_with_db, auth_headers_chris)
+        response = client_with_db.patch(
+            f"/api/v1/items/{item_id}",
+            json={"tags_add": ["c", "a"], "tags_remove": ["b"]},
+            headers=auth_headers_chris,
+        )
+        assert response.json()["tags"] == ["a", "c"]
+
+    def test_null_label_rejected(self, client_with_db, auth_headers_chris):
+        item_id = self._create(client_with_db, auth_headers_chris)
+        response = client_with_db.patch(
+            f"/api/v1/items/{item_id}", json={"label": None}, headers=auth_headers_chris
+        )
+        assert response.status_code == 422
+
+    def test_patch_other_users_item(self, client_with_db, auth_headers_chris, auth_headers_lars):
+        item_id = self._create(client_with_db, auth_headers_chris)
+        response = client_with_db.patch(
+            f"/api/v1/items/{item_id}", json={"label": "Hacked"}, headers=auth_headers_lars
+        )
+        assert response.status_code == 404
+
+    def test_patch_deleted_item(self, client_with_db, auth_headers_chris):
+        item_id = self._create(client_with_db, auth_headers_chris)
+        client_with_db.delete(f"/api/v1/items/{item_id}", headers=auth_headers_chris)
+        response = client_with_db.patch(
+            f"/api/v1/items/{item_id}", json={"label": "Back"}, headers=auth_headers_chris
+        )
+        assert response.status_code == 404
+
+
+class TestMultiGetItems:
+
+    def test_results_in_request_order(self, client_with_db, auth_headers_chris, sample_item_data):
+        ids = [
+            client_with_db.post("/api/v1/items", json={**sample_item_data, "label": f"Item {i}"},
+                                headers=auth_headers_chris).json()["id"]
+            for i in range(3)
+        ]
+        requested = [ids[2], "missing", ids[0]]
+        response = client_with_db.post(
+            "/api/v1/items/multi-get", json={"ids": requested}, headers=auth_headers_chris
+        )
+        assert response.status_code == 200
+        results = response.json()["items"]
+        assert [r["id"] for r in results] == requested
+        assert [r["found"] for r in results] == [True, False, True]
+        assert results[0]["item"]["label"] == "Item 2"
+        assert results[1]["item"] is None
+
+    def test_other_users_and_deleted_not_found(
+        self, client_with_db, auth_headers_chris, auth_headers_lars, sample_item_data
+    ):
+        lars_id = client_with_db.post("/api/v1/items", json=sample_item_data, headers=auth_headers_lars).json()["id"]
+        deleted_id = client_with_db.post("/api/v1/items", json=sample_item_data, headers=auth_headers_chris).json()["id"]
+        client_with_db.delete(f"/api/v1/items/{deleted_id}", headers=auth_headers_chris)
+        response = client_with_db.post(
+            "/api/v1/items/multi-get", json={"ids": [lars_id, deleted_id]}, headers=auth_headers_chris
+        )
+        assert [r["found"] for r in response.json()["items"]] == [False, False]
+
+    def test_empty_ids_rejected(self, client_with_db, auth_headers_chris):
+        response = client_with_db.post("/api/v1/items/multi-get", json={"ids": []}, headers=auth_headers_chris)
+        assert response.status_code == 422
+
+
+class TestItemChanges:
+
+    @pytest.fixture(autouse=True)
+    def no_settle_window(self, monkeypatch):
+        """Exact cursor semantics; the settle window has its own test."""
+        monkeypatch.setattr(config, "SYNC_SETTLE_SECONDS", 0.0)
+
+    def test_recent_changes_sent_again(self, client_with_db, auth_headers_chris, sample_item_data, monkeypatch):
+        monkeypatch.setattr(config, "SYNC_SETTLE_SECONDS", 60.0)
+        item_id = client_with_db.post("/api/v1/items", json=sample_item_data, headers=auth_headers_chris).json()["id"]
+        first = client_with_db.get("/api/v1/items/changes", headers=auth_headers_chris).json()
+        second = client_with_db.get(
+            "/api/v1/items/changes", params={"since": first["watermark"]}, headers=auth_headers_chris
+        ).json()
+        assert [i["id"] for i in second["items"]] == [item_id]
+        assert second["has_more"] is False
+
+    def test_initial_sync_then_no_changes(self, client_with_db, auth_headers_chris, sample_item_data):
+        client_with_db.post("/api/v1/items", json=sample_item_data, headers=auth_headers_chris)
+        first = client_with_db.get("/api/v1/items/changes", headers=auth_headers_chris).json()
+        assert len(first["items"]) == 1
+        assert first["deleted"] == []
+        assert first["has_more"] is False
+
+        second = client_with_db.get(
+            "/api/v1/items/changes", params={"since": first["watermark"]}, headers=auth_headers_chris
+        ).json()
+        assert second["items"] == []
+        assert second["watermark"] == first["watermark"]
+
+    def test_updates_and_tombstones_since_watermark(self, client_with_db, auth_headers_chris, sample_item_data):
+        ids = [
+            client_with_db.post("/api/v1/items", json=sample_item_data, headers=auth_headers_chris).json()["id"]
+            for _ in range(3)
+        ]
+        watermark = client_with_db.get("/api/v1/items/changes", headers=auth_headers_chris).json()["watermark"]
+
+        client_with_db.patch(f"/api/v1/items/{ids[0]}", json={"label": "Changed"}, headers=auth_headers_chris)
+        client_with_db.delete(f"/api/v1/items/{ids[1]}", headers=auth_headers_chris)
+
+        data = client_with_db.get(
+            "/api/v1/items/changes", params={"since": watermark}, headers=auth_headers_chris
+        ).json()
+        assert [i["id"] for i in data["items"]] == [ids[0]]
+        assert data["items"][0]["label"] == "Changed"
+        assert [d["id"] for d in data["deleted"]] == [ids[1]]
+        assert data["deleted"][0]["deleted_at"] is not None
+
+    def test_paging_with_has_more(self, client_with_db, auth_headers_chris, sample_item_data):
+        for _ in range(3):
+            client_with_db.post("/api/v1/items", json=sample_item_data, headers=auth_headers_chris)
+
+        seen, since = [], None
+        while True:
+            params = {"limit": 2, **({"since": since} if since else {})}
+            page = client_with_db.get("/api/v1/items/changes", params=params, headers=auth_headers_chris).json()
+            seen += [i["id"] for i in page["items"]]
+            since = page["watermark"]
+            if not page["has_more"]:
+                break
+        assert len(seen) == len(set(seen)) == 3
+
+    def test_other_users_changes_not_included(
+        self, client_with_db, auth_headers_chris, auth_headers_lars, sample_item_data
+    ):
+        client_with_db.post("/api/v1/items", json=sample_item_data, headers=auth_headers_lars)
+        data = client_with_db.get("/api/v1/items/changes", headers=auth_headers_chris).json()
+        assert data["items"] == []
+        assert data["watermark"] is None
+
+    def test_invalid_watermark(self, client_with_db, auth_headers_chris):
+        response = client_with_db.get(
+            "/api/v1/items/changes", params={"since": "not-a-watermark"}, headers=auth_headers_chris
+        )
+        assert response.status_code == 400
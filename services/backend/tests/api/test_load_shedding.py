@@ -0,0 +1,149 @@
+"""
+Load shedding tests.
+
+GradientLimit adaptation, limiter admission/priority, and the middleware's
+503 response. Async code is driven with asyncio.run.
+"""
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+
+from api.middleware.load_shedding import (
+    READ, WRITE, AdaptiveConcurrencyLimiter, GradientLimit, LoadSheddingMiddleware
+)
+from infrastructure.errors import register_exception_handlers
+
+
+class TestGradientLimit:
+
+    def test_grows_while_latency_stable_and_limit_used(self):
+        limit = GradientLimit(initial_limit=10, max_limit=100)
+        for _ in range(50):
+            limit.on_sample(0.010, in_flight=int(limit.limit))
+        assert limit.limit > 10
+
+    def test_shrinks_when_latency_rises(self):
+        limit = GradientLimit(initial_limit=50)
+        for _ in range(100):
+            limit.on_sample(0.010, in_flight=50)
+        before = limit.limit
+        for _ in range(20):
+            limit.on_sample(0.100, in_flight=int(limit.limit))
+        assert limit.limit < before
+
+    def test_app_limited_does_not_grow(self):
+        limit = GradientLimit(initial_limit=20)
+        for _ in range(50):
+            limit.on_sample(0.010, in_flight=2)
+        assert limit.limit == 20
+
+    def test_drop_backs_off_to_min(self):
+        limit = GradientLimit(initial_limit=10, min_limit=4, backoff_ratio=0.5)
+        limit.on_drop()
+        assert limit.limit == 5
+        limit.on_drop()
+        assert limit.limit == 4
+
+
+def _limiter(limit=2, **kwargs):
+    return AdaptiveConcurrencyLimiter(GradientLimit(initial_limit=limit, min_limit=1), **kwargs)
+
+
+class TestAdaptiveConcurrencyLimiter:
+
+    def test_queue_timeout_sheds(self):
+        async def scenario():
+            limiter = _limiter(limit=1, queue_timeout=0.01)
+            assert await limiter.acquire(READ)
+            assert not await limiter.acquire(READ)
+            return limiter.stats()
+
+        stats = asyncio.run(scenario())
+        assert stats["shed"] == {"read:queue_timeout": 1}
+        assert stats["queued"] == {READ: 0, WRITE: 0}
+
+    def test_reads_admitted_before_writes(self):
+        async def scenario():
+            limiter = _limiter(limit=1, queue_timeout=1.0, write_share=1.0, max_queue=10)
+            await limiter.acquire(READ)
+            order = []
+
+            async def request(priority):
+                assert await limiter.acquire(priority)
+                order.append(priority)
+                limiter.release(0.001)
+
+            write = asyncio.create_task(request(WRITE))
+            await asyncio.sleep(0)
+            read = asyncio.create_task(request(READ))
+            await asyncio.sleep(0)
+            limiter.release(0.001)
+            await asyncio.gather(write, read)
+            return order, limiter.in_flight
+
+        order, in_flight = asyncio.run(scenario())
+        assert order == [READ, WRITE]
+        assert in_flight == 0
+
+    def test_writes_limited_to_share(self):
+        async def scenario():
+            limiter = _limiter(limit=10, write_share=0.5, queue_timeout=0.01)
+            writes = [await limiter.acquire(WRITE) for _ in range(6)]
+            read = await limiter.acquire(READ)
+            return writes, read
+
+        writes, read = asyncio.run(scenario())
+        assert writes == [True] * 5 + [False]
+        assert read is True
+
+    def test_queue_full_sheds_immediately(self):
+        async def scenario():
+            limiter = _limiter(limit=1, max_queue=0)
+            await limiter.acquire(READ)
+            return await limiter.acquire(READ), limiter.stats()["shed"]
+
+        admitted, shed = asyncio.run(scenario())
+        assert not admitted
+        assert shed == {"read:queue_full": 1}
+
+
+def test_middleware_sheds_with_503_and_bypasses_health():
+    limiter = _limiter(limit=1, queue_timeout=0.01)
+    app = FastAPI()
+    app.add_middleware(LoadSheddingMiddleware, limiter=limiter, bypass_paths=("/health",))
+    register_exception_handlers(app)
+
+    @app.get("/slow")
+    async def slow():
+        await asyncio.sleep(0.2)
+        return {"ok": True}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = asyncio.create_task(client.get("/slow"))
+            await asyncio.sleep(0.05)
+            shed = await client.get("/slow")
+            health = await client.get("/health")
+            return await first, shed, health
+
+    first, shed, health = asyncio.run(scenario())
+    assert first.status_code == 200
+    assert shed.status_code == 503
+    assert shed.headers["Retry-After"] == "1"
+    assert shed.headers["content-type"] == "application/problem+json"
+    assert shed.json()["error_code"] == "E5004"
+    assert health.status_code == 200
+    assert limiter.in_flight == 0
+
+
+def test_health_load_reports_stats(client):
+    data = client.get("/health/load").json()
+    assert {"limit", "in_flight", "queued", "shed"} <= set(data)
+    # Lifespan started the loop lag monitor
+    assert set(data["event_loop"]) == {"lag_ms", "max_lag_ms", "stalls"}
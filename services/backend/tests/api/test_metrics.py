@@ -0,0 +1,53 @@
+"""
+/metrics tests (route templates, status classes, scrape auth).
+"""
+from prometheus_client import REGISTRY
+
+from infrastructure.config import config
+
+AUTH = {"Authorization": "Bearer test-chris"}
+
+
+def _requests(route, status, method="GET"):
+    value = REGISTRY.get_sample_value(
+        "http_requests_total", {"method": method, "route": route, "status": status}
+    )
+    return value or 0.0
+
+
+class TestMetricsEndpoint:
+
+    def test_exposition_format(self, client):
+        client.get("/health")
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "http_request_duration_seconds_bucket" in response.text
+        assert "concurrency_limit" in response.text
+
+    def test_counts_by_route_template(self, client_with_db, sample_item_data):
+        before = _requests("/api/v1/items/{item_id}", "2xx")
+        item = client_with_db.post("/api/v1/items", json=sample_item_data, headers=AUTH).json()
+        client_with_db.get(f"/api/v1/items/{item['id']}", headers=AUTH)
+        client_with_db.get(f"/api/v1/items/{item['id']}", headers=AUTH)
+        assert _requests("/api/v1/items/{item_id}", "2xx") == before + 2
+        assert "/api/v1/items/" + item["id"] not in client_with_db.get("/metrics").text
+
+    def test_status_class_and_unmatched(self, client):
+        before_auth = _requests("/api/v1/items", "4xx")
+        before_unmatched = _requests("<unmatched>", "4xx")
+        client.get("/api/v1/items")
+        client.get("/does-not-exist/123")
+        assert _requests("/api/v1/items", "4xx") == before_auth + 1
+        assert _requests("<unmatched>", "4xx") == before_unmatched + 1
+
+    def test_scrapes_not_counted(self, client):
+        client.get("/metrics")
+        assert _requests("/metrics", "2xx") == 0
+
+    def test_token_required_when_configured(self, client, monkeypatch):
+        monkeypatch.setattr(config, "METRICS_TOKEN", "scrape-secret")
+        assert client.get("/metrics").status_code == 401
+        assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+        assert client.get("/metrics", headers={"Authorization": "Bearer caf\xe9".encode("latin-1")}).status_code == 401
+        assert client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"}).status_code == 200
@@ -0,0 +1,92 @@
+"""
+On-demand request profiling tests (X-Profile header / ?profile=1, token
+gating, speedscope file named after the request ID).
+"""
+import time
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from infrastructure.logging.middleware import LoggingMiddleware
+from infrastructure.profiling import ProfilingMiddleware
+
+
+def build_app(output_dir, **options) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/slow")
+    def slow():
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            sum(range(1000))
+        return {"ok": True}
+
+    app.add_middleware(ProfilingMiddleware, output_dir=str(output_dir), interval=0.001, **options)
+    app.add_middleware(LoggingMiddleware)
+    return app
+
+
+@pytest.fixture
+def open_client(tmp_path):
+    with TestClient(build_app(tmp_path, allow_without_token=True)) as c:
+        yield c
+
+
+def test_header_profiles_request(open_client, tmp_path):
+    response = open_client.get("/slow", headers={"X-Profile": "1", "X-Request-ID": "req-123"})
+    assert response.status_code == 200
+    assert response.headers["X-Profile"] == "req-123.speedscope.json"
+
+    document = orjson.loads((tmp_path / "req-123.speedscope.json").read_bytes())
+    assert document["name"] == "GET /slow (req-123)"
+    assert any(frame["name"] == "build_app.<locals>.slow" for frame in document["shared"]["frames"])
+
+
+def test_query_flag(open_client, tmp_path):
+    response = open_client.get("/slow?profile=1")
+    assert (tmp_path / response.headers["X-Profile"]).exists()
+
+
+def test_not_requested(open_client, tmp_path):
+    response = open_client.get("/slow")
+    assert "X-Profile" not in response.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unsafe_request_id_sanitized(open_client, tmp_path):
+    response = open_client.get("/slow", headers={"X-Profile": "1", "X-Request-ID": "../../etc/x"})
+    assert response.headers["X-Profile"] == ".._.._etc_x.speedscope.json"
+    assert (tmp_path / ".._.._etc_x.speedscope.json").exists()
+
+
+def test_closed_without_token(tmp_path):
+    # Production default: no token configured, profiling unavailable
+    with TestClient(build_app(tmp_path)) as c:
+        response = c.get("/slow", headers={"X-Profile": "1"})
+    assert response.status_code == 200
+    assert "X-Profile" not in response.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_token_required(tmp_path):
+    with TestClient(build_app(tmp_path, token="s3cret", allow_without_token=True)) as c:
+        denied = c.get("/slow", headers={"X-Profile": "1", "X-Profile-Token": "wrong"})
+        allowed = c.get("/slow", headers={"X-Profile": "1", "X-Profile-Token": "s3cret"})
+    assert "X-Profile" not in denied.headers
+    assert allowed.headers["X-Profile"].endswith(".speedscope.json")
+
+
+def test_busy(tmp_path):
+    app = build_app(tmp_path, allow_without_token=True)
+    with TestClient(app) as c:
+        middleware = app.middleware_stack
+        while not isinstance(middleware, ProfilingMiddleware):
+            middleware = middleware.app
+        middleware._busy.acquire()
+        try:
+            response = c.get("/slow", headers={"X-Profile": "1"})
+        finally:
+            middleware._busy.release()
+    assert response.headers["X-Profile"] == "busy"
@@ -0,0 +1,51 @@
+"""
+Query counts per item endpoint (SQL adapter on SQLite).
+
+Guards against accidental extra round trips; update the numbers
+deliberately when an endpoint's data access changes.
+"""
+AUTH = {"Authorization": "Bearer test-chris"}
+
+
+def _create(client, **data):
+    return client.post("/api/v1/items", json={"label": "Item", **data}, headers=AUTH).json()["id"]
+
+
+class TestItemQueryCounts:
+
+    def test_create(self, client_with_sql, assert_num_queries):
+        with assert_num_queries(1):
+            client_with_sql.post("/api/v1/items", json={"label": "Item", "tags": ["a"]}, headers=AUTH)
+
+    def test_list(self, client_with_sql, assert_num_queries):
+        for _ in range(3):
+            _create(client_with_sql)
+        with assert_num_queries(1):
+            response = client_with_sql.get("/api/v1/items", headers=AUTH)
+        assert response.json()["total"] == 3
+
+    def test_get(self, client_with_sql, assert_num_queries):
+        item_id = _create(client_with_sql)
+        with assert_num_queries(1):
+            client_with_sql.get(f"/api/v1/items/{item_id}", headers=AUTH)
+
+    def test_multi_get(self, client_with_sql, assert_num_queries):
+        ids = [_create(client_with_sql) for _ in range(3)]
+        with assert_num_queries(1):
+            client_with_sql.post("/api/v1/items/multi-get", json={"ids": ids}, headers=AUTH)
+
+    def test_update(self, client_with_sql, assert_num_queries):
+        item_id = _create(client_with_sql)
+        with assert_num_queries(3):
+            client_with_sql.put(f"/api/v1/items/{item_id}", json={"label": "New"}, headers=AUTH)
+
+    def test_patch(self, client_with_sql, assert_num_queries):
+        item_id = _create(client_with_sql)
+        with assert_num_queries(2):
+            client_with_sql.patch(f"/api/v1/items/{item_id}", json={"label": "New"}, headers=AUTH)
+
+    def test_delete(self, client_with_sql, assert_num_queries):
+        item_id = _create(client_with_sql)
+        with assert_num_queries(4):
+            response = client_with_sql.delete(f"/api/v1/items/{item_id}", headers=AUTH)
+        assert response.status_code == 204
@@ -0,0 +1,61 @@
+"""
+Per-user rate limiting tests (write routes: 20/minute).
+"""
+import pytest
+
+from api.rate_limit import parse_rate
+
+
+def _create(client, headers, data):
+    return client.post("/api/v1/items", json=data, headers=headers)
+
+
+class TestRateLimit:
+
+    def test_ratelimit_headers(self, client_with_db, auth_headers_chris, sample_item_data):
+        response = _create(client_with_db, auth_headers_chris, sample_item_data)
+        assert response.headers["RateLimit-Limit"] == "20"
+        assert response.headers["RateLimit-Remaining"] == "19"
+        assert response.headers["RateLimit-Policy"] == "20;w=60"
+        assert int(response.headers["RateLimit-Reset"]) >= 1
+
+    def test_exceeded_returns_problem_with_retry_after(self, client_with_db, auth_headers_chris, sample_item_data):
+        for _ in range(20):
+            assert _create(client_with_db, auth_headers_chris, sample_item_data).status_code == 201
+
+        response = _create(client_with_db, auth_headers_chris, sample_item_data)
+        assert response.status_code == 429
+        assert response.headers["content-type"] == "application/problem+json"
+        assert response.json()["error_code"] == "E1005"
+        assert response.json()["title"] == "Too Many Requests"
+        assert int(response.headers["Retry-After"]) >= 1
+        assert response.headers["RateLimit-Remaining"] == "0"
+
+    def test_limit_is_per_user(self, client_with_db, auth_headers_chris, auth_headers_lars, sample_item_data):
+        for _ in range(20):
+            _create(client_with_db, auth_headers_chris, sample_item_data)
+        assert _create(client_with_db, auth_headers_lars, sample_item_data).status_code == 201
+
+    def test_unauthenticated_not_counted(self, client_with_db, sample_item_data):
+        response = client_with_db.post("/api/v1/items", json=sample_item_data)
+        assert response.status_code == 401
+        assert "RateLimit-Limit" not in response.headers
+
+    def test_read_routes_not_limited(self, client_with_db, auth_headers_chris):
+        response = client_with_db.get("/api/v1/items", headers=auth_headers_chris)
+        assert "RateLimit-Limit" not in response.headers
+
+
+@pytest.mark.parametrize("rate, expected", [
+    ("20/minute", (20, 60)),
+    ("100/hour", (100, 3600)),
+    ("5/10 seconds", (5, 10)),
+])
+def test_parse_rate(rate, expected):
+    assert parse_rate(rate) == expected
+
+
+@pytest.mark.parametrize("rate", ["0/minute", "fast", "10/fortnight"])
+def test_parse_rate_invalid(rate):
+    with pytest.raises(ValueError):
+        parse_rate(rate)
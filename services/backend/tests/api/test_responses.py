@@ -0,0 +1,64 @@
+"""
+Fast serialization path tests.
+
+The orjson encoder must produce the same JSON as the ItemResponse schema.
+"""
+import json
+from datetime import datetime
+
+from api.responses import encode_item, encode_item_list
+from api.schemas.items import ItemResponse, ItemListResponse
+from modules.item_manager.models import Item
+
+
+def _item(**overrides):
+    data = dict(
+        id="item-1",
+        owner_id="user-1",
+        label="Test",
+        content_type="text/plain",
+        payload={"text": "Hello", "nested": {"n": 1}},
+        tags=["a", "b"],
+        created_at=datetime(2026, 1, 13, 14, 0, 0, 123456),
+        updated_at=None,
+    )
+    data.update(overrides)
+    return Item(**data)
+
+
+class TestEncodeItem:
+
+    def test_matches_pydantic_schema(self):
+        item = _item()
+        expected = ItemResponse.model_validate(item, from_attributes=True).model_dump(mode="json")
+        assert json.loads(encode_item(item)) == expected
+
+    def test_datetime_iso_format(self):
+        data = json.loads(encode_item(_item(updated_at=datetime(2026, 1, 14, 9, 30))))
+        assert data["created_at"] == "2026-01-13T14:00:00.123456"
+        assert data["updated_at"] == "2026-01-14T09:30:00"
+
+    def test_deleted_at_not_exposed(self):
+        data = json.loads(encode_item(_item(deleted_at=datetime(2026, 1, 15))))
+        assert "deleted_at" not in data
+
+
+class TestEncodeItemList:
+
+    def test_matches_pydantic_schema(self):
+        items = [_item(id=f"item-{i}") for i in range(3)]
+        expected = ItemListResponse(
+            items=[ItemResponse.model_validate(i, from_attributes=True) for i in items],
+            total=3, limit=100, offset=0,
+        ).model_dump(mode="json")
+        assert json.loads(encode_item_list(items, total=3, limit=100, offset=0)) == expected
+
+
+class TestOpenAPISchema:
+
+    def test_item_routes_keep_response_models(self, client):
+        paths = client.get("/openapi.json").json()["paths"]
+        list_schema = paths["/api/v1/items"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+        assert list_schema["$ref"].endswith("/ItemListResponse")
+        get_schema = paths["/api/v1/items/{item_id}"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+        assert get_schema["$ref"].endswith("/ItemResponse")
@@ -0,0 +1,253 @@
+"""
+Pre-fork server tests.
+
+PreforkServer runs in a subprocess (it forks and installs signal
+handlers) with a trivial ASGI app on a free local port.
+"""
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from api import server
+from infrastructure.config import config
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+SERVER_SCRIPT = '''
+import asyncio, os, sys, time
+
+import uvicorn
+
+from api import server
+
+port, workers, graceful, fail_startup = int(sys.argv[1]), int(sys.argv[2]), float(sys.argv[3]), sys.argv[4] == "1"
+server.KILL_MARGIN_SECONDS = 0.5
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                if fail_startup:
+                    await send({"type": "lifespan.startup.failed", "message": "boom"})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+    if scope["path"] == "/slow":
+        await asyncio.sleep(1.5)
+    elif scope["path"] == "/block":
+        time.sleep(30)  # blocks the loop: ignores the drain
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": str(os.getpid()).encode()})
+
+
+uvicorn_config = uvicorn.Config(
+    app, host="127.0.0.1", port=port, lifespan="on", log_config=None,
+    access_log=False, timeout_graceful_shutdown=graceful,
+)
+sys.exit(server.PreforkServer(uvicorn_config, workers, graceful).run())
+'''
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _get(port: int, path: str = "/", timeout: float = 5.0) -> str:
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=timeout) as response:
+        return response.read().decode()
+
+
+class _Server:
+    """PreforkServer subprocess."""
+
+    def __init__(self, tmp_path: Path, workers: int = 2, graceful: float = 5.0, fail_startup: bool = False):
+        self.port = _free_port()
+        script = tmp_path / "run_server.py"
+        script.write_text(SERVER_SCRIPT)
+        env = {**os.environ, "PYTHONPATH": str(BACKEND_DIR)}
+        env.pop("PROMETHEUS_MULTIPROC_DIR", None)
+        self.proc = subprocess.Popen(
+            [sys.executable, str(script), str(self.port), str(workers), str(graceful), "1" if fail_startup else "0"],
+            cwd=BACKEND_DIR,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def wait_ready(self, timeout: float = 15.0) -> str:
+        """Worker PID of the first successful request."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                return _get(self.port, timeout=1.0)
+            except OSError:
+                time.sleep(0.1)
+        raise AssertionError("server did not become ready")
+
+    def stop(self) -> None:
+        if self.proc.poll() is None:
+            self.proc.kill()
+            self.proc.wait()
+
+
+@pytest.fixture
+def start_server(tmp_path):
+    servers = []
+
+    def start(**kwargs) -> _Server:
+        servers.append(_Server(tmp_path, **kwargs))
+        return servers[-1]
+
+    yield start
+    for running in servers:
+        running.stop()
+
+
+class TestPreforkServer:
+
+    def test_sigterm_drains_in_flight_request(self, start_server):
+        running = start_server(workers=2)
+        running.wait_ready()
+
+        result = {}
+        request = threading.Thread(target=lambda: result.update(body=_get(running.port, "/slow")))
+        request.start()
+        time.sleep(0.3)
+        running.proc.send_signal(signal.SIGTERM)
+
+        request.join(10)
+        assert result.get("body", "").isdigit()
+        assert running.proc.wait(10) == 0
+
+    def test_crashed_worker_is_replaced(self, start_server):
+        running = start_server(workers=1)
+        first_pid = int(running.wait_ready())
+        os.kill(first_pid, signal.SIGKILL)
+
+        deadline = time.monotonic() + 10
+        pid = first_pid
+        while pid == first_pid and time.monotonic() < deadline:
+            try:
+                pid = int(_get(running.port, timeout=1.0))
+            except OSError:
+                time.sleep(0.1)
+        assert pid != first_pid
+
+        running.proc.send_signal(signal.SIGTERM)
+        assert running.proc.wait(10) == 0
+
+    def test_startup_failure_stops_server(self, start_server):
+        running = start_server(workers=2, fail_startup=True)
+        assert running.proc.wait(15) == server.STARTUP_FAILURE
+
+    def test_worker_ignoring_drain_is_killed(self, start_server):
+        running = start_server(workers=1, graceful=0.5)
+        worker_pid = int(running.wait_ready())
+
+        def blocked_request():
+            with pytest.raises(OSError):  # connection dies with the worker
+                _get(running.port, "/block", timeout=10)
+
+        threading.Thread(target=blocked_request, daemon=True).start()
+        time.sleep(0.3)
+        running.proc.send_signal(signal.SIGTERM)
+
+        assert running.proc.wait(10) == 0
+        with pytest.raises(ProcessLookupError):
+            os.kill(worker_pid, 0)
+
+
+class TestRespawnBackoff:
+    """Supervisor bookkeeping without forking (_collect_exited/_spawn stubbed)."""
+
+    @pytest.fixture
+    def prefork(self, monkeypatch):
+        prefork = server.PreforkServer(None, workers=1, graceful_timeout=1.0)
+        prefork.exited = []
+        prefork.spawned = []
+        monkeypatch.setattr(prefork, "_collect_exited", lambda: prefork.exited)
+        monkeypatch.setattr(prefork, "_spawn", lambda sock, slot: prefork.spawned.append(slot))
+        monkeypatch.setattr(server, "mark_worker_dead", lambda pid: None)
+        return prefork
+
+    def _crash(self, prefork, pid: int, uptime: float) -> None:
+        prefork.children[pid] = (0, time.monotonic() - uptime)
+        prefork.exited = [(pid, 1)]
+        prefork._reap(None)
+        prefork.exited = []
+
+    def test_long_running_worker_replaced_at_once(self, prefork):
+        self._crash(prefork, 100, uptime=server.MIN_UPTIME_SECONDS + 1)
+        assert prefork.spawned == [0]
+
+    def test_early_crash_delays_respawn(self, prefork):
+        self._crash(prefork, 100, uptime=0.1)
+        assert prefork.spawned == []
+        assert prefork.respawn_at[0] > time.monotonic()
+
+        prefork.respawn_at[0] = time.monotonic()
+        prefork._reap(None)
+        assert prefork.spawned == [0]
+        assert prefork.respawn_at == {}
+
+    def test_delay_doubles_up_to_cap_and_resets(self, prefork):
+        delays = [prefork._respawn_delay(0, uptime=0.1) for _ in range(8)]
+        assert delays[:3] == [server.RESPAWN_DELAY_SECONDS * f for f in (1, 2, 4)]
+        assert delays[-1] == server.MAX_RESPAWN_DELAY_SECONDS
+        assert prefork._respawn_delay(1, uptime=0.1) == server.RESPAWN_DELAY_SECONDS  # per slot
+
+        assert prefork._respawn_delay(0, uptime=server.MIN_UPTIME_SECONDS) == 0.0
+        assert prefork._respawn_delay(0, uptime=0.1) == server.RESPAWN_DELAY_SECONDS
+
+    def test_no_respawn_while_exiting(self, prefork):
+        self._crash(prefork, 100, uptime=0.1)
+        prefork.respawn_at[0] = time.monotonic()
+        prefork.should_exit = True
+        prefork._reap(None)
+        assert prefork.spawned == []
+
+
+class TestMetricsDir:
+
+    def test_prepare_removes_stale_files(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "METRICS_ENABLED", True)
+        # setenv first so the variable set by prepare_metrics_dir is undone
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", "")
+        monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR")
+        metrics_dir = tmp_path / "metrics"
+        metrics_dir.mkdir()
+        (metrics_dir / "counter_123.db").write_bytes(b"stale")
+        (metrics_dir / "README").write_text("kept")
+
+        server.prepare_metrics_dir(str(metrics_dir))
+
+        assert os.environ["PROMETHEUS_MULTIPROC_DIR"] == str(metrics_dir)
+        assert sorted(p.name for p in metrics_dir.iterdir()) == ["README"]
+
+    def test_prepare_disabled(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "METRICS_ENABLED", False)
+        server.prepare_metrics_dir(str(tmp_path / "metrics"))
+        assert not (tmp_path / "metrics").exists()
+
+    def test_mark_worker_dead_drops_live_gauges(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+        (tmp_path / "gauge_livesum_123.db").write_bytes(b"")
+        (tmp_path / "counter_123.db").write_bytes(b"")
+
+        server.mark_worker_dead(123)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["counter_123.db"]
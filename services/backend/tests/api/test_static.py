@@ -0,0 +1,148 @@
+"""
+Static asset serving tests (manifest, precompressed variants, caching).
+"""
+import gzip
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.static import IMMUTABLE, REVALIDATE, StaticAssets
+from infrastructure.errors import register_exception_handlers
+
+SCRIPT = b"console.log('hello');\n" * 200
+
+
+@pytest.fixture
+def asset_dir(tmp_path):
+    (tmp_path / "index.html").write_text("<h1>home</h1>" * 100)
+    (tmp_path / "app.3f2a9c1d.js").write_bytes(SCRIPT)
+    (tmp_path / "app.3f2a9c1d.js.gz").write_bytes(gzip.compress(SCRIPT))
+    (tmp_path / "large.bin").write_bytes(os.urandom(4096))
+    (tmp_path / ".env").write_text("SECRET=1")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "index.html").write_text("<h1>docs</h1>")
+    return tmp_path
+
+
+def make_client(directory, **kwargs):
+    app = FastAPI()
+    register_exception_handlers(app)
+    assets = StaticAssets(str(directory), memory_max_bytes=2048, **kwargs)
+    app.mount("/app/demo", assets)
+    return TestClient(app), assets
+
+
+@pytest.fixture
+def static_client(asset_dir):
+    client, _ = make_client(asset_dir)
+    return client
+
+
+class TestManifest:
+
+    def test_siblings_and_dotfiles_not_indexed(self, asset_dir):
+        _, assets = make_client(asset_dir)
+        assert set(assets.manifest) == {"index.html", "app.3f2a9c1d.js", "large.bin", "docs/index.html"}
+        assert set(assets.manifest["app.3f2a9c1d.js"].variants) == {"identity", "gzip"}
+
+    def test_small_text_precompressed_at_startup(self, asset_dir):
+        _, assets = make_client(asset_dir)
+        assert "gzip" in assets.manifest["index.html"].variants
+
+
+class TestStaticAssets:
+
+    def test_serves_index_for_root(self, static_client):
+        response = static_client.get("/app/demo/", headers={"Accept-Encoding": "identity"})
+        assert response.status_code == 200
+        assert response.text.startswith("<h1>home</h1>")
+        assert response.headers["content-type"].startswith("text/html")
+        assert response.headers["cache-control"] == REVALIDATE
+
+    def test_directory_redirects_to_slash(self, static_client):
+        response = static_client.get("/app/demo/docs", follow_redirects=False)
+        assert response.status_code == 307
+        assert response.headers["location"].endswith("/app/demo/docs/")
+
+    def test_fingerprinted_is_immutable(self, static_client):
+        response = static_client.get("/app/demo/app.3f2a9c1d.js")
+        assert response.headers["cache-control"] == IMMUTABLE
+
+    def test_precompressed_sibling_served(self, static_client):
+        response = static_client.get("/app/demo/app.3f2a9c1d.js", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"].endswith('-gzip"')
+        assert response.content == SCRIPT  # decoded by the client
+
+    def test_identity_without_accept_encoding(self, static_client):
+        response = static_client.get("/app/demo/app.3f2a9c1d.js", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert int(response.headers["content-length"]) == len(SCRIPT)
+
+    def test_if_none_match_returns_304(self, static_client):
+        headers = {"Accept-Encoding": "gzip"}
+        etag = static_client.get("/app/demo/app.3f2a9c1d.js", headers=headers).headers["etag"]
+        response = static_client.get("/app/demo/app.3f2a9c1d.js", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+    def test_large_file_streamed_from_disk(self, static_client, asset_dir):
+        response = static_client.get("/app/demo/large.bin")
+        assert response.status_code == 200
+        assert response.content == (asset_dir / "large.bin").read_bytes()
+        assert response.headers["accept-ranges"] == "bytes"
+
+    def test_replaced_large_file_reindexed(self, static_client, asset_dir):
+        first = static_client.get("/app/demo/large.bin")
+        replacement = os.urandom(6000)
+        (asset_dir / "large.bin").write_bytes(replacement)
+
+        response = static_client.get("/app/demo/large.bin")
+        assert response.content == replacement
+        assert response.headers["content-length"] == str(len(replacement))
+        assert response.headers["etag"] != first.headers["etag"]
+
+    def test_deleted_large_file_gone(self, static_client, asset_dir):
+        (asset_dir / "large.bin").unlink()
+        assert static_client.get("/app/demo/large.bin").status_code == 404
+
+    def test_range_request(self, static_client, asset_dir):
+        response = static_client.get("/app/demo/large.bin", headers={"Range": "bytes=0-99"})
+        assert response.status_code == 206
+        assert response.content == (asset_dir / "large.bin").read_bytes()[:100]
+
+    def test_dotfile_not_served(self, static_client):
+        response = static_client.get("/app/demo/.env")
+        assert response.status_code == 404
+        assert response.headers["content-type"] == "application/problem+json"
+
+    def test_path_traversal_not_served(self, static_client):
+        response = static_client.get("/app/demo/../../etc/passwd")
+        assert response.status_code == 404
+
+    def test_post_not_allowed(self, static_client):
+        assert static_client.post("/app/demo/index.html").status_code == 405
+
+
+class TestRevalidate:
+
+    def test_picks_up_changed_and_new_files(self, asset_dir):
+        client, _ = make_client(asset_dir, revalidate=True)
+        first = client.get("/app/demo/docs/index.html").headers["etag"]
+
+        (asset_dir / "docs" / "index.html").write_text("<h1>docs v2</h1>")
+        (asset_dir / "new.txt").write_text("new")
+
+        response = client.get("/app/demo/docs/index.html")
+        assert response.text == "<h1>docs v2</h1>"
+        assert response.headers["etag"] != first
+        assert client.get("/app/demo/new.txt").text == "new"
+
+    def test_deleted_file_gone(self, asset_dir):
+        client, _ = make_client(asset_dir, revalidate=True)
+        (asset_dir / "large.bin").unlink()
+        assert client.get("/app/demo/large.bin").status_code == 404
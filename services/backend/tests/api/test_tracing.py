@@ -0,0 +1,78 @@
+"""
+Request tracing tests: traceparent in/out and spans of an item request
+(auth, repository, SQL) under one SERVER span.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from api.dependencies import get_database_adapter
+from api.main import app
+from infrastructure.database_sqlalchemy import Base, engine
+from infrastructure.tracing import InMemorySpanExporter, Tracer, TracingMiddleware, configure_tracing, parse_traceparent
+from tests.conftest import _sql_database_adapter
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    configure_tracing(Tracer(exporter))
+    yield exporter
+    configure_tracing(None)
+
+
+@pytest.fixture
+def traced_client(exporter):
+    """App wrapped in TracingMiddleware (as with TRACING_ENABLED), SQL adapter."""
+    Base.metadata.create_all(engine)
+    app.dependency_overrides[get_database_adapter] = _sql_database_adapter
+    with TestClient(TracingMiddleware(app)) as c:
+        yield c
+    app.dependency_overrides.clear()
+    Base.metadata.drop_all(engine)
+
+
+def test_request_span_tree(traced_client, exporter, auth_headers_chris, sample_item_data):
+    response = traced_client.post("/api/v1/items", json=sample_item_data, headers=auth_headers_chris)
+    assert response.status_code == 201
+
+    spans = {s.name: s for s in exporter.get_finished_spans()}
+    server = spans["POST /api/v1/items"]
+    assert server.parent_span_id is None
+    assert server.attributes["http.route"] == "/api/v1/items"
+    assert server.attributes["http.response.status_code"] == 201
+
+    assert spans["auth.verify"].parent_span_id == server.span_id
+    assert spans["auth.verify"].attributes["enduser.id"]
+    save = spans["ItemRepository.save"]
+    assert save.parent_span_id == server.span_id
+    queries = [s for s in exporter.get_finished_spans() if s.name == "db.query"]
+    assert queries and all(q.parent_span_id == save.span_id for q in queries)
+    assert {s.trace_id for s in exporter.get_finished_spans()} == {server.trace_id}
+
+    # Response carries the server span's traceparent
+    assert response.headers["traceparent"] == server.traceparent
+
+
+def test_continues_incoming_trace(traced_client, exporter, auth_headers_chris):
+    headers = {**auth_headers_chris, "traceparent": f"00-{TRACE_ID}-00f067aa0ba902b7-01"}
+    response = traced_client.get("/api/v1/items/does-not-exist", headers=headers)
+    assert response.status_code == 404
+
+    trace_id, span_id, sampled = parse_traceparent(response.headers["traceparent"])
+    assert trace_id == TRACE_ID and sampled
+    server = next(s for s in exporter.get_finished_spans() if s.span_id == span_id)
+    assert server.name == "GET /api/v1/items/{item_id}"
+    assert server.parent_span_id == "00f067aa0ba902b7"
+
+
+def test_unsampled_incoming_trace(traced_client, exporter):
+    response = traced_client.get("/health", headers={"traceparent": f"00-{TRACE_ID}-00f067aa0ba902b7-00"})
+    assert response.headers["traceparent"].endswith("-00")
+    assert exporter.get_finished_spans() == []
+
+
+def test_disabled_passes_through(client):
+    # TRACING_ENABLED=false: no middleware, no header
+    assert "traceparent" not in client.get("/health").headers
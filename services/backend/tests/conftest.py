@@ -6,22 +6,47 @@ ENV=test is set via Docker environment, which activates:
   - MockDatabaseAdapter (in-memory storage)
   - MockAuthAdapter (test-chris, test-lars, test-lily tokens)
 """
+import logging
 import os
+from contextlib import contextmanager
+
 import pytest
+from fastapi import Depends
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
 
 os.environ.setdefault("ENV", "test")
 os.environ.setdefault("DATABASE_URL", "sqlite://")
 
 from api.main import app
+from api.rate_limit import limiter
 from adapters.database.mock import MockDatabaseAdapter
 from api.dependencies import get_database_adapter
+from adapters.database.postgresql import PostgreSQLAdapter
+from infrastructure.database_sqlalchemy import Base, engine, get_db
+from infrastructure.logging.handlers import stop_async_handlers
+from infrastructure.query_stats import capture_queries
 
 
 # ============================================
 # App Fixtures
 # ============================================
 
+@pytest.fixture(scope="session", autouse=True)
+def detach_log_handlers():
+    """api.main logs to pytest's captured stdout; detach before it is closed."""
+    yield
+    stop_async_handlers()
+    logging.getLogger().handlers.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limits():
+    """Rate limit counters are process-global; start every test fresh."""
+    limiter.reset()
+    yield
+
+
 @pytest.fixture
 def client():
     """FastAPI TestClient with default dependency injection."""
@@ -47,6 +72,43 @@ def client_with_db(shared_mock_db):
     app.dependency_overrides.clear()
 
 
+def _sql_database_adapter(db: Session = Depends(get_db)) -> PostgreSQLAdapter:
+    return PostgreSQLAdapter(db)
+
+
+@pytest.fixture
+def client_with_sql():
+    """
+    TestClient with the SQL adapter on the test engine (SQLite in-memory).
+    Runs real statements (query counts); tables are created per test.
+    """
+    Base.metadata.create_all(engine)
+    app.dependency_overrides[get_database_adapter] = _sql_database_adapter
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
+    Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def assert_num_queries():
+    """
+    Assert how many statements a block (one request) runs:
+
+        with assert_num_queries(4):
+            client_with_sql.delete(f"/api/v1/items/{item_id}", headers=...)
+    """
+    @contextmanager
+    def _assert_num_queries(expected: int):
+        with capture_queries(engine) as statements:
+            yield statements
+        assert len(statements) == expected, (
+            f"{len(statements)} queries, expected {expected}:\n" + "\n".join(statements)
+        )
+
+    return _assert_num_queries
+
+
 # ============================================
 # Auth Fixtures
 # ============================================
@@ -0,0 +1,56 @@
+"""
+setup_logging tests (level filtering before the processor chain).
+"""
+import logging
+
+import pytest
+import structlog
+from structlog.testing import capture_logs
+
+from infrastructure.logging import setup_logging
+
+
+@pytest.fixture
+def restore_logging():
+    """setup_logging changes global state; put the app's config back."""
+    saved = structlog.get_config()
+    root_level = logging.getLogger().level
+    yield
+    structlog.configure(**saved)
+    logging.getLogger().setLevel(root_level)
+
+
+class TestLevelFiltering:
+
+    def test_disabled_levels_skip_processors(self, restore_logging):
+        setup_logging(environment="production", log_level="INFO", enable_async=False)
+        with capture_logs() as logs:
+            logger = structlog.get_logger("test")
+            logger.debug("dropped")
+            logger.info("kept")
+        assert [entry["event"] for entry in logs] == ["kept"]
+
+    def test_debug_level_keeps_debug(self, restore_logging):
+        setup_logging(environment="production", log_level="DEBUG", enable_async=False)
+        with capture_logs() as logs:
+            structlog.get_logger("test").debug("kept")
+        assert [entry["event"] for entry in logs] == ["kept"]
+
+    def test_stdlib_level_matches(self, restore_logging):
+        setup_logging(environment="production", log_level="INFO", enable_async=False)
+        assert logging.getLogger().level == logging.INFO
+
+
+class TestSamplingConfig:
+
+    def test_sampler_runs_in_chain(self, restore_logging):
+        sampler = setup_logging(
+            environment="production",
+            log_level="INFO",
+            enable_async=False,
+            sample_rates={"request_started": 2},
+        )
+        logger = structlog.get_logger("test")
+        for _ in range(4):
+            logger.info("request_started")
+        assert sampler.stats() == {"request_started": 2}
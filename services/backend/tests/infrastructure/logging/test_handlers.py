@@ -0,0 +1,273 @@
+"""
+Async logging handler tests (lifecycle around fork, overflow policies,
+batched listener).
+"""
+import io
+import logging
+import threading
+from logging.handlers import QueueHandler
+from queue import Queue
+
+import pytest
+
+from infrastructure.logging import handlers
+
+
+@pytest.fixture
+def async_logging(monkeypatch, tmp_path):
+    """Fresh async handlers; restores the root logger afterwards."""
+    root = logging.getLogger()
+    saved = list(root.handlers)
+    monkeypatch.setattr(handlers, "_queue_listener", None)
+    monkeypatch.setattr(handlers, "_queue_handler", None)
+    monkeypatch.setattr(handlers, "_settings", {})
+    handlers.setup_async_handlers(environment="test", log_level="INFO", enable_file_logging=False)
+    yield root
+    handlers.stop_async_handlers()
+    root.handlers[:] = saved
+
+
+class TestAsyncHandlerLifecycle:
+
+    def test_stop_attaches_output_handlers_directly(self, async_logging):
+        handlers.stop_async_handlers()
+        assert handlers.get_queue_listener() is None
+        assert not any(isinstance(h, QueueHandler) for h in async_logging.handlers)
+        assert any(isinstance(h, logging.StreamHandler) for h in async_logging.handlers)
+
+    def test_restart_starts_new_listener(self, async_logging):
+        first = handlers.get_queue_listener()
+        handlers.restart_async_handlers()
+        second = handlers.get_queue_listener()
+        assert second is not None and second is not first
+        assert [type(h) for h in async_logging.handlers] == [handlers.OverflowQueueHandler]
+
+    def test_restart_without_setup_is_noop(self, monkeypatch):
+        monkeypatch.setattr(handlers, "_settings", {})
+        monkeypatch.setattr(handlers, "_queue_listener", None)
+        handlers.restart_async_handlers()
+        assert handlers.get_queue_listener() is None
+
+
+def _record(level=logging.INFO, msg="event"):
+    return logging.LogRecord("test", level, __file__, 1, msg, None, None)
+
+
+def _fill(handler, count, level=logging.INFO):
+    for n in range(count):
+        handler.handle(_record(level, f"event-{n}"))
+
+
+class TestOverflowPolicies:
+
+    def test_drop_newest_counts(self):
+        handler = handlers.OverflowQueueHandler(Queue(maxsize=2), policy="drop_newest")
+        _fill(handler, 5)
+        assert handler.queue.qsize() == 2
+        assert handler.dropped == {"INFO": 3}
+
+    def test_drop_debug_first_keeps_room_for_warnings(self):
+        handler = handlers.OverflowQueueHandler(Queue(maxsize=10), policy="drop_debug_first")
+        _fill(handler, 10)
+        assert handler.queue.qsize() == 8
+        _fill(handler, 3, logging.ERROR)
+        assert handler.queue.qsize() == 10
+        assert handler.dropped == {"INFO": 2, "ERROR": 1}
+
+    def test_spill_writes_to_spill_handler(self):
+        stream = io.StringIO()
+        handler = handlers.OverflowQueueHandler(
+            Queue(maxsize=1), policy="spill", spill_handler=logging.StreamHandler(stream)
+        )
+        _fill(handler, 3)
+        assert handler.spilled == 2
+        assert stream.getvalue().splitlines() == ["event-1", "event-2"]
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            handlers.OverflowQueueHandler(Queue(), policy="ignore")
+
+    def test_stats(self, async_logging):
+        stats = handlers.get_queue_stats()
+        assert stats["policy"] == "drop_debug_first"
+        assert stats["capacity"] == 1000
+        assert stats["dropped"] == {}
+
+
+class TestBatchingQueueListener:
+
+    def test_flushes_once_per_batch(self):
+        stream = io.StringIO()
+        output = handlers.BufferedStreamHandler(stream)
+        flushes = []
+        stream.flush = lambda: flushes.append(stream.getvalue().count("\n"))
+
+        log_queue = Queue()
+        for n in range(5):
+            log_queue.put(_record(msg=f"event-{n}"))
+        listener = handlers.BatchingQueueListener(log_queue, output, batch_size=100)
+        listener.start()
+        listener.stop()
+
+        assert stream.getvalue().splitlines() == [f"event-{n}" for n in range(5)]
+        assert flushes[0] == 5
+
+    def test_respects_batch_size(self):
+        stream = io.StringIO()
+        output = handlers.BufferedStreamHandler(stream)
+        flushes = []
+        stream.flush = lambda: flushes.append(stream.getvalue().count("\n"))
+
+        log_queue = Queue()
+        for n in range(5):
+            log_queue.put(_record(msg=f"event-{n}"))
+        listener = handlers.BatchingQueueListener(log_queue, output, batch_size=2)
+        listener.start()
+        listener.stop()
+
+        assert flushes[:3] == [2, 4, 5]
+
+    def test_sentinel_waits_for_space(self):
+        stream = io.StringIO()
+        log_queue = Queue(maxsize=2)
+        log_queue.put(_record())
+        log_queue.put(_record())
+        listener = handlers.BatchingQueueListener(log_queue, handlers.BufferedStreamHandler(stream))
+
+        stopping = threading.Thread(target=listener.enqueue_sentinel)
+        stopping.start()
+        listener.start()
+        stopping.join(timeout=5)
+        listener._thread.join(timeout=5)
+
+        assert not listener._thread.is_alive()
+        assert len(stream.getvalue().splitlines()) == 2
+
+
+    def test_survives_failing_flush(self):
+        class FlakyHandler(logging.Handler):
+            def __init__(self):
+                super().__init__()
+                self.messages = []
+                self.failures = 2
+
+            def emit(self, record):
+                self.messages.append(record.msg)
+
+            def flush(self):
+                if self.failures:
+                    self.failures -= 1
+                    raise ValueError("I/O operation on closed file")
+
+            def handleError(self, record):
+                raise ValueError("stderr closed too")
+
+        output = FlakyHandler()
+        log_queue = Queue()
+        listener = handlers.BatchingQueueListener(log_queue, output, flush_interval=0.01)
+        listener.start()
+        for _ in range(100):
+            if not output.failures:
+                break
+            threading.Event().wait(0.01)
+
+        log_queue.put(_record(msg="after-failure"))
+        listener.stop()
+        assert output.failures == 0
+        assert output.messages == ["after-failure"]
+
+    def test_stop_with_dead_thread_and_full_queue(self):
+        log_queue = Queue(maxsize=1)
+        log_queue.put(_record())
+        listener = handlers.BatchingQueueListener(log_queue, handlers.BufferedStreamHandler(io.StringIO()))
+        listener._thread = threading.Thread(target=lambda: None)
+        listener._thread.start()
+        listener._thread.join()
+
+        stopping = threading.Thread(target=listener.stop)
+        stopping.start()
+        stopping.join(timeout=2)
+        assert not stopping.is_alive()
+
+
+class TestBatchingStreamHandler:
+
+    def _handler(self, **kwargs):
+        stream = io.BytesIO()
+        writes = []
+        write = stream.write
+        stream.write = lambda data: writes.append(data) or write(data)
+        return handlers.BatchingStreamHandler(stream, **kwargs), stream, writes
+
+    def test_coalesces_until_size(self):
+        handler, stream, writes = self._handler(buffer_bytes=64, flush_interval=60)
+        for n in range(10):
+            handler.handle(_record(msg=b'{"event":"e"}'))
+        assert len(writes) == 2
+        handler.flush()
+        assert stream.getvalue() == b'{"event":"e"}\n' * 10
+
+    def test_errors_written_immediately(self):
+        handler, stream, writes = self._handler(flush_interval=60)
+        handler.handle(_record(msg=b"info"))
+        handler.handle(_record(logging.ERROR, b"error"))
+        assert writes == [b"info\nerror\n"]
+
+    def test_str_records_encoded(self):
+        handler, stream, writes = self._handler(flush_interval=60)
+        handler.handle(_record(msg="plain stdlib record"))
+        handler.flush()
+        assert stream.getvalue() == b"plain stdlib record\n"
+
+    def test_text_stream(self):
+        stream = io.StringIO()
+        handler = handlers.BatchingStreamHandler(stream)
+        handler.handle(_record(msg=b'{"event":"e"}'))
+        handler.flush()
+        assert stream.getvalue() == '{"event":"e"}\n'
+
+    def test_write_error_goes_to_handle_error(self):
+        class BrokenStream(io.BytesIO):
+            def write(self, data):
+                raise ValueError("I/O operation on closed file")
+
+        handler = handlers.BatchingStreamHandler(BrokenStream(), flush_interval=60)
+        errors = []
+        handler.handleError = errors.append
+        handler.handle(_record(msg=b"event"))
+        handler.flush()
+        handler.handle(_record(logging.ERROR, b"error"))
+        assert len(errors) == 2
+
+    def test_buffered_stream_flush_error_goes_to_handle_error(self):
+        stream = io.StringIO()
+        stream.flush = lambda: (_ for _ in ()).throw(OSError("broken pipe"))
+        handler = handlers.BufferedStreamHandler(stream)
+        errors = []
+        handler.handleError = errors.append
+        handler.flush()
+        assert errors[0].levelno == logging.ERROR
+
+    def test_listener_flushes_when_idle(self):
+        handler, stream, writes = self._handler(flush_interval=60)
+        log_queue = Queue()
+        listener = handlers.BatchingQueueListener(log_queue, handler, flush_interval=0.01)
+        listener.start()
+        log_queue.put(_record(msg=b"event"))
+        for _ in range(100):
+            if writes:
+                break
+            threading.Event().wait(0.01)
+        listener.stop()
+        assert writes[0] == b"event\n"
+
+
+class TestRenderedRecords:
+
+    def test_queue_handler_keeps_bytes(self):
+        handler = handlers.OverflowQueueHandler(Queue())
+        handler.handle(_record(msg=b'{"event":"e"}'))
+        assert handler.queue.get_nowait().msg == b'{"event":"e"}'
+
+    def test_formatter_decodes_bytes(self):
+        assert handlers.RenderedFormatter().format(_record(msg=b'{"event":"\xc3\xa4"}')) == '{"event":"ä"}'
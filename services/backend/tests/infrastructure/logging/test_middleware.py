@@ -0,0 +1,55 @@
+"""
+LoggingMiddleware tests (pure ASGI implementation).
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from infrastructure.logging.middleware import LoggingMiddleware
+
+
+@pytest.fixture
+def streaming_client():
+    app = FastAPI()
+    app.add_middleware(LoggingMiddleware)
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk-{i}\n"
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    with TestClient(app, raise_server_exceptions=False) as c:
+        yield c
+
+
+class TestLoggingMiddleware:
+
+    def test_generates_request_id(self, client):
+        response = client.get("/health")
+        assert response.headers["X-Request-ID"]
+
+    def test_propagates_request_id(self, client):
+        response = client.get("/health", headers={"X-Request-ID": "req-abc-123"})
+        assert response.headers["X-Request-ID"] == "req-abc-123"
+
+    def test_request_id_in_problem_detail(self, client):
+        response = client.get("/api/v1/items", headers={"X-Request-ID": "req-err-1"})
+        assert response.status_code == 401
+        assert response.json()["request_id"] == "req-err-1"
+
+    def test_streaming_response_passthrough(self, streaming_client):
+        response = streaming_client.get("/stream")
+        assert response.status_code == 200
+        assert response.text == "chunk-0\nchunk-1\nchunk-2\n"
+        assert "X-Request-ID" in response.headers
+
+    def test_exception_propagates(self, streaming_client):
+        response = streaming_client.get("/boom")
+        assert response.status_code == 500
@@ -0,0 +1,95 @@
+"""
+Log sampling tests (per-event rates, always-keep rules, warning suppression).
+"""
+import pytest
+import structlog
+
+from infrastructure.logging.sampling import LogSampler, parse_sample_rates
+
+
+def _run(sampler, method_name, **event_dict):
+    """Returns the processed event, None if dropped."""
+    try:
+        return sampler(None, method_name, event_dict)
+    except structlog.DropEvent:
+        return None
+
+
+class TestParseSampleRates:
+
+    def test_parses_entries(self):
+        assert parse_sample_rates(" request_started=10, auth_success=5 ,") == {
+            "request_started": 10,
+            "auth_success": 5,
+        }
+
+    def test_empty(self):
+        assert parse_sample_rates("") == {}
+
+    @pytest.mark.parametrize("spec", ["request_started", "request_started=0", "=5", "a=x"])
+    def test_invalid(self, spec):
+        with pytest.raises(ValueError):
+            parse_sample_rates(spec)
+
+
+class TestSampling:
+
+    def test_keeps_one_in_n(self):
+        sampler = LogSampler(rates={"request_started": 10})
+        kept = [_run(sampler, "info", event="request_started") for _ in range(100)]
+        kept = [entry for entry in kept if entry]
+        assert len(kept) == 10
+        assert all(entry["sample_rate"] == 10 for entry in kept)
+        assert sampler.stats() == {"request_started": 90}
+
+    def test_other_events_untouched(self):
+        sampler = LogSampler(rates={"request_started": 10})
+        entry = _run(sampler, "info", event="item_created")
+        assert entry == {"event": "item_created"}
+
+    def test_same_decision_per_request(self):
+        sampler = LogSampler(rates={"request_started": 4, "request_completed": 4})
+        for n in range(50):
+            started = _run(sampler, "info", event="request_started", request_id=f"req-{n}")
+            completed = _run(sampler, "info", event="request_completed", request_id=f"req-{n}", duration_ms=1.0)
+            assert (started is None) == (completed is None)
+
+    def test_keeps_errors_slow_and_5xx(self):
+        sampler = LogSampler(rates={"request_completed": 1000, "request_failed": 1000}, slow_ms=500)
+        _run(sampler, "info", event="request_completed")  # first one is always kept
+        assert _run(sampler, "info", event="request_completed", duration_ms=12.0) is None
+        assert _run(sampler, "info", event="request_completed", duration_ms=750.0)
+        assert _run(sampler, "info", event="request_completed", status_code=503)
+        assert _run(sampler, "error", event="request_failed")
+
+
+class TestWarningSuppression:
+
+    def test_burst_then_summary(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr("infrastructure.logging.sampling.time.monotonic", lambda: now[0])
+        sampler = LogSampler(warning_burst=3, warning_per_second=1.0)
+
+        results = [_run(sampler, "warning", event="cache_miss", logger="repo") for _ in range(10)]
+        assert sum(entry is not None for entry in results) == 3
+
+        now[0] += 1.0
+        entry = _run(sampler, "warning", event="cache_miss", logger="repo")
+        assert entry["suppressed"] == 7
+
+    def test_keys_are_independent(self):
+        sampler = LogSampler(warning_burst=1, warning_per_second=0.001)
+        assert _run(sampler, "warning", event="a", logger="repo")
+        assert _run(sampler, "warning", event="a", logger="repo") is None
+        assert _run(sampler, "warning", event="b", logger="repo")
+        assert _run(sampler, "warning", event="a", logger="other")
+
+    def test_disabled(self):
+        sampler = LogSampler(warning_burst=1, warning_per_second=0)
+        assert all(_run(sampler, "warning", event="a") for _ in range(5))
+
+    def test_max_keys(self):
+        sampler = LogSampler(warning_burst=1, warning_per_second=0.001, max_keys=2)
+        for event in ("a", "b", "c"):
+            _run(sampler, "warning", event=event)
+        assert len(sampler._buckets) == 2
@@ -0,0 +1,69 @@
+"""
+Event loop lag monitor tests (lag metric, blocked-loop stack capture).
+"""
+import asyncio
+import time
+
+from prometheus_client import REGISTRY
+from structlog.testing import capture_logs
+
+from infrastructure.loop_monitor import LoopLagMonitor
+
+
+def _sample(name):
+    return REGISTRY.get_sample_value(name) or 0.0
+
+
+async def blocking_handler():
+    time.sleep(0.2)  # sync call in async code
+
+
+async def _run(monitor, body):
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        await body()
+        await asyncio.sleep(0.05)
+    finally:
+        monitor.stop()
+
+
+def test_blocked_loop_logs_stack():
+    monitor = LoopLagMonitor(interval=0.01, threshold=0.05)
+    blocked_before = _sample("event_loop_blocked_total")
+
+    async def body():
+        await asyncio.get_running_loop().create_task(blocking_handler(), name="GET /slow")
+
+    with capture_logs() as logs:
+        asyncio.run(_run(monitor, body))
+
+    blocked = [entry for entry in logs if entry["event"] == "event_loop_blocked"]
+    assert len(blocked) == 1
+    entry = blocked[0]
+    assert entry["log_level"] == "warning"
+    assert entry["blocked_ms"] >= 50
+    assert entry["task"] == "GET /slow"
+    assert entry["coroutine"] == "blocking_handler"
+    # Innermost frame: the blocking call
+    assert "in blocking_handler: time.sleep(0.2)" in entry["stack"][-1]
+
+    assert monitor.stats()["stalls"] == 1
+    assert monitor.stats()["max_lag_ms"] >= 150
+    assert _sample("event_loop_blocked_total") == blocked_before + 1
+
+
+def test_idle_loop_only_measures():
+    monitor = LoopLagMonitor(interval=0.01, threshold=0.05)
+    count_before = _sample("event_loop_lag_seconds_count")
+
+    async def body():
+        await asyncio.sleep(0.05)
+
+    with capture_logs() as logs:
+        asyncio.run(_run(monitor, body))
+
+    assert not any(entry["event"] == "event_loop_blocked" for entry in logs)
+    assert monitor.stats()["stalls"] == 0
+    assert _sample("event_loop_lag_seconds_count") > count_before
+
@@ -0,0 +1,91 @@
+"""
+Metrics infrastructure tests (component stats export, multi-process
+aggregation).
+"""
+import os
+import subprocess
+import sys
+
+import structlog
+from prometheus_client import REGISTRY
+
+from infrastructure.logging.sampling import LogSampler
+from infrastructure.metrics import RuntimeMetrics, observe_ai_request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeLimiter:
+
+    def __init__(self):
+        self.shed = {}
+
+    def stats(self):
+        return {"limit": 20, "in_flight": 3, "queued": {"read": 1, "write": 0}, "shed": dict(self.shed)}
+
+
+def _sample(name, labels=None):
+    return REGISTRY.get_sample_value(name, labels or {}) or 0.0
+
+
+class TestRuntimeMetrics:
+
+    def test_limiter_gauges_and_shed_deltas(self):
+        limiter = FakeLimiter()
+        limiter.shed = {"read:timeout": 5}
+        metrics = RuntimeMetrics(limiter=limiter)
+        metrics.start()
+        try:
+            before = _sample("requests_shed_total", {"priority": "read", "reason": "timeout"})
+            limiter.shed = {"read:timeout": 8}
+            metrics.refresh()
+            metrics.refresh()
+        finally:
+            metrics.stop()
+
+        # Baseline (5) taken at start: only the growth is exported, once
+        assert _sample("requests_shed_total", {"priority": "read", "reason": "timeout"}) == before + 3
+        assert _sample("concurrency_in_flight") == 3
+        assert _sample("concurrency_queued", {"priority": "read"}) == 1
+
+    def test_sampler_counts(self):
+        sampler = LogSampler(rates={"metrics_test_event": 2})
+        metrics = RuntimeMetrics(log_sampler=sampler)
+        before = _sample("log_events_sampled_out_total", {"event": "metrics_test_event"})
+        for _ in range(4):
+            try:
+                sampler(None, "info", {"event": "metrics_test_event"})
+            except structlog.DropEvent:
+                pass
+        metrics.refresh()
+        assert _sample("log_events_sampled_out_total", {"event": "metrics_test_event"}) == before + 2
+
+    def test_ai_request(self):
+        labels = {"provider": "test", "model": "m", "kind": "completion"}
+        before = _sample("ai_tokens_total", labels)
+        observe_ai_request("test", "m", 0.4, "ok", prompt_tokens=10, completion_tokens=7)
+        assert _sample("ai_tokens_total", labels) == before + 7
+        assert _sample("ai_request_duration_seconds_count", {"provider": "test", "model": "m", "outcome": "ok"}) >= 1
+
+
+WORKER = """
+from infrastructure.metrics.registry import HTTP_REQUESTS
+HTTP_REQUESTS.labels("GET", "/api/v1/items", "2xx").inc({count})
+"""
+
+SCRAPE = """
+from infrastructure.metrics import render_metrics
+print(render_metrics()[0].decode())
+"""
+
+
+class TestMultiProcess:
+
+    def test_values_aggregate_across_processes(self, tmp_path):
+        env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path), "ENV": "test", "DATABASE_URL": "sqlite://"}
+        for count in (2, 3):
+            subprocess.run([sys.executable, "-c", WORKER.format(count=count)], cwd=BACKEND_DIR, env=env, check=True)
+        output = subprocess.run(
+            [sys.executable, "-c", SCRAPE], cwd=BACKEND_DIR, env=env, check=True, capture_output=True, text=True
+        ).stdout
+        assert 'http_requests_total{method="GET",route="/api/v1/items",status="2xx"} 5.0' in output
@@ -0,0 +1,108 @@
+"""
+Profiling infrastructure tests (stack sampler, speedscope output, storage,
+continuous mode).
+"""
+import os
+import threading
+import time
+
+import orjson
+
+from infrastructure.profiling import ContinuousProfiler, StackSampler, write_profile
+
+
+def busy_work(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def run_in_thread(target, *args) -> threading.Thread:
+    thread = threading.Thread(target=target, args=args, name="busy-worker", daemon=True)
+    thread.start()
+    return thread
+
+
+class TestStackSampler:
+
+    def test_samples_busy_thread(self):
+        stop = threading.Event()
+        thread = run_in_thread(busy_work, stop)
+        sampler = StackSampler(interval=0.001).start()
+        time.sleep(0.1)
+        sampler.stop()
+        stop.set()
+        thread.join()
+
+        document = sampler.to_speedscope("test")
+        assert document["$schema"] == "https://www.speedscope.app/file-format-schema.json"
+        names = [frame["name"] for frame in document["shared"]["frames"]]
+        assert "busy_work" in names
+
+        profile = next(p for p in document["profiles"] if p["name"] == "test [busy-worker]")
+        assert profile["type"] == "sampled" and profile["unit"] == "seconds"
+        assert len(profile["samples"]) == len(profile["weights"])
+        # Root first: the thread bootstrap, busy_work further down the stack
+        frames = document["shared"]["frames"]
+        assert frames[profile["samples"][0][0]]["name"].endswith("_bootstrap")
+
+    def test_idle_threads_skipped(self):
+        event = threading.Event()
+        thread = run_in_thread(event.wait)
+        sampler = StackSampler(interval=0.001)
+        sampler.sample()
+        event.set()
+        thread.join()
+        profiles = sampler.to_speedscope("idle")["profiles"]
+        assert not any("busy-worker" in p["name"] for p in profiles)
+
+    def test_max_seconds(self):
+        sampler = StackSampler(interval=0.001, max_seconds=0.02).start()
+        time.sleep(0.1)
+        samples = sampler.samples
+        sampler.stop()
+        assert 0 < samples < 40
+
+    def test_drain_resets(self):
+        sampler = StackSampler()
+        stop = threading.Event()
+        thread = run_in_thread(busy_work, stop)
+        sampler.sample()
+        stop.set()
+        thread.join()
+        stacks, names = sampler.drain()
+        assert stacks and sampler.samples == 0
+        assert sampler.drain()[0] == {}
+
+
+class TestStorage:
+
+    def test_write_and_prune(self, tmp_path):
+        for i in range(4):
+            path = write_profile(str(tmp_path / "profiles"), f"p{i}", {"name": f"p{i}"}, keep=2)
+            os.utime(path, (i, i))
+        remaining = sorted(p.name for p in (tmp_path / "profiles").iterdir())
+        assert remaining == ["p2.speedscope.json", "p3.speedscope.json"]
+        assert orjson.loads((tmp_path / "profiles" / "p3.speedscope.json").read_bytes()) == {"name": "p3"}
+
+
+class TestContinuousProfiler:
+
+    def test_periodic_files(self, tmp_path):
+        stop = threading.Event()
+        thread = run_in_thread(busy_work, stop)
+        profiler = ContinuousProfiler(str(tmp_path), interval=0.001, period=0.05)
+        profiler.start()
+        time.sleep(0.2)
+        profiler.stop()
+        stop.set()
+        thread.join()
+
+        files = list(tmp_path.glob(f"continuous-{os.getpid()}-*.speedscope.json"))
+        assert files
+        document = orjson.loads(files[0].read_bytes())
+        assert any(f["name"] == "busy_work" for f in document["shared"]["frames"])
+
+    def test_nothing_sampled_writes_nothing(self, tmp_path):
+        profiler = ContinuousProfiler(str(tmp_path))
+        profiler.flush()
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,208 @@
+"""
+Per-request query stats tests (counting, statement shapes, N+1 warning,
+slow_query / slow_request).
+"""
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, text
+from structlog.testing import capture_logs
+
+from infrastructure.logging.middleware import LoggingMiddleware
+from infrastructure import query_stats
+from infrastructure.query_stats import (
+    current_query_stats,
+    instrument_engine,
+    masked_parameters,
+    reset_query_stats,
+    start_query_stats,
+    statement_shape,
+)
+
+
+def _engine():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    instrument_engine(engine)  # idempotent
+    return engine
+
+
+class TestQueryStats:
+
+    def test_counts_inside_request_only(self):
+        engine = _engine()
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            stats, token = start_query_stats()
+            try:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+            finally:
+                reset_query_stats(token)
+            conn.execute(text("SELECT 1"))
+        assert stats.count == 2
+        assert stats.time_ms > 0
+        assert current_query_stats() is None
+
+    def test_repeated_shapes(self):
+        engine = _engine()
+        stats, token = start_query_stats()
+        try:
+            with engine.connect() as conn:
+                for n in range(4):
+                    conn.execute(text("SELECT :n"), {"n": n})
+                conn.execute(text("SELECT 1"))
+        finally:
+            reset_query_stats(token)
+        assert stats.repeated(3) == [("SELECT ?", 4)]
+        assert stats.repeated(4) == []
+
+    def test_shape_collapses_in_lists(self):
+        assert statement_shape("SELECT * FROM items WHERE id IN (?, ?, ?)") == statement_shape(
+            "SELECT * FROM items\n WHERE id IN (?)"
+        )
+        assert statement_shape("WHERE id IN (%(id_1_1)s, %(id_1_2)s)") == "WHERE id IN (?)"
+
+
+@pytest.fixture
+def slow_query_ms():
+    """Set the slow query threshold for one test (module-wide setting)."""
+    previous = query_stats._slow_query_ms
+
+    def set_threshold(ms):
+        query_stats._slow_query_ms = ms
+
+    yield set_threshold
+    query_stats._slow_query_ms = previous
+
+
+def _sleepy_engine():
+    """SQLite engine with sleep_ms(n): statements of a known duration."""
+    engine = _engine()
+
+    def sleep_ms(ms):
+        time.sleep(ms / 1000)
+        return ms
+
+    # In-memory SQLite: one connection per thread (endpoints run in the threadpool)
+    event.listen(engine, "connect", lambda dbapi_conn, record: dbapi_conn.create_function("sleep_ms", 1, sleep_ms))
+    return engine
+
+
+class TestSlowQuery:
+
+    def test_slow_query_logged_with_masked_parameters(self, slow_query_ms):
+        slow_query_ms(20)
+        engine = _sleepy_engine()
+        with capture_logs() as logs, engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(
+                text("SELECT sleep_ms(:ms), :password, :email, :label"),
+                {"ms": 30, "password": "hunter2", "email": "anna@example.com", "label": "x" * 300},
+            )
+        slow = [entry for entry in logs if entry["event"] == "slow_query"]
+        assert len(slow) == 1
+        assert slow[0]["log_level"] == "warning"
+        assert slow[0]["statement"] == "SELECT sleep_ms(?), ?, ?, ?"
+        assert slow[0]["duration_ms"] >= 30
+        assert slow[0]["threshold_ms"] == 20
+        # SQLite binds positionally
+        assert slow[0]["parameters"]["1"] == 30
+        assert slow[0]["parameters"]["3"] == "a***@example.com"
+        assert slow[0]["parameters"]["4"].endswith("...")
+
+    def test_off(self, slow_query_ms):
+        slow_query_ms(0)
+        engine = _sleepy_engine()
+        with capture_logs() as logs, engine.connect() as conn:
+            conn.execute(text("SELECT sleep_ms(5)"))
+        assert not any(entry["event"] == "slow_query" for entry in logs)
+
+    def test_masked_parameters(self):
+        masked = masked_parameters({"password": "hunter2", "owner_id": "u1", "payload": {"a": 1}})
+        assert masked == {"password": "***REDACTED***", "owner_id": "u1", "payload": "{'a': 1}"}
+        # executemany: first row only
+        assert masked_parameters([("a", 1), ("b", 2)]) == {"1": "a", "2": 1}
+        assert masked_parameters(()) is None
+
+    def test_slowest_statement(self):
+        engine = _sleepy_engine()
+        stats, token = start_query_stats()
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT sleep_ms(:ms)"), {"ms": 1})
+                conn.execute(text("SELECT sleep_ms(:ms)"), {"ms": 15})
+                conn.execute(text("SELECT 1"))
+        finally:
+            reset_query_stats(token)
+        ms, statement, parameters = stats.slowest
+        assert ms >= 15
+        assert statement == "SELECT sleep_ms(?)"
+        assert tuple(parameters) == (15,)
+
+
+def _app(threshold, slow_request_ms=0):
+    engine = _sleepy_engine()
+    app = FastAPI()
+    app.add_middleware(LoggingMiddleware, repeated_query_threshold=threshold, slow_request_ms=slow_request_ms)
+
+    @app.get("/loop")
+    def loop():
+        # Sync endpoint: runs in the threadpool with a copied context
+        with engine.connect() as conn:
+            for n in range(5):
+                conn.execute(text("SELECT :n"), {"n": n})
+        return {}
+
+    return app
+
+
+class TestRequestLogging:
+
+    def test_request_completed_has_db_fields(self):
+        with capture_logs() as logs:
+            TestClient(_app(threshold=10)).get("/loop")
+        completed = next(entry for entry in logs if entry["event"] == "request_completed")
+        assert completed["db_queries"] == 5
+        assert completed["db_time_ms"] >= 0
+        assert not any(entry["event"] == "n_plus_one_query" for entry in logs)
+
+    def test_n_plus_one_warning(self):
+        with capture_logs() as logs:
+            TestClient(_app(threshold=3)).get("/loop")
+        warning = next(entry for entry in logs if entry["event"] == "n_plus_one_query")
+        assert warning["log_level"] == "warning"
+        assert warning["statement"] == "SELECT ?"
+        assert warning["count"] == 5
+
+    def test_slow_request(self):
+        app = _app(threshold=10, slow_request_ms=20)
+
+        @app.get("/slow/{kind}")
+        def slow(kind: str):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT sleep_ms(:ms), :token"), {"ms": 25, "token": "secret-value"})
+            current_query_stats().record_ai_call(0.05)
+            return {}
+
+        engine = _sleepy_engine()
+        with capture_logs() as logs:
+            client = TestClient(app)
+            client.get("/loop")
+            client.get("/slow/x?verbose=1")
+
+        slow = [entry for entry in logs if entry["event"] == "slow_request"]
+        assert len(slow) == 1
+        entry = slow[0]
+        assert entry["route"] == "/slow/{kind}"
+        assert entry["query_params"] == {"verbose": "1"}
+        assert entry["status_code"] == 200
+        assert entry["duration_ms"] >= 25
+        assert entry["db_queries"] == 1
+        assert entry["slowest_query"] == "SELECT sleep_ms(?), ?"
+        assert entry["slowest_query_ms"] >= 25
+        assert entry["slowest_query_params"] == {"1": 25, "2": "secret-value"}
+        assert entry["ai_calls"] == 1
+        assert entry["ai_time_ms"] == 50
@@ -0,0 +1,220 @@
+"""
+Tracing infrastructure tests (traceparent, sampling, spans, exporters).
+"""
+import asyncio
+import threading
+
+import orjson
+import pytest
+from sqlalchemy import create_engine, text
+
+from infrastructure.tracing import (
+    CLIENT,
+    SERVER,
+    FileSpanExporter,
+    InMemorySpanExporter,
+    Tracer,
+    configure_tracing,
+    current_span,
+    inject_traceparent,
+    parse_traceparent,
+    start_span,
+    trace_engine,
+    traced,
+)
+from infrastructure.tracing.tracer import activate, deactivate
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    configure_tracing(Tracer(exporter))
+    yield exporter
+    configure_tracing(None)
+
+
+@pytest.fixture
+def root(exporter):
+    """A recording SERVER span made current for the test."""
+    from infrastructure.tracing import get_tracer
+    span = get_tracer().start_root("GET /test", kind=SERVER)
+    token = activate(span)
+    yield span
+    deactivate(token)
+
+
+class TestTraceparent:
+
+    def test_parse_valid(self):
+        assert parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-01") == (TRACE_ID, PARENT_ID, True)
+        assert parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-00") == (TRACE_ID, PARENT_ID, False)
+
+    @pytest.mark.parametrize("header", [
+        "garbage",
+        f"ff-{TRACE_ID}-{PARENT_ID}-01",
+        f"00-{'0' * 32}-{PARENT_ID}-01",
+        f"00-{TRACE_ID}-{'0' * 16}-01",
+        f"00-{TRACE_ID[:-1]}-{PARENT_ID}-01",
+    ])
+    def test_parse_invalid(self, header):
+        assert parse_traceparent(header) is None
+
+    def test_continues_caller_trace(self):
+        tracer = Tracer(InMemorySpanExporter(), sample_ratio=0.0)
+        span = tracer.start_root("GET", traceparent=f"00-{TRACE_ID}-{PARENT_ID}-01")
+        # Caller's sampling decision wins over the local ratio
+        assert span.recording
+        assert span.trace_id == TRACE_ID
+        assert span.parent_span_id == PARENT_ID
+        assert span.traceparent == f"00-{TRACE_ID}-{span.span_id}-01"
+
+    def test_invalid_header_starts_new_trace(self):
+        span = Tracer(InMemorySpanExporter()).start_root("GET", traceparent="garbage")
+        assert span.trace_id != TRACE_ID
+        assert span.parent_span_id is None
+
+    def test_inject(self, root):
+        assert inject_traceparent({})["traceparent"] == root.traceparent
+
+    def test_inject_without_span(self):
+        assert inject_traceparent({}) == {}
+
+
+class TestSampling:
+
+    def test_ratio(self):
+        tracer = Tracer(InMemorySpanExporter(), sample_ratio=0.25)
+        sampled = sum(tracer.start_root("GET").recording for _ in range(4000))
+        assert 800 < sampled < 1200
+
+    def test_zero_and_one(self):
+        assert not any(Tracer(InMemorySpanExporter(), 0.0).start_root("GET").recording for _ in range(100))
+        assert all(Tracer(InMemorySpanExporter(), 1.0).start_root("GET").recording for _ in range(100))
+
+    def test_unsampled_trace_exports_nothing(self, exporter):
+        span = Tracer(exporter, sample_ratio=0.0).start_root("GET")
+        token = activate(span)
+        try:
+            with start_span("child") as child:
+                assert child is None
+        finally:
+            deactivate(token)
+        span.end()
+        assert exporter.get_finished_spans() == []
+
+
+class TestSpans:
+
+    def test_no_trace_is_noop(self, exporter):
+        with start_span("orphan") as span:
+            assert span is None
+        assert exporter.get_finished_spans() == []
+
+    def test_child_and_current(self, exporter, root):
+        with start_span("outer") as outer:
+            assert current_span() is outer
+            with start_span("inner", CLIENT, {"k": 1}) as inner:
+                pass
+        assert current_span() is root
+
+        assert [s.name for s in exporter.get_finished_spans()] == ["inner", "outer"]
+        assert inner.parent_span_id == outer.span_id
+        assert outer.parent_span_id == root.span_id
+        assert inner.trace_id == root.trace_id
+        assert inner.kind == CLIENT and inner.attributes == {"k": 1}
+        assert inner.duration_ms >= 0
+
+    def test_exception_recorded(self, exporter, root):
+        with pytest.raises(ValueError):
+            with start_span("failing"):
+                raise ValueError("boom")
+        span = exporter.get_finished_spans()[0]
+        assert span.status_code == 2
+        assert span.events[0]["attributes"]["exception.type"] == "ValueError"
+
+    def test_traced_sync_and_async(self, exporter, root):
+        @traced("sync_op")
+        def sync_op(x):
+            return x * 2
+
+        @traced()
+        async def async_op(x):
+            return current_span().name
+
+        assert sync_op(2) == 4
+        assert asyncio.run(async_op(1)).endswith("async_op")
+        assert [s.name for s in exporter.get_finished_spans()][0] == "sync_op"
+        assert len(exporter.get_finished_spans()) == 2
+
+    def test_threadpool_context_is_child(self, exporter, root):
+        # Sync endpoints run in a copied context (contextvars.copy_context)
+        import contextvars
+        ctx = contextvars.copy_context()
+
+        def work():
+            with start_span("in_thread"):
+                pass
+
+        thread = threading.Thread(target=ctx.run, args=(work,))
+        thread.start()
+        thread.join()
+        assert exporter.get_finished_spans()[0].parent_span_id == root.span_id
+
+
+class TestSqlSpans:
+
+    def test_statement_spans(self, exporter, root):
+        engine = create_engine("sqlite://")
+        trace_engine(engine)
+        trace_engine(engine)  # idempotent
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with pytest.raises(Exception):
+                conn.execute(text("SELECT * FROM missing_table"))
+
+        spans = [s for s in exporter.get_finished_spans() if s.name == "db.query"]
+        assert len(spans) == 2
+        assert spans[0].attributes["db.system"] == "sqlite"
+        assert spans[0].attributes["db.statement"] == "SELECT 1"
+        assert spans[0].kind == CLIENT
+        assert spans[1].status_code == 2
+
+    def test_no_spans_outside_trace(self, exporter):
+        engine = create_engine("sqlite://")
+        trace_engine(engine)
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        assert exporter.get_finished_spans() == []
+
+
+class TestFileExporter:
+
+    def test_writes_otlp_json_lines(self, tmp_path, root):
+        path = tmp_path / "traces" / "spans.jsonl"
+        exporter = FileSpanExporter(str(path), flush_interval=60)
+        root._tracer = Tracer(exporter)
+        with start_span("op", attributes={"n": 3, "ok": True, "s": "x"}):
+            pass
+        root.end()
+        exporter.shutdown()
+
+        lines = path.read_bytes().splitlines()
+        assert len(lines) == 1
+        batch = orjson.loads(lines[0])["resourceSpans"][0]
+        assert batch["resource"]["attributes"][0] == {"key": "service.name", "value": {"stringValue": "chrisbuilds64-api"}}
+        spans = batch["scopeSpans"][0]["spans"]
+        assert [s["name"] for s in spans] == ["op", "GET /test"]
+        assert spans[0]["parentSpanId"] == root.span_id
+        assert spans[1]["kind"] == "SPAN_KIND_SERVER"
+        assert {"key": "n", "value": {"intValue": "3"}} in spans[0]["attributes"]
+        assert {"key": "ok", "value": {"boolValue": True}} in spans[0]["attributes"]
+
+    def test_bounded_buffer(self, tmp_path, root):
+        exporter = FileSpanExporter(str(tmp_path / "spans.jsonl"), flush_interval=60, max_queue=2)
+        for _ in range(5):
+            exporter.export(root)
+        assert exporter.dropped == 3
+        exporter.shutdown()
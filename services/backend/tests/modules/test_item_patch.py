@@ -0,0 +1,51 @@
+"""
+Merge patch unit tests (RFC 7386 semantics).
+"""
+from modules.item_manager.models import Item
+from modules.item_manager.patch import apply_merge_patch, apply_tag_changes, apply_item_patch
+
+
+class TestApplyMergePatch:
+
+    def test_rfc7386_example(self):
+        target = {"title": "Goodbye!", "author": {"givenName": "John", "familyName": "Doe"},
+                  "tags": ["example", "sample"], "content": "This will be unchanged"}
+        patch = {"title": "Hello!", "phoneNumber": "+01-123-456-7890",
+                 "author": {"familyName": None}, "tags": ["example"]}
+        assert apply_merge_patch(target, patch) == {
+            "title": "Hello!", "author": {"givenName": "John"}, "tags": ["example"],
+            "content": "This will be unchanged", "phoneNumber": "+01-123-456-7890",
+        }
+
+    def test_object_replaces_scalar(self):
+        assert apply_merge_patch({"a": "foo"}, {"a": {"b": "c"}}) == {"a": {"b": "c"}}
+
+    def test_target_not_modified(self):
+        target = {"a": {"b": 1}}
+        apply_merge_patch(target, {"a": {"b": 2}})
+        assert target == {"a": {"b": 1}}
+
+
+class TestApplyTagChanges:
+
+    def test_add_and_remove(self):
+        assert apply_tag_changes(["a", "b"], add=["c", "a"], remove=["b"]) == ["a", "c"]
+
+    def test_remove_wins(self):
+        assert apply_tag_changes(["a"], add=["b"], remove=["b"]) == ["a"]
+
+
+class TestApplyItemPatch:
+
+    def test_only_given_fields_change(self):
+        item = Item(owner_id="u1", label="Old", payload={"x": 1}, tags=["a"])
+        apply_item_patch(item, {"payload": {"y": 2}})
+        assert item.label == "Old"
+        assert item.payload == {"x": 1, "y": 2}
+        assert item.tags == ["a"]
+        assert item.updated_at is not None
+
+    def test_null_payload_resets(self):
+        item = Item(owner_id="u1", label="Old", payload={"x": 1})
+        apply_item_patch(item, {"payload": None})
+        assert item.payload == {}
@@ -3,6 +3,8 @@ ItemRepository unit tests.
 
 Tests repository logic using MockDatabaseAdapter.
 """
+from datetime import timedelta
+
 import pytest
 from modules.item_manager.repository import ItemRepository
 from modules.item_manager.models import Item
@@ -52,3 +54,29 @@ class TestItemRepository:
 
     def test_delete_nonexistent(self, repo):
         assert repo.delete("nonexistent", hard=False) is False
+
+    def test_soft_delete_bumps_changed_at(self, repo, saved_item):
+        repo.delete(saved_item.id, hard=False)
+        assert saved_item.changed_at() == saved_item.deleted_at
+
+    def test_changes_since_reports_tombstones(self, repo, saved_item):
+        watermark = repo.changes_since("user-1").watermark
+        repo.delete(saved_item.id, hard=False)
+        changes = repo.changes_since("user-1", watermark)
+        assert changes.items == []
+        assert [i.id for i in changes.deleted] == [saved_item.id]
+
+    def test_changes_since_resends_write_committed_late(self, repo, saved_item):
+        # Stamped before the first sync's position, committed after it
+        watermark = repo.changes_since("user-1").watermark
+        late = Item(owner_id="user-1", label="Late", created_at=saved_item.created_at - timedelta(seconds=1))
+        repo.save(late)
+
+        changes = repo.changes_since("user-1", watermark)
+        assert late.id in [i.id for i in changes.items]
+
+    def test_changes_since_without_settle_window(self, saved_item):
+        repo = ItemRepository(MockDatabaseAdapter(), sync_settle_seconds=0)
+        repo.save(saved_item)
+        watermark = repo.changes_since("user-1").watermark
+        assert repo.changes_since("user-1", watermark).items == []
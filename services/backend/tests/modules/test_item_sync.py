@@ -0,0 +1,22 @@
+"""
+Delta sync watermark tests.
+"""
+from datetime import datetime
+
+import pytest
+
+from modules.item_manager.exceptions import InvalidWatermarkError
+from modules.item_manager.sync import decode_watermark, encode_watermark
+
+
+def test_watermark_roundtrip():
+    position = (datetime(2026, 10, 19, 8, 30, 0, 123456), "item|with|pipes")
+    watermark = encode_watermark(position)
+    assert "=" not in watermark
+    assert decode_watermark(watermark) == position
+
+
+@pytest.mark.parametrize("watermark", ["not-a-watermark", "!!!", "Zm9vYmFy"])
+def test_invalid_watermark_raises(watermark):
+    with pytest.raises(InvalidWatermarkError):
+        decode_watermark(watermark)